@@ -0,0 +1,144 @@
+# benchmarks/bench_item_catalog.py
+"""
+Item lookup latency and memory per backend.
+
+Usage:
+    python -m benchmarks.bench_item_catalog --sql items.sql [--catalog items.catalog] [--sqlite-db items.sqlite3] [--mysql]
+
+Each backend runs in its own subprocess so RSS numbers aren't polluted by the others.
+Lookups use random 17-item sets (a full set of gear). "sqlite" and "mysql" are the two DatabaseService
+backends queried directly (no catalog in front); --mysql adds the server in config.py.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from services.database_service import ITEM_COLUMNS, MySQLDatabaseService
+from utils.items_sql import iter_items_sql
+
+LOOKUPS = 2000
+ITEMS_PER_LOOKUP = 17
+
+def _rss_kb() -> int:
+    """Current resident set size in KiB (falls back to peak RSS where /proc is missing)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * (os.sysconf("SC_PAGE_SIZE") // 1024)
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+async def _make_backend(name: str, args):
+    """Builds and loads one backend, returns an object with get_items_by_ids."""
+    if name == "catalog":
+        from services.item_catalog import ItemCatalog
+        rows = list(iter_items_sql(args.sql, ITEM_COLUMNS))
+
+        class _Rows: # Stand-in for the DB so load() reads the .sql rows
+            async def get_all_items(self):
+                return rows
+
+        backend = ItemCatalog(_Rows())
+        await backend.load()
+        del rows
+        return backend
+    if name == "mmap":
+        from services.item_catalog_file import MappedItemCatalog
+        backend = MappedItemCatalog(args.catalog)
+        await backend.load()
+        return backend
+    if name == "sqlite":
+        from services.sqlite_item_db import SQLiteDatabaseService
+        backend = SQLiteDatabaseService(args.sqlite_db)
+        await backend.connect()
+        return backend
+    if name == "mysql":
+        backend = MySQLDatabaseService(asyncio.get_running_loop())
+        backend.batch_window = 0 # One query per lookup, like the other backends
+        await backend.connect()
+        return backend
+    raise ValueError(name)
+
+async def _run_one(name: str, args) -> dict:
+    ids = [row[0] for row in iter_items_sql(args.sql, ITEM_COLUMNS)]
+    rng = random.Random(42)
+    lookups = [set(rng.sample(ids, ITEMS_PER_LOOKUP)) for _ in range(LOOKUPS)]
+    del ids
+
+    rss_before = _rss_kb()
+    start = time.perf_counter()
+    backend = await _make_backend(name, args)
+    load_ms = (time.perf_counter() - start) * 1000
+    rss_after = _rss_kb()
+
+    timings = []
+    for item_ids in lookups:
+        start = time.perf_counter()
+        await backend.get_items_by_ids(item_ids)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    timings.sort()
+
+    if hasattr(backend, "close"):
+        result = backend.close()
+        if asyncio.iscoroutine(result):
+            await result
+
+    return {
+        "backend": name,
+        "load_ms": round(load_ms, 1),
+        "rss_delta_kb": rss_after - rss_before,
+        "p50_us": round(statistics.median(timings), 1),
+        "p99_us": round(timings[int(len(timings) * 0.99)], 1),
+    }
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--sql", default="items.sql", help="items.sql (source of item IDs and of the in-heap catalog)")
+    arg_parser.add_argument("--catalog", help="Compiled catalog file; compiled into a temp file if omitted")
+    arg_parser.add_argument("--sqlite-db", help="SQLite item database; built into a temp file if omitted")
+    arg_parser.add_argument("--mysql", action="store_true", help="Also benchmark the MySQL backend (config.py)")
+    arg_parser.add_argument("--backend", help=argparse.SUPPRESS) # Internal: run one backend in this process
+    args = arg_parser.parse_args()
+
+    if args.backend:
+        print(json.dumps(asyncio.run(_run_one(args.backend, args))))
+        return 0
+
+    tmp_dir = None
+    if not args.catalog:
+        from services.item_catalog_file import write_catalog_file
+        tmp_dir = tempfile.TemporaryDirectory()
+        args.catalog = os.path.join(tmp_dir.name, "items.catalog")
+        write_catalog_file(iter_items_sql(args.sql, ITEM_COLUMNS), args.catalog)
+    if not args.sqlite_db:
+        from services.sqlite_item_db import build_item_db
+        tmp_dir = tmp_dir or tempfile.TemporaryDirectory()
+        args.sqlite_db = os.path.join(tmp_dir.name, "items.sqlite3")
+        build_item_db(iter_items_sql(args.sql, ITEM_COLUMNS), args.sqlite_db)
+
+    backends = ["catalog", "mmap", "sqlite"] + (["mysql"] if args.mysql else [])
+    print(f"{'backend':<10}{'load ms':>10}{'RSS +KiB':>12}{'p50 us':>10}{'p99 us':>10}   ({LOOKUPS} lookups x {ITEMS_PER_LOOKUP} items)")
+    for name in backends:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_item_catalog", "--sql", args.sql,
+             "--catalog", args.catalog, "--sqlite-db", args.sqlite_db, "--backend", name],
+            capture_output=True, text=True,
+        )
+        if output.returncode != 0:
+            print(f"{name:<10} failed: {output.stderr.strip().splitlines()[-1] if output.stderr else output.returncode}")
+            continue
+        r = json.loads(output.stdout.strip().splitlines()[-1])
+        print(f"{r['backend']:<10}{r['load_ms']:>10}{r['rss_delta_kb']:>12}{r['p50_us']:>10}{r['p99_us']:>10}")
+
+    if tmp_dir:
+        tmp_dir.cleanup()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
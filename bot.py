@@ -1,24 +1,30 @@
 # bot.py
+from utils.startup import startup_timer # First, so the import phase is timed too
 import discord
 from discord.ext import commands
 import asyncio
 import logging
 import os
+import time
 import config # Import your config
 
+startup_timer.record("imports", time.perf_counter() - startup_timer.started)
+
 # --- Logging Setup ---
 # Basic logging to console and a file
 log_formatter = logging.Formatter('%(asctime)s [%(levelname)s] [%(name)s]: %(message)s')
-log_file_handler = logging.FileHandler('bot.log', encoding='utf-8', mode='w')
-log_file_handler.setFormatter(log_formatter)
 log_console_handler = logging.StreamHandler()
 log_console_handler.setFormatter(log_formatter)
 
 # Get the root logger
 logger = logging.getLogger()
 logger.setLevel(logging.INFO) # Set root level (e.g., INFO, DEBUG)
-logger.addHandler(log_file_handler)
 logger.addHandler(log_console_handler)
+# Parsing workers re-import this file as __mp_main__; only the bot process itself (re)creates bot.log
+if __name__ == "__main__":
+    log_file_handler = logging.FileHandler('bot.log', encoding='utf-8', mode='w')
+    log_file_handler.setFormatter(log_formatter)
+    logger.addHandler(log_file_handler)
 
 # Silence overly verbose libraries if needed
 logging.getLogger('discord').setLevel(logging.WARNING)
@@ -56,7 +62,8 @@ async def setup_hook():
     # Load extensions (Cogs)
     for extension in INITIAL_EXTENSIONS:
         try:
-            await bot.load_extension(extension)
+            with startup_timer.phase(f"load {extension}"):
+                await bot.load_extension(extension)
             logger.info(f'Successfully loaded extension: {extension}')
         except commands.ExtensionNotFound:
             logger.error(f'Extension not found: {extension}')
@@ -70,6 +77,7 @@ async def setup_hook():
             # raise e
 
     logger.info("Setup_hook finished.")
+    startup_timer.log_report()
 
 @bot.event
 async def on_command_error(ctx: commands.Context, error: commands.CommandError):
@@ -84,6 +92,8 @@ async def on_command_error(ctx: commands.Context, error: commands.CommandError):
         await ctx.send(f"Bad argument provided. Use `.bot info` for command usage.")
     elif isinstance(error, commands.CommandOnCooldown):
          await ctx.send(f"This command is on cooldown. Try again in {error.retry_after:.1f} seconds.")
+    elif isinstance(error, commands.MaxConcurrencyReached):
+         await ctx.send("This command is already running here. Try again once it has finished.")
     elif isinstance(error, commands.CheckFailure):
          # Handle permission errors, NotOwner, etc. Specific cogs might handle their own.
          await ctx.send("You do not have permission to use this command.")
@@ -2,47 +2,214 @@
 import discord
 from discord.ext import commands
 import asyncio
-import aiohttp
+import io
 import logging
-from typing import List, Dict, Optional
-from table2ascii import table2ascii as t2a, PresetStyle
+import time
+from typing import List, Dict, Optional, Tuple
+import config # Import your config
 
 # Service and Model Imports
-from services.warmane_client import WarmaneClient
-from services.warmane_parser import WarmaneParser, WarmaneParserError
-from services.database_service import DatabaseService
+from services.warmane_client import WarmaneClient, ArmoryUnavailableError
+from services.http_session import create_http_session
+from services.warmane_parser import WarmaneParserError, scan_guild_members
+from services.parsing_service import ParsingService
+from utils.singleflight import SingleFlight
+from utils.worker_pool import run_bounded
+from utils.pagination import TablePages
+from utils.startup import startup_timer
+from services.database_service import DatabaseService, create_database_service
+from services.item_catalog import ItemCatalog
+from services.item_catalog_file import MappedItemCatalog
+from services.snapshot_store import SnapshotStore
 from models.character import Character
 from models.item import Item
 from models.item_type import ItemTypes
+from models.gear_summary import GearSummary
 
 # Util Imports
 from utils.helpers import (
     normalize_realm_name, format_prof_spec, format_glyphs,
-    clean_data_for_table
+    clean_data_for_table, format_age
+)
+from utils.embeds import (
+    create_error_embed, create_char_not_found_embed, create_info_embed, create_armory_unavailable_embed
 )
-from utils.embeds import create_error_embed, create_char_not_found_embed
 from utils.constants import (
-    DEFAULT_REALM, ONYXIA_REALM, EMBED_COLOR_INFO, OK, ERROR
+    DEFAULT_REALM, ONYXIA_REALM, EMBED_COLOR_INFO, OK, ERROR, WARNING
 )
 
 # Talent Imports
-from talents import deathknight as dk_talents
-from talents import paladin as paladin_talents
+from talents.registry import get_class_talents, registry as talent_registry
+from talents.batch_audit import audit_talents
+
+RAID_AUDIT_LIMIT = 40
 
 logger = logging.getLogger(__name__)
 
+FRESH_FLAG = "fresh" # `.bot stalk Name [realm] fresh` skips the Armory page cache
+
+def _split_fresh_flag(realm_name: str, option: str) -> Tuple[str, bool]:
+    """Handles an optional trailing 'fresh' flag, which may also take the realm's place."""
+    if realm_name.lower() == FRESH_FLAG:
+        return DEFAULT_REALM, True
+    return realm_name, option.lower() == FRESH_FLAG
+
+def _short_check_name(message: str) -> str:
+    """'❌ Holy Shock (Expected 1/1)' -> 'Holy Shock', for compact tables."""
+    for marker in (OK, ERROR, WARNING):
+        message = message.replace(marker, "")
+    return message.split(" (", 1)[0].strip()
+
+def _render_table(header: List[str], body: List[List[str]]) -> str:
+    """Renders an ASCII table (thin compact style)."""
+    from table2ascii import table2ascii as t2a, PresetStyle # Deferred, only needed once a table is sent
+    return t2a(header=header, body=body, style=PresetStyle.thin_compact)
+
+async def _send_table(ctx: commands.Context, table: str, max_len: int = 1990):
+    """Sends an ASCII table in a code block, split into chunks if it's too long for one message."""
+    if len(table) <= max_len:
+        await ctx.send(f"```\n{table}\n```")
+        return
+    await ctx.send("Output too long, sending in chunks:")
+    # Chunks end on line breaks so no row (or border) is cut in half
+    chunk = ""
+    for line in table.split("\n"):
+        if chunk and len(chunk) + len(line) + 1 > max_len:
+            await ctx.send(f"```\n{chunk}\n```")
+            chunk = ""
+        chunk = f"{chunk}\n{line}" if chunk else line[:max_len]
+    if chunk:
+        await ctx.send(f"```\n{chunk}\n```")
+
+def _gear_columns(character: Character) -> List[str]:
+    """GS, enchant/gem icons, spec and professions: the compact per-character table columns."""
+    gear = character.gear_summary
+    return [
+        f"{character.gear_score:.0f}", # GS without decimals
+        ERROR if gear.missing_enchants else OK,
+        ERROR if gear.missing_gems else OK,
+        clean_data_for_table(character.specializations),
+        clean_data_for_table(character.professions),
+    ]
+
+PENDING = "…" # Table cell for a row that's still being fetched
+
+def _multistalk_columns(result, char_name: str, norm_realm: str) -> List[str]:
+    """The multistalk columns after the name for one _fetch_and_build_character outcome."""
+    if isinstance(result, ArmoryUnavailableError):
+        return ["Armory Down", "-", "-", "-", "-"]
+    if isinstance(result, Exception):
+        logger.error(f"Error fetching/building character {char_name}-{norm_realm} in multistalk: {result}")
+        return ["Error", "Error", "Error", "Error", "Error"]
+    if result is None:
+        return ["Not Found", "-", "-", "-", "-"] # Character not found
+    return _gear_columns(result)
+
+def _multistalk_table(body_data: List[List[str]]) -> str:
+    return _render_table(["Character", "GS", "E", "G", "Specialization", "Professions"], body_data)
+
+def _split_guild_args(args: Tuple[str, ...]) -> Tuple[str, str]:
+    """
+    (guild name, realm) from `"Guild Name" Realm`, `Guild Name-Realm` or just the name (default realm).
+    Unquoted words all belong to the name, so "Knights of Icecrown" isn't read as "Knights of" on Icecrown.
+    """
+    if len(args) == 2 and normalize_realm_name(args[1]): # Quoted name (or a one-word one), then the realm
+        return args[0], args[1]
+    name = " ".join(args)
+    if "-" in name:
+        name, realm = name.rsplit("-", 1)
+        return name.strip(), realm.strip()
+    return name, DEFAULT_REALM
+
+class _GuildScan:
+    """Counters and the request budget of one running guildscan."""
+
+    def __init__(self, total: int, request_budget: int, max_age: float):
+        self.total = total
+        self.request_budget = request_budget # Members that may be fetched from the Armory
+        self.max_age = max_age # Stored characters younger than this are used as they are
+        self.requests = 0
+        self.done = 0
+        self.cached = 0
+        self.fetched = 0
+        self.not_found = 0
+        self.skipped = 0
+        self.unavailable = 0
+
+    def progress_line(self, title: str) -> str:
+        state = "Scanned" if self.done >= self.total else "Scanning"
+        return (
+            f"{state} **{title}**: {self.done}/{self.total} members "
+            f"({self.cached} cached, {self.fetched} fetched, {self.requests}/{self.request_budget} Armory requests)"
+        )
+
+    def summary(self, title: str, found_rows: List[List[str]]) -> str:
+        """Report text: averages over the members with data, plus what couldn't be scanned."""
+        lines = [f"**{title}**: {len(found_rows)}/{self.total} members with data."]
+        if found_rows:
+            average_gs = sum(int(row[1]) for row in found_rows) / len(found_rows)
+            missing_enchants = sum(1 for row in found_rows if row[2] == ERROR)
+            missing_gems = sum(1 for row in found_rows if row[3] == ERROR)
+            lines.append(
+                f"Average GS {average_gs:.0f} | {missing_enchants} missing enchants | {missing_gems} missing gems"
+            )
+        problems = []
+        if self.not_found:
+            problems.append(f"{self.not_found} not found")
+        if self.unavailable:
+            problems.append(f"{self.unavailable} hit the Armory being down")
+        if self.skipped:
+            problems.append(f"{self.skipped} over the request budget (stored data used where available)")
+        if problems:
+            lines.append(f"{WARNING} " + ", ".join(problems))
+        return "\n".join(lines)
+
+# Identical concurrent builds (same character, realm and options) share one fetch/parse/DB pass
+_build_flight = SingleFlight()
+
 # --- Helper function to build Character object ---
 async def _fetch_and_build_character(
     char_name: str,
     realm: str,
     warmane_client: WarmaneClient,
-    db_service: DatabaseService,
+    item_source: ItemCatalog, # Anything with get_items_by_ids (ItemCatalog or DatabaseService)
+    parsing_service: ParsingService,
+    fetch_talents: bool = True, # Option to skip talent fetching
+    fresh: bool = False, # Bypass the Armory page cache
+    snapshot_store: Optional[SnapshotStore] = None,
+) -> Optional[Character]:
+    """
+    Fetches data from Armory and DB, then builds a Character object.
+    A stored snapshot younger than SNAPSHOT_MAX_AGE is returned instead (unless fresh). When talents
+    are wanted, the snapshot's talents must be that young too.
+    """
+    if snapshot_store and not fresh:
+        snapshot = await snapshot_store.get(char_name, realm)
+        max_age = getattr(config, "SNAPSHOT_MAX_AGE", 600)
+        if (snapshot and snapshot.age() <= max_age
+                and (not fetch_talents or snapshot.talents_age() <= max_age)):
+            return snapshot
+
+    key = (char_name.lower(), realm.lower(), fetch_talents, fresh)
+    return await _build_flight.do(key, lambda: _build_character(
+        char_name, realm, warmane_client, item_source, parsing_service, fetch_talents, fresh, snapshot_store
+    ))
+
+async def _build_character(
+    char_name: str,
+    realm: str,
+    warmane_client: WarmaneClient,
+    item_source: ItemCatalog, # Anything with get_items_by_ids (ItemCatalog or DatabaseService)
+    parsing_service: ParsingService,
     fetch_talents: bool = True, # Option to skip talent fetching
+    fresh: bool = False, # Bypass the Armory page cache
+    snapshot_store: Optional[SnapshotStore] = None, # Stores the result
 ) -> Optional[Character]:
-    """Fetches data from Armory and DB, then builds a Character object."""
-    tasks = [warmane_client.get_profile_html(char_name, realm)]
+    """Does the actual work for _fetch_and_build_character."""
+    fetched_at = time.time()
+    tasks = [warmane_client.get_profile_html(char_name, realm, fresh=fresh)]
     if fetch_talents:
-        tasks.append(warmane_client.get_talents_html(char_name, realm))
+        tasks.append(warmane_client.get_talents_html(char_name, realm, fresh=fresh))
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -50,6 +217,8 @@ async def _fetch_and_build_character(
     talent_html = results[1] if fetch_talents and len(results) > 1 else None
 
     # Handle potential exceptions during fetching
+    if isinstance(profile_html, ArmoryUnavailableError):
+        raise profile_html # Not a missing character, let the command say so
     if isinstance(profile_html, Exception):
         logger.error(f"Failed to fetch profile for {char_name}-{realm}: {profile_html}")
         return None # Cannot proceed without profile
@@ -57,18 +226,13 @@ async def _fetch_and_build_character(
         logger.warning(f"Failed to fetch talents for {char_name}-{realm}: {talent_html}")
         talent_html = None # Continue without talents if fetch failed
 
-    # Basic check if character exists before parsing
-    if not profile_html or not WarmaneParser.check_character_exists(profile_html):
+    if not profile_html:
         logger.info(f"Character {char_name}-{realm} not found or profile HTML empty.")
         return None # Character not found
 
-    # --- Parse Profile HTML ---
+    # --- Parse Profile HTML (in the parsing pool, off the event loop) ---
     try:
-        guild = WarmaneParser.extract_guild(profile_html)
-        level, race, char_class = WarmaneParser.extract_level_race_class(profile_html)
-        professions = WarmaneParser.extract_professions(profile_html)
-        specializations, active_spec_id = WarmaneParser.extract_specializations(profile_html)
-        equipped_items_data, item_ids_to_fetch = WarmaneParser.extract_equipped_items_data(profile_html)
+        profile = await parsing_service.parse_profile(profile_html)
     except WarmaneParserError as e:
         logger.error(f"Parsing error for {char_name}-{realm} profile: {e}")
         return None # Critical parsing error
@@ -76,8 +240,16 @@ async def _fetch_and_build_character(
         logger.exception(f"Unexpected error parsing profile for {char_name}-{realm}: {e}")
         return None
 
+    if not profile.exists:
+        logger.info(f"Character {char_name}-{realm} not found.")
+        return None # Character not found
+
+    char_class = profile.char_class
+    professions = profile.professions
+    equipped_items_data, item_ids_to_fetch = profile.equipped_items, profile.item_ids
+
     # --- Fetch Item Data from DB ---
-    db_item_data = await db_service.get_items_by_ids(item_ids_to_fetch)
+    db_item_data = await item_source.get_items_by_ids(item_ids_to_fetch)
     if not db_item_data and item_ids_to_fetch:
          logger.warning(f"No item data found in DB for {char_name}-{realm}, calculations might be inaccurate.")
 
@@ -96,75 +268,100 @@ async def _fetch_and_build_character(
             db_entry = db_entries[i] if i < len(db_entries) else db_entries[0]
 
             try:
-                item_obj = Item(
-                    item_id=item_id,
-                    name=db_entry['name'],
-                    item_level=db_entry['ItemLevel'],
-                    quality=db_entry['quality'],
-                    item_type_val=db_entry['type'],
-                    requires=db_entry['requires'],
-                    char_class=db_entry['class'],
-                    subclass=db_entry['subclass'],
-                    gem_slots=db_entry['gems'],
-                    gear_score=db_entry['GearScore'],
-                    enchant_id=equipped_data['enchant'],
-                    equipped_gems=equipped_data['gems']
-                )
+                item_obj = Item.from_row(db_entry, equipped_data['enchant'], equipped_data['gems'])
                 if item_id not in character_items:
                     character_items[item_id] = []
                 character_items[item_id].append(item_obj)
-            except (KeyError, TypeError) as e:
+            except (KeyError, TypeError, ValueError) as e:
                  logger.error(f"Error creating Item object for ID {item_id} from DB data: {e}")
                  continue # Skip this specific item instance
 
     # --- Parse Talents/Glyphs HTML ---
     glyphs = {}
     talent_strings = {}
+    has_talents = False
+    talents_fetched_at = None
     if talent_html:
         try:
-            glyphs = WarmaneParser.extract_glyphs(talent_html)
+            talents = await parsing_service.parse_talents(talent_html, char_class)
+            glyphs = talents.glyphs
             # Also extract talent string if needed for checks later
-            talent_strings = WarmaneParser.extract_talent_points_string(talent_html, char_class)
+            talent_strings = talents.talent_strings
+            has_talents = True
+            talents_fetched_at = fetched_at
         except Exception as e:
             logger.exception(f"Unexpected error parsing talents/glyphs for {char_name}-{realm}: {e}")
             # Continue without glyphs/talents if parsing failed
 
-    # --- Perform Calculations ---
-    gear_score = WarmaneParser.calculate_gear_score(character_items)
-    avg_ilvl = WarmaneParser.calculate_avg_ilvl(character_items)
+    # --- Perform Calculations (one pass, kept on the Character for the embeds) ---
+    gear_summary = GearSummary.from_items(character_items, char_class, professions)
 
     # --- Create Character Object ---
     character = Character(
         name=char_name,
         realm=realm,
-        level=level,
-        race=race,
+        level=profile.level,
+        race=profile.race,
         char_class=char_class,
-        guild=guild,
+        guild=profile.guild,
         professions=professions,
-        specializations=specializations,
+        specializations=profile.specializations,
         items=character_items,
         glyphs=glyphs,
-        active_spec_id=active_spec_id,
-        gear_score=gear_score,
-        avg_item_level=avg_ilvl,
-        # Store talent strings if needed later
-        # talent_strings=talent_strings
+        active_spec_id=profile.active_spec_id,
+        gear_score=gear_summary.gear_score,
+        avg_item_level=gear_summary.avg_item_level,
+        talent_strings=talent_strings,
+        fetched_at=fetched_at,
+        has_talents=has_talents,
+        talents_fetched_at=talents_fetched_at,
+        gear_summary=gear_summary,
     )
 
+    if snapshot_store:
+        if not character.has_talents:
+            # Profile-only build (multistalk, guildscan...): keep the stored talents/glyphs instead of
+            # replacing a full snapshot with a worse one. They keep their own talents_fetched_at, so
+            # they still count as old when someone asks for talents.
+            previous = await snapshot_store.get(char_name, realm)
+            if previous and previous.has_talents:
+                character.glyphs = previous.glyphs
+                character.talent_strings = previous.talent_strings
+                character.has_talents = True
+                character.talents_fetched_at = previous.talents_fetched_at
+        await snapshot_store.put(character)
     return character
 
 
+def _shown_age(snapshot: Character) -> float:
+    """Age of the oldest data in a stalk reply: the profile, or talents carried over from an earlier build."""
+    if snapshot.talents_fetched_at is None: # No talents, or stored before they had a timestamp
+        return snapshot.age()
+    return max(snapshot.age(), snapshot.talents_age())
+
+
 # --- Cog Definition ---
 class StalkCog(commands.Cog):
-    def __init__(self, bot: commands.Bot, warmane_client: WarmaneClient, db_service: DatabaseService):
+    def __init__(
+        self,
+        bot: commands.Bot,
+        warmane_client: WarmaneClient,
+        db_service: DatabaseService,
+        item_catalog: ItemCatalog,
+        parsing_service: ParsingService,
+        snapshot_store: Optional[SnapshotStore] = None,
+    ):
         self.bot = bot
         self.warmane_client = warmane_client
         self.db_service = db_service
+        self.item_catalog = item_catalog
+        self.parsing_service = parsing_service
+        self.snapshot_store = snapshot_store
+        self._background_tasks = set() # Background stalk refreshes
         logger.info("StalkCog initialized.")
 
-    def _create_stalk_embed(self, character: Character) -> discord.Embed:
-        """Builds the Discord embed from a Character object."""
+    def _create_stalk_embed(self, character: Character, footer_note: Optional[str] = None) -> discord.Embed:
+        """Builds the Discord embed from a Character object. footer_note is appended to the footer."""
         embed = discord.Embed(
             title=f"Summary: {character.name.capitalize()}-{character.realm.capitalize()}",
             color=EMBED_COLOR_INFO,
@@ -197,8 +394,8 @@ class StalkCog(commands.Cog):
 
         # --- Enchants & Gems ---
         # Perform checks here using the character object
-        enchant_status = WarmaneParser.check_enchants(character.items, character.char_class, character.professions)
-        gem_status = WarmaneParser.check_gems(character.items)
+        enchant_status = character.gear_summary.enchant_status()
+        gem_status = character.gear_summary.gem_status()
         embed.add_field(name="Enchants", value=enchant_status, inline=True)
         embed.add_field(name="Gems", value=gem_status, inline=True)
         embed.add_field(name="\u200b", value="\u200b", inline=False) # Spacer
@@ -222,25 +419,41 @@ class StalkCog(commands.Cog):
 
 
         # --- Armory Link Footer ---
-        embed.set_footer(text=f"Click the title for Armory link | Data fetched from Warmane Armory")
+        footer = "Click the title for Armory link | Data fetched from Warmane Armory"
+        embed.set_footer(text=f"{footer} | {footer_note}" if footer_note else footer)
 
         return embed
 
     @commands.command(aliases=['summary', 'query'])
-    async def stalk(self, ctx: commands.Context, character_name: str, realm_name: str = DEFAULT_REALM):
-        """Shows a summary of a character from Warmane Armory."""
-        async with ctx.typing():
-            norm_realm = normalize_realm_name(realm_name)
-            if not norm_realm:
-                await ctx.send(embed=create_error_embed(
-                    "Invalid Realm",
-                    f"Could not recognize realm '{realm_name}'. Use Icecrown, Lordaeron, Blackrock, or Onyxia."
-                ))
+    async def stalk(self, ctx: commands.Context, character_name: str, realm_name: str = DEFAULT_REALM, option: str = ""):
+        """Shows a summary of a character from Warmane Armory. Add 'fresh' to skip the page cache."""
+        realm_name, fresh = _split_fresh_flag(realm_name, option)
+        norm_realm = normalize_realm_name(realm_name)
+        if not norm_realm:
+            await ctx.send(embed=create_error_embed(
+                "Invalid Realm",
+                f"Could not recognize realm '{realm_name}'. Use Icecrown, Lordaeron, Blackrock, or Onyxia."
+            ))
+            return
+
+        # Stale-while-revalidate: answer from the stored snapshot right away. If it's past
+        # SNAPSHOT_MAX_AGE, say so and edit the message once a background refresh is done.
+        if self.snapshot_store and not fresh:
+            snapshot = await self.snapshot_store.get(character_name, norm_realm)
+            if snapshot and max(snapshot.age(), snapshot.talents_age()) <= getattr(config, "SNAPSHOT_MAX_AGE", 600):
+                await ctx.send(embed=self._create_stalk_embed(snapshot))
+                return
+            if snapshot:
+                note = f"Cached {format_age(_shown_age(snapshot))} ago, refreshing…"
+                message = await ctx.send(embed=self._create_stalk_embed(snapshot, footer_note=note))
+                self._spawn(self._refresh_stalk_message(message, snapshot, character_name, norm_realm))
                 return
 
+        async with ctx.typing():
             try:
                 character = await _fetch_and_build_character(
-                    character_name, norm_realm, self.warmane_client, self.db_service
+                    character_name, norm_realm, self.warmane_client, self.item_catalog, self.parsing_service,
+                    fresh=fresh, snapshot_store=self.snapshot_store
                 )
 
                 if character:
@@ -250,110 +463,333 @@ class StalkCog(commands.Cog):
                     # Character not found or critical error during fetch/parse
                     await ctx.send(embed=create_char_not_found_embed(character_name, norm_realm))
 
+            except ArmoryUnavailableError as e:
+                logger.warning(f"Armory unavailable for stalk {character_name}-{norm_realm}: {e}")
+                await ctx.send(embed=create_armory_unavailable_embed(e.retry_after))
             except Exception as e:
                 logger.exception(f"Error in stalk command for {character_name}-{norm_realm}: {e}")
                 await ctx.send(embed=create_error_embed(description="An unexpected error occurred while processing the stalk command."))
 
+    async def _refresh_stalk_message(self, message: discord.Message, snapshot: Character, character_name: str, norm_realm: str):
+        """Rebuilds a character shown from a stale snapshot and edits the reply in place."""
+        character = None
+        try:
+            character = await _fetch_and_build_character(
+                character_name, norm_realm, self.warmane_client, self.item_catalog, self.parsing_service,
+                snapshot_store=self.snapshot_store
+            )
+        except ArmoryUnavailableError as e:
+            logger.warning(f"Armory unavailable while refreshing {character_name}-{norm_realm}: {e}")
+        except Exception as e:
+            logger.exception(f"Error refreshing {character_name}-{norm_realm}: {e}")
+
+        if character:
+            embed = self._create_stalk_embed(character)
+        else:
+            embed = self._create_stalk_embed(snapshot, footer_note=f"Cached {format_age(_shown_age(snapshot))} ago, refresh failed")
+        try:
+            await message.edit(embed=embed)
+        except discord.HTTPException as e:
+            logger.warning(f"Could not update stalk reply for {character_name}-{norm_realm}: {e}")
+
+    def _spawn(self, coro):
+        """Runs a background task, keeping a reference so it isn't garbage collected mid-run."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def cog_unload(self):
+        for task in self._background_tasks:
+            task.cancel()
+
     @commands.command(aliases=['stalkmulti', 'querymulti'])
     async def multistalk(self, ctx: commands.Context, *args: str):
         """Shows basic GearScore, Enchants, Gems, Spec, Profs for multiple characters (Default: Icecrown)."""
+        fresh = any(arg.lower() == FRESH_FLAG for arg in args)
+        args = tuple(arg for arg in args if arg.lower() != FRESH_FLAG)
         if not args:
             await ctx.send("Please provide at least one character name.")
             return
-        if len(args) > 15: # Limit requests
-             await ctx.send("Please request fewer than 15 characters at a time.")
+        max_names = getattr(config, "MULTISTALK_LIMIT", 100)
+        if len(args) > max_names: # Limit requests
+             await ctx.send(f"Please request at most {max_names} characters at a time.")
              return
 
+        char_realm_pairs = []
+        seen = set()
+        skipped = []
+        duplicates = 0
+        for name_input in args:
+            # Basic check for format: Name or Name-Realm
+            parts = name_input.split('-', 1)
+            char_name = parts[0]
+            realm_input = parts[1] if len(parts) > 1 else DEFAULT_REALM
+            norm_realm = normalize_realm_name(realm_input)
+
+            if not char_name.isalpha():
+                skipped.append(f"'{name_input}' (invalid name)")
+                continue
+            if not norm_realm:
+                skipped.append(f"'{name_input}' (invalid realm '{realm_input}')")
+                continue
+            if (char_name.lower(), norm_realm) in seen:
+                duplicates += 1
+                continue
+            seen.add((char_name.lower(), norm_realm))
+            char_realm_pairs.append((char_name, norm_realm))
+
+        if skipped:
+            await ctx.send(f"Skipping {', '.join(skipped)}"[:1990])
+        if duplicates:
+            await ctx.send(f"Ignoring {duplicates} repeated name(s).")
+        if not char_realm_pairs:
+            await ctx.send("No valid characters found or processed.")
+            return
+
+        # Table right away with every row pending; rows are filled in as characters finish.
+        # Long rosters are split into pages (buttons), only the page on screen gets rendered.
+        body_data = [
+            [f"{char_name.capitalize()}-{norm_realm}", PENDING, "", "", "", ""]
+            for char_name, norm_realm in char_realm_pairs
+        ]
+        pages = TablePages(
+            body_data, _multistalk_table, getattr(config, "MULTISTALK_PAGE_SIZE", 15), author_id=ctx.author.id
+        )
+        await pages.send(ctx)
+
+        async def build(pair: Tuple[str, str]) -> Optional[Character]:
+            # Don't fetch talents for multi-stalk to save time/resources
+            return await _fetch_and_build_character(
+                pair[0], pair[1], self.warmane_client, self.item_catalog, self.parsing_service,
+                fetch_talents=False, fresh=fresh, snapshot_store=self.snapshot_store
+            )
+
+        async with ctx.typing():
+            edit_interval = getattr(config, "TABLE_EDIT_INTERVAL", 1.0)
+            async for pos, result in run_bounded(char_realm_pairs, build, getattr(config, "MULTISTALK_CONCURRENCY", 8)):
+                char_name, norm_realm = char_realm_pairs[pos]
+                body_data[pos] = [body_data[pos][0], *_multistalk_columns(result, char_name, norm_realm)]
+                pages.schedule_refresh(edit_interval) # Shown within edit_interval, even if the next result hangs
+
+        # --- Final table ---
+        try:
+            if not await pages.finish():
+                # Couldn't edit the live message: send the whole table, not just the page it was on
+                await _send_table(ctx, _multistalk_table(body_data))
+        except Exception as e:
+            logger.exception(f"Error generating table for multistalk: {e}")
+            await ctx.send(embed=create_error_embed(description="Failed to generate the results table."))
+
+
+    @commands.command(aliases=['scanguild', 'guildaudit'])
+    @commands.max_concurrency(1, per=commands.BucketType.guild)
+    async def guildscan(self, ctx: commands.Context, *args: str):
+        """Scans a whole guild roster: GS, enchants, gems, spec and professions per member."""
+        if not args:
+            await ctx.send("Please provide a guild name.")
+            return
+        guild_name, realm_name = _split_guild_args(args)
+        norm_realm = normalize_realm_name(realm_name)
+        if not norm_realm:
+            await ctx.send(embed=create_error_embed("Invalid Realm", f"Could not recognize realm '{realm_name}'."))
+            return
+
+        try:
+            async with ctx.typing():
+                roster_html = await self.warmane_client.get_guild_html(guild_name, norm_realm)
+        except ArmoryUnavailableError as e:
+            await ctx.send(embed=create_armory_unavailable_embed(e.retry_after))
+            return
+        members = scan_guild_members(roster_html) if roster_html else [] # One regex pass, fine on the loop
+        if not members:
+            await ctx.send(embed=create_error_embed(
+                "Guild Not Found", f"Could not find a member list for guild '{guild_name}' on {norm_realm}."
+            ))
+            return
+
+        max_members = getattr(config, "GUILDSCAN_MAX_MEMBERS", 500)
+        truncated = len(members) > max_members
+        members = members[:max_members]
+        scan = _GuildScan(
+            len(members),
+            request_budget=getattr(config, "GUILDSCAN_REQUEST_BUDGET", 300),
+            max_age=getattr(config, "GUILDSCAN_SNAPSHOT_MAX_AGE", 21600),
+        )
+        title = f"{guild_name} ({norm_realm})"
+        progress = await ctx.send(scan.progress_line(title))
+
+        async def build(member: Tuple[str, str]) -> Tuple[Optional[Character], str]:
+            return await self._scan_member(scan, member[0], norm_realm)
+
+        interval = getattr(config, "GUILDSCAN_PROGRESS_INTERVAL", 5)
+        last_edit = time.monotonic()
+        rows: List[Tuple[float, List[str]]] = [] # (sort key, row)
+        async for index, result in run_bounded(members, build, getattr(config, "GUILDSCAN_CONCURRENCY", 4)):
+            char_name = members[index][0]
+            if isinstance(result, Exception):
+                logger.error(f"Error building {char_name}-{norm_realm} in guildscan: {result}")
+                character, note = None, "Error"
+            else:
+                character, note = result
+            scan.done += 1
+            if character:
+                rows.append((character.gear_score, [char_name, *_gear_columns(character), note]))
+            else:
+                rows.append((-1.0, [char_name, "-", "-", "-", "-", "-", note]))
+
+            if time.monotonic() - last_edit >= interval:
+                last_edit = time.monotonic()
+                try:
+                    await progress.edit(content=scan.progress_line(title))
+                except discord.HTTPException as e:
+                    logger.warning(f"Could not update guildscan progress for {title}: {e}")
+
+        rows.sort(key=lambda row: row[0], reverse=True)
+        try:
+            output_table = _render_table(
+                ["Character", "GS", "E", "G", "Specialization", "Professions", "Data"], [row for _, row in rows]
+            )
+        except Exception as e:
+            logger.exception(f"Error generating table for guildscan {title}: {e}")
+            await ctx.send(embed=create_error_embed(description="Failed to generate the results table."))
+            return
+
+        summary = scan.summary(title, [row for key, row in rows if key >= 0])
+        if truncated:
+            summary += f"\nOnly the first {max_members} roster entries were scanned."
+        filename = f"guildscan-{guild_name.replace(' ', '_')}-{norm_realm}.txt"
+        try:
+            await progress.edit(content=scan.progress_line(title))
+        except discord.HTTPException:
+            pass # The report below says the same
+        await ctx.send(summary, file=discord.File(io.BytesIO(output_table.encode("utf-8")), filename=filename))
+
+    async def _scan_member(self, scan: "_GuildScan", char_name: str, norm_realm: str) -> Tuple[Optional[Character], str]:
+        """Builds one guild member for guildscan. Returns (character or None, data note for the table)."""
+        snapshot = await self.snapshot_store.get(char_name, norm_realm) if self.snapshot_store else None
+        if snapshot and snapshot.age() <= scan.max_age:
+            scan.cached += 1
+            return snapshot, f"cached {format_age(snapshot.age())}"
+        if scan.requests >= scan.request_budget:
+            # Out of budget: an older snapshot still beats nothing
+            scan.skipped += 1
+            if snapshot:
+                return snapshot, f"stale {format_age(snapshot.age())}"
+            return None, "Skipped (budget)"
+
+        scan.requests += 1
+        try:
+            character = await _fetch_and_build_character(
+                char_name, norm_realm, self.warmane_client, self.item_catalog, self.parsing_service,
+                fetch_talents=False, snapshot_store=self.snapshot_store
+            )
+        except ArmoryUnavailableError:
+            scan.unavailable += 1
+            if snapshot:
+                return snapshot, f"stale {format_age(snapshot.age())}"
+            return None, "Armory Down"
+        if character is None:
+            scan.not_found += 1
+            return None, "Not Found"
+        scan.fetched += 1
+        return character, "live"
+
+    @commands.command(aliases=['raidaudit', 'talentaudit'])
+    async def raidtalents(self, ctx: commands.Context, *args: str):
+        """Audits the talents of a whole roster (Name or Name-Realm, up to 40) in one table."""
+        fresh = any(arg.lower() == FRESH_FLAG for arg in args)
+        args = tuple(arg for arg in args if arg.lower() != FRESH_FLAG)
+        if not args:
+            await ctx.send("Please provide at least one character name.")
+            return
+        if len(args) > RAID_AUDIT_LIMIT:
+            await ctx.send(f"Please request at most {RAID_AUDIT_LIMIT} characters at a time.")
+            return
+
         async with ctx.typing():
-            tasks = []
             char_realm_pairs = []
             for name_input in args:
-                # Basic check for format: Name or Name-Realm
                 parts = name_input.split('-', 1)
                 char_name = parts[0]
                 realm_input = parts[1] if len(parts) > 1 else DEFAULT_REALM
                 norm_realm = normalize_realm_name(realm_input)
-
-                if not char_name.isalpha():
-                     await ctx.send(f"Skipping invalid character name format: '{name_input}'")
-                     continue
-                if not norm_realm:
-                     await ctx.send(f"Skipping '{name_input}': Invalid realm '{realm_input}'")
-                     continue
-
-                # Don't fetch talents for multi-stalk to save time/resources
-                tasks.append(
-                    _fetch_and_build_character(
-                        char_name, norm_realm, self.warmane_client, self.db_service, fetch_talents=False
-                    )
-                )
+                if not char_name.isalpha() or not norm_realm:
+                    await ctx.send(f"Skipping invalid character '{name_input}'")
+                    continue
                 char_realm_pairs.append((char_name, norm_realm))
 
-            results: List[Optional[Character]] = await asyncio.gather(*tasks, return_exceptions=True)
-
-            body_data = []
-            for i, result in enumerate(results):
-                char_name, norm_realm = char_realm_pairs[i]
-                char_row = [f"{char_name.capitalize()}-{norm_realm}"] # Start row with name-realm
+            async def build(pair: Tuple[str, str]) -> Optional[Character]:
+                return await _fetch_and_build_character(
+                    pair[0], pair[1], self.warmane_client, self.item_catalog, self.parsing_service,
+                    fresh=fresh, snapshot_store=self.snapshot_store
+                )
 
-                if isinstance(result, Exception):
-                    logger.error(f"Error fetching/building character {char_name}-{norm_realm} in multistalk: {result}")
-                    char_row.extend(["Error", "Error", "Error", "Error", "Error"])
+            # Bounded like multistalk: each character is two Armory pages
+            results: List = [None] * len(char_realm_pairs)
+            concurrency = getattr(config, "MULTISTALK_CONCURRENCY", 8)
+            async for pos, result in run_bounded(char_realm_pairs, build, concurrency):
+                results[pos] = result
+
+            # Rows for players that can't be audited are filled in directly, the rest are grouped
+            # by class and audited in one batch per class
+            body_data: List[Optional[List[str]]] = [None] * len(results)
+            by_class: Dict[str, List[Tuple[int, str, str]]] = {} # class name -> [(row, label, talent string)]
+            for pos, result in enumerate(results):
+                char_name, norm_realm = char_realm_pairs[pos]
+                label = f"{char_name.capitalize()}-{norm_realm}"
+                if isinstance(result, ArmoryUnavailableError):
+                    body_data[pos] = [label, "-", "-", "Armory Down", ""]
+                elif isinstance(result, Exception):
+                    logger.error(f"Error fetching/building character {char_name}-{norm_realm} in raidtalents: {result}")
+                    body_data[pos] = [label, "-", "-", "Error", ""]
                 elif result is None:
-                    # Character not found
-                    char_row.extend(["Not Found", "-", "-", "-", "-"])
+                    body_data[pos] = [label, "-", "-", "Not Found", ""]
                 else:
-                    # Character found, extract data
-                    character = result
-                    enchant_status = WarmaneParser.check_enchants(character.items, character.char_class, character.professions)
-                    gem_status = WarmaneParser.check_gems(character.items)
-                    # Simplify status for table
-                    enchant_icon = OK if OK in enchant_status else ERROR if ERROR in enchant_status else "?"
-                    gem_icon = OK if OK in gem_status else ERROR if ERROR in gem_status else "?"
-
-                    spec_str = clean_data_for_table(character.specializations)
-                    prof_str = clean_data_for_table(character.professions)
-
-                    char_row.extend([
-                        f"{character.gear_score:.0f}", # GS without decimals
-                        enchant_icon,
-                        gem_icon,
-                        spec_str,
-                        prof_str
-                    ])
-
-                body_data.append(char_row)
+                    talent_strings = result.talent_strings
+                    talent_string = talent_strings.get(result.active_spec_id) or next(iter(talent_strings.values()), None)
+                    if not talent_string:
+                        body_data[pos] = [label, result.char_class or "-", "-", "No Talents", ""]
+                    else:
+                        class_talents = get_class_talents(result.char_class)
+                        if not class_talents:
+                            body_data[pos] = [label, result.char_class or "-", "-", "Unsupported", ""]
+                        else:
+                            by_class.setdefault(class_talents.name, []).append((pos, label, talent_string))
+
+            for char_class, entries in by_class.items():
+                class_talents = get_class_talents(char_class)
+                audits = audit_talents(
+                    [(label, talent_string) for _, label, talent_string in entries],
+                    class_talents.templates, class_talents.detect_spec,
+                )
+                for (pos, label, _), audit in zip(entries, audits):
+                    if not audit.supported:
+                        status, issues = "No Template", ""
+                    elif audit.passed:
+                        status, issues = OK, ""
+                    else:
+                        marker = ERROR if any(ERROR in f.message for f in audit.failures) else WARNING
+                        status = f"{marker} {len(audit.failures)}"
+                        issues = ", ".join(_short_check_name(f.message) for f in audit.failures)
+                        if len(issues) > 60:
+                            issues = issues[:57] + "..."
+                    body_data[pos] = [label, char_class, audit.spec, status, issues]
 
             if not body_data:
                 await ctx.send("No valid characters found or processed.")
                 return
 
-            # --- Create ASCII Table ---
             try:
-                output_table = t2a(
-                    header=["Character", "GS", "E", "G", "Specialization", "Professions"],
-                    body=body_data,
-                    style=PresetStyle.thin_compact # Simple style
-                )
-
-                # Send in chunks if too long
-                max_len = 1990 # Max length for code block
-                if len(output_table) <= max_len:
-                    await ctx.send(f"```\n{output_table}\n```")
-                else:
-                    await ctx.send("Output too long, sending in chunks:")
-                    for i in range(0, len(output_table), max_len):
-                         chunk = output_table[i:i + max_len]
-                         await ctx.send(f"```\n{chunk}\n```")
-
+                output_table = _render_table(["Character", "Class", "Spec", "Result", "Issues"], body_data)
+                await _send_table(ctx, output_table)
             except Exception as e:
-                logger.exception(f"Error generating table for multistalk: {e}")
+                logger.exception(f"Error generating table for raidtalents: {e}")
                 await ctx.send(embed=create_error_embed(description="Failed to generate the results table."))
 
-
     @commands.command(aliases=['talents', 'checktalents'])
-    async def checkTalents(self, ctx: commands.Context, character_name: str, realm_name: str = DEFAULT_REALM):
-        """Checks a character's talents against predefined templates (DK, Paladin supported)."""
+    async def checkTalents(self, ctx: commands.Context, character_name: str, realm_name: str = DEFAULT_REALM, option: str = ""):
+        """Checks a character's talents against the templates in talents/data/talents.json."""
+        realm_name, fresh = _split_fresh_flag(realm_name, option)
         async with ctx.typing():
             norm_realm = normalize_realm_name(realm_name)
             if not norm_realm:
@@ -362,8 +798,8 @@ class StalkCog(commands.Cog):
 
             # We need profile for class and talents page for points
             tasks = [
-                self.warmane_client.get_profile_html(character_name, norm_realm),
-                self.warmane_client.get_talents_html(character_name, norm_realm)
+                self.warmane_client.get_profile_html(character_name, norm_realm, fresh=fresh),
+                self.warmane_client.get_talents_html(character_name, norm_realm, fresh=fresh)
             ]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -371,19 +807,28 @@ class StalkCog(commands.Cog):
             talent_html = results[1]
 
             # --- Error Handling ---
+            unavailable = next((r for r in results if isinstance(r, ArmoryUnavailableError)), None)
+            if unavailable:
+                await ctx.send(embed=create_armory_unavailable_embed(unavailable.retry_after))
+                return
             if isinstance(profile_html, Exception) or isinstance(talent_html, Exception):
                 logger.error(f"Failed to fetch data for talent check {character_name}-{norm_realm}")
                 await ctx.send(embed=create_error_embed(description="Could not fetch required Armory pages."))
                 return
-            if not profile_html or not talent_html or not WarmaneParser.check_character_exists(profile_html):
+            if not profile_html or not talent_html:
                  await ctx.send(embed=create_char_not_found_embed(character_name, norm_realm))
                  return
 
             # --- Parsing ---
             try:
-                _, _, char_class = WarmaneParser.extract_level_race_class(profile_html)
-                talent_strings_dict = WarmaneParser.extract_talent_points_string(talent_html, char_class) # Dict: spec_id -> string
-                _, active_spec_id = WarmaneParser.extract_specializations(profile_html) # Get active spec
+                profile = await self.parsing_service.parse_profile(profile_html)
+                if not profile.exists:
+                     await ctx.send(embed=create_char_not_found_embed(character_name, norm_realm))
+                     return
+                char_class = profile.char_class
+                talents = await self.parsing_service.parse_talents(talent_html, char_class)
+                talent_strings_dict = talents.talent_strings # Dict: spec_id -> string
+                active_spec_id = profile.active_spec_id # Get active spec
             except Exception as e:
                 logger.exception(f"Error parsing for talent check {character_name}-{norm_realm}: {e}")
                 await ctx.send(embed=create_error_embed(description="Failed to parse Armory data for talent check."))
@@ -397,34 +842,15 @@ class StalkCog(commands.Cog):
                  return
 
             # --- Select Talent Checker ---
-            talent_checker = None
-            if "Death Knight" in char_class:
-                talent_checker = dk_talents.check_talents
-            elif "Paladin" in char_class:
-                talent_checker = paladin_talents.check_talents
-            elif "Druid" in char_class:
-                talent_checker = druid_talents.check_talents
-            elif "Hunter" in char_class:
-                talent_checker = hunter_talents.check_talents
-            elif "Mage" in char_class:
-                talent_checker = mage_talents.check_talents
-            elif "Priest" in char_class:
-                talent_checker = priest_talents.check_talents
-            elif "Rogue" in char_class:
-                talent_checker = rogue_talents.check_talents
-            elif "Shaman" in char_class:
-                talent_checker = shaman_talents.check_talents
-            elif "Warlock" in char_class:
-                talent_checker = warlock_talents.check_talents
-            elif "Warrior" in char_class:
-                talent_checker = warrior_talents.check_talents
-            else:
+            class_talents = get_class_talents(char_class) # Loads the talent data on first use
+            if not class_talents or not class_talents.templates:
                 # Handle unsupported class
                 await ctx.send(embed=create_info_embed(
                     title="Unsupported Class",
                     description=f"Talent checks for '{char_class}' are not implemented yet."
                 ))
                 return
+            talent_checker = class_talents.check_talents
 
             # --- Perform Check and Send Embed ---
             # Check the active spec if possible, otherwise check all found specs
@@ -448,35 +874,125 @@ class StalkCog(commands.Cog):
                       await ctx.send(embed=create_error_embed(description=f"An error occurred while checking {char_class} talents."))
                  await asyncio.sleep(0.5) # Small delay between embeds if checking multiple specs
 
+    @commands.command()
+    @commands.is_owner()
+    async def armorystats(self, ctx: commands.Context):
+        """(Owner only) Shows Armory client counters (page cache, ...)."""
+        embed = create_info_embed(title="Armory Client Stats")
+        for section, values in self.warmane_client.stats().items():
+            lines = "\n".join(f"{name}: {value}" for name, value in values.items())
+            embed.add_field(name=section.replace("_", " ").title(), value=f"```\n{lines}\n```", inline=False)
+        lines = "\n".join(f"{name}: {value}" for name, value in _build_flight.stats().items())
+        embed.add_field(name="Character Build Coalescing", value=f"```\n{lines}\n```", inline=False)
+        lines = "\n".join(f"{name}: {value}" for name, value in self.parsing_service.stats().items())
+        embed.add_field(name="Parsing", value=f"```\n{lines}\n```", inline=False)
+        lines = "\n".join(f"{name}: {value}" for name, value in self.db_service.stats().items())
+        embed.add_field(name="Item DB Lookups", value=f"```\n{lines}\n```", inline=False)
+        if self.snapshot_store:
+            lines = "\n".join(f"{name}: {value}" for name, value in self.snapshot_store.stats().items())
+            embed.add_field(name="Snapshots", value=f"```\n{lines}\n```", inline=False)
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    @commands.is_owner()
+    async def reloadtalents(self, ctx: commands.Context):
+        """(Owner only) Reloads the talent templates data file."""
+        try:
+            count = talent_registry.load()
+            await ctx.send(f"Talent data reloaded: **{count}** classes.")
+        except Exception as e:
+            logger.error(f"Talent data reload failed: {e}")
+            await ctx.send(embed=create_error_embed(
+                "Talent Data Reload Failed", f"The previous data is still in use.\n```\n{str(e)[:1800]}\n```"
+            ))
+
+    @commands.command()
+    @commands.is_owner()
+    async def reloaditems(self, ctx: commands.Context):
+        """(Owner only) Reloads the item catalog (from the database, or re-maps the catalog file)."""
+        async with ctx.typing():
+            try:
+                count = await self.item_catalog.load()
+                await ctx.send(f"Item catalog reloaded: **{count}** items.")
+            except Exception as e:
+                logger.exception(f"Item catalog reload failed: {e}")
+                await ctx.send(embed=create_error_embed(description="Item catalog reload failed, the previous copy is still in use."))
+
 
 # --- Setup Function ---
 async def setup(bot: commands.Bot):
     # Get loop for DB service
     loop = asyncio.get_running_loop()
-    db_service = DatabaseService(loop)
+    db_service = create_database_service(loop) # MySQL or the embedded SQLite file (DATABASE_BACKEND)
+
+    # Create shared aiohttp session (connector limits, keep-alive, DNS cache and timeouts from config)
+    with startup_timer.phase("http session"):
+        http_session, connection_stats = create_http_session()
 
-    # Create shared aiohttp session
-    http_session = aiohttp.ClientSession(loop=loop)
+        # Create client service
+        warmane_client = WarmaneClient(http_session, connection_stats)
 
-    # Create client service
-    warmane_client = WarmaneClient(http_session)
+    # Start the HTML parsing pool early, before the gateway spins up its threads
+    with startup_timer.phase("parsing pool"):
+        parsing_service = ParsingService()
+        await parsing_service.start()
+
+    # Item lookups: a compiled mmap'd catalog file if configured, else the items table preloaded into memory
+    catalog_file = getattr(config, "ITEM_CATALOG_FILE", "")
+    if catalog_file:
+        item_catalog = MappedItemCatalog(catalog_file, db_service)
+        try:
+            with startup_timer.phase("item catalog (mmap)"):
+                await item_catalog.load()
+        except Exception as e:
+            # Same as without a catalog file: the in-memory catalog, backed by the database
+            logger.critical(f"Could not map item catalog file {catalog_file}, using the database instead: {e}")
+            item_catalog = ItemCatalog(db_service)
+    else:
+        item_catalog = ItemCatalog(db_service)
+
+    # Built characters persist across restarts in a local SQLite file (empty path disables)
+    snapshot_store = None
+    snapshot_path = getattr(config, "SNAPSHOT_DB_PATH", "")
+    if snapshot_path:
+        snapshot_store = SnapshotStore(snapshot_path)
+        try:
+            with startup_timer.phase("snapshot store"):
+                await snapshot_store.open()
+        except Exception as e:
+            logger.error(f"Could not open snapshot store {snapshot_path}, continuing without it: {e}")
+            snapshot_store.close()
+            snapshot_store = None
 
     # Add cog with dependencies
-    await bot.add_cog(StalkCog(bot, warmane_client, db_service))
+    await bot.add_cog(StalkCog(bot, warmane_client, db_service, item_catalog, parsing_service, snapshot_store))
 
     # Store session and db_service on bot for potential cleanup if needed
     # Or handle cleanup in Cog's unload method
     bot.http_session = http_session # Example: store session
     bot.db_service = db_service # Example: store db service
+    bot.parsing_service = parsing_service
+    bot.item_catalog = item_catalog
+    bot.snapshot_store = snapshot_store
 
     # Connect DB after adding cog (or before, depending on preference)
     try:
-        await db_service.connect()
+        with startup_timer.phase("db connect"):
+            await db_service.connect()
     except Exception:
          # Bot should probably not start if DB fails
          logger.critical("DATABASE CONNECTION FAILED. StalkCog may not function.")
          # Optionally raise an error to stop bot startup
          # raise ConnectionError("Failed to connect to the database.")
+         return
+
+    if isinstance(item_catalog, ItemCatalog) and getattr(config, "ITEM_CATALOG_ENABLED", True):
+        try:
+            with startup_timer.phase("item catalog preload"):
+                await item_catalog.load()
+        except Exception as e:
+            # Lookups keep going to the database until a successful reload
+            logger.error(f"Item catalog preload failed, falling back to DB lookups: {e}")
 
 async def teardown(bot: commands.Bot):
      # Clean up resources
@@ -487,4 +1003,10 @@ async def teardown(bot: commands.Bot):
      if hasattr(bot, 'db_service') and bot.db_service:
           await bot.db_service.close()
           logger.info("Database pool closed.")
+     if hasattr(bot, 'parsing_service') and bot.parsing_service:
+          bot.parsing_service.close()
+     if isinstance(getattr(bot, 'item_catalog', None), MappedItemCatalog):
+          bot.item_catalog.close()
+     if getattr(bot, 'snapshot_store', None):
+          bot.snapshot_store.close()
 
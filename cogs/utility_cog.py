@@ -72,23 +72,40 @@ class UtilityCog(commands.Cog):
 
         # Stalk Cog Commands (assuming prefix is '.bot ')
         embed.add_field(
-            name="🔍 `.bot stalk <character> [realm]`",
+            name="🔍 `.bot stalk <character> [realm] [fresh]`",
             value="Shows a detailed summary for a character. Realm defaults to Icecrown.\n"
+                  "Armory pages are cached for a few minutes, add `fresh` to force a refetch.\n"
                   "*Example:* `.bot stalk Puredecay Lordaeron`",
             inline=False
         )
         embed.add_field(
             name="👥 `.bot multistalk <char1> [char2-realm] ...`",
-            value="Shows a quick overview (GS, Ench, Gem, Spec, Prof) for multiple characters. Realm defaults to Icecrown.\n"
+            value="Shows a quick overview (GS, Ench, Gem, Spec, Prof) for up to 100 characters, filled in as results arrive "
+                  "(long lists get ◀/▶ pages). Realm defaults to Icecrown.\n"
                   "*Example:* `.bot multistalk Puredecay Cloudsky-Lordaeron Qtqueenx`",
             inline=False
         )
         embed.add_field(
             name="✨ `.bot checkTalents <character> [realm]`",
-            value="Checks character talents against predefined templates (DK, Paladin supported).\n"
+            value="Checks character talents against predefined templates (Death Knight and Paladin so far).\n"
                   "*Example:* `.bot checkTalents Puredecay`",
             inline=False
         )
+        embed.add_field(
+            name="📋 `.bot raidtalents <char1> [char2-realm] ...`",
+            value="Audits the talents of up to 40 characters at once and shows one table of issues "
+                  "(Death Knight and Paladin so far).\n"
+                  "*Example:* `.bot raidtalents Puredecay Cloudsky-Lordaeron Qtqueenx`",
+            inline=False
+        )
+        embed.add_field(
+            name="🏰 `.bot guildscan <guild>[-realm]`",
+            value="Scans a whole guild roster (GS, Ench, Gem, Spec, Prof per member) and sends the report as a file. "
+                  "Recently seen characters are reused from stored data. "
+                  "Give the realm after a dash or after the quoted guild name.\n"
+                  "*Example:* `.bot guildscan Knights of Icecrown-Lordaeron` or `.bot guildscan \"Knights of Icecrown\" Lordaeron`",
+            inline=False
+        )
 
         # Utility Cog Commands
         embed.add_field(
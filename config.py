@@ -3,6 +3,48 @@ DATABASE_PASSWORD = ""
 DATABASE_HOST = ""
 DATABASE_NAME = ""
 DATABASE_PORT = 3306
+DATABASE_BACKEND = "mysql" # "mysql" (settings above) or "sqlite" (local file built from items.sql, no server needed)
+ITEM_DB_PATH = "data/items.sqlite3" # SQLite backend: item database file
+ITEM_DB_SQL_FILE = "items.sql" # SQLite backend: source the file is (re)built from when missing or older
 DISCORD_TOKEN = "" 
 HTTP_USER_AGENT = "" #required, otherwse warmane.com will drop requests.
-OWNER_USER_ID = 266712430393032712 #for .bot complain command
\ No newline at end of file
+OWNER_USER_ID = 266712430393032712 #for .bot complain command
+HTML_PARSER_ENGINE = "html.parser" # "html.parser", "lxml" (needs lxml) or "selectolax" (needs selectolax)
+PARSER_WORKERS = None # Processes for HTML parsing. None = one per CPU, 0 = parse on the event loop
+ITEM_CATALOG_ENABLED = True # Preload the items table into memory at startup instead of querying the database per character
+ITEM_CATALOG_FILE = "" # Compiled catalog (python -m tools.compile_item_catalog items.sql -o items.catalog). Set to mmap it instead
+ARMORY_CACHE_TTL = 300 # Seconds an Armory page is reused before refetching (0 disables the cache)
+ARMORY_CACHE_SIZE = 512 # Max cached Armory pages (least recently used are dropped first)
+ARMORY_VALIDATOR_TTL = 86400 # Seconds to keep ETag/Last-Modified (and the body) for conditional refetches
+HTTP_CONNECTION_LIMIT = 100 # Max open connections in total
+HTTP_LIMIT_PER_HOST = 8 # Max concurrent connections to armory.warmane.com, extra requests queue for a warm one
+HTTP_KEEPALIVE_TIMEOUT = 30 # Seconds an idle connection is kept open for reuse
+HTTP_DNS_CACHE_TTL = 300 # Seconds to cache DNS lookups
+HTTP_TIMEOUT_TOTAL = 20 # Whole request, in seconds
+HTTP_TIMEOUT_CONNECT = 5 # Opening a new connection (TCP/TLS handshake), in seconds. Waiting for a free one only counts against the total
+HTTP_TIMEOUT_READ = 10 # Max silence while reading the response, in seconds
+ARMORY_RATE_LIMIT = 5 # Max requests per second to the Armory (0 disables the limiter)
+ARMORY_RATE_BURST = 10 # Requests that may go out back to back before pacing kicks in
+ARMORY_RATE_MIN = 0.5 # Floor for the adaptive rate, in requests per second
+ARMORY_RATE_INCREASE = 0.1 # Requests/second added back per healthy response
+ARMORY_RATE_DECREASE = 0.5 # Rate multiplier on a 429/503, timeout or slow response
+ARMORY_SLOW_RESPONSE = 3.0 # Seconds until headers above which a response counts as "slow"
+ARMORY_RETRY_ATTEMPTS = 3 # Attempts per page for transient errors (5xx, 429, timeouts, connection errors)
+ARMORY_RETRY_BASE_DELAY = 0.5 # Seconds, doubled per retry (with full jitter)
+ARMORY_RETRY_MAX_DELAY = 4.0 # Cap for a single backoff, in seconds
+ARMORY_BREAKER_THRESHOLD = 5 # Consecutive failed attempts before the Armory is treated as down
+ARMORY_BREAKER_RESET = 30 # Seconds to fail fast before probing the Armory again
+SNAPSHOT_DB_PATH = "data/snapshots.sqlite3" # Built characters are kept here across restarts (empty disables)
+SNAPSHOT_MAX_AGE = 600 # Seconds a stored character is served without going to the Armory
+TALENT_DATA_FILE = "" # Talent templates/trees/spec rules (empty uses talents/data/talents.json)
+GUILDSCAN_CONCURRENCY = 4 # Members built at once by `.bot guildscan`
+GUILDSCAN_REQUEST_BUDGET = 300 # Max members fetched from the Armory per scan, the rest use stored data (or are skipped)
+GUILDSCAN_SNAPSHOT_MAX_AGE = 21600 # Seconds a stored character is good enough for a guild scan
+GUILDSCAN_MAX_MEMBERS = 500 # Roster entries scanned per guild
+GUILDSCAN_PROGRESS_INTERVAL = 5 # Seconds between progress message edits
+TABLE_EDIT_INTERVAL = 1.0 # Min seconds between edits of a live multistalk table (Discord allows ~5 edits per 5s)
+MULTISTALK_LIMIT = 100 # Max names per multistalk
+MULTISTALK_CONCURRENCY = 8 # Characters built at once by multistalk
+MULTISTALK_PAGE_SIZE = 15 # Table rows per page (pages are switched with buttons)
+ITEM_BATCH_WINDOW = 0.005 # Seconds item lookups are collected into one DB query (0 queries per call)
+ITEM_BATCH_MAX_IDS = 1000 # Send the batched query early once this many item IDs are waiting
@@ -1,10 +1,22 @@
 # models/character.py
+import sys
+import time
 from typing import List, Dict, Optional
 from models.item import Item
+from models.gear_summary import GearSummary
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
 
 class Character:
     """Represents a World of Warcraft character."""
 
+    __slots__ = (
+        "name", "realm", "level", "race", "char_class", "guild", "professions", "specializations",
+        "items", "glyphs", "active_spec_id", "gear_score", "avg_item_level", "talent_strings",
+        "fetched_at", "has_talents", "talents_fetched_at", "_gear_summary",
+    )
+
     def __init__(
         self,
         name: str,
@@ -22,20 +34,31 @@ class Character:
         active_spec_id: Optional[str] = None, # '0' or '1'
         gear_score: float = 0.0,
         avg_item_level: float = 0.0,
+        talent_strings: Optional[Dict[str, str]] = None, # spec_id -> talent points string
+        fetched_at: Optional[float] = None, # Unix time the profile page was fetched
+        has_talents: bool = False, # False if glyphs/talent_strings are empty (no talents page, now or before)
+        talents_fetched_at: Optional[float] = None, # Unix time the talents page was fetched, may predate fetched_at
+        gear_summary: Optional[GearSummary] = None, # Computed from items on first access if not given
     ):
+        # Realm/race/class/guild/profession strings repeat across characters, keep one copy of each
         self.name = name
-        self.realm = realm
+        self.realm = _intern(realm)
         self.level = level
-        self.race = race
-        self.char_class = char_class
-        self.guild = guild if guild else "No Guild"
-        self.professions = professions if professions else []
-        self.specializations = specializations if specializations else []
+        self.race = _intern(race)
+        self.char_class = _intern(char_class)
+        self.guild = _intern(guild) if guild else "No Guild"
+        self.professions = [_intern(p) for p in professions] if professions else []
+        self.specializations = [_intern(s) for s in specializations] if specializations else []
         self.items = items if items else {}
         self.glyphs = glyphs if glyphs else {}
         self.active_spec_id = active_spec_id
         self.gear_score = gear_score
         self.avg_item_level = avg_item_level
+        self.talent_strings = talent_strings if talent_strings else {}
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.has_talents = has_talents
+        self.talents_fetched_at = talents_fetched_at if has_talents else None
+        self._gear_summary = gear_summary
 
     def get_level_race_class_str(self) -> str:
         """Returns a formatted string for level, race, class."""
@@ -53,6 +76,53 @@ class Character:
         from utils.constants import WARMANE_ARMORY_URL # Local import
         return f"{WARMANE_ARMORY_URL}/{self.name.capitalize()}/{self.realm.capitalize()}/summary"
 
+    @property
+    def gear_summary(self) -> GearSummary:
+        """GearScore, ilvl and missing enchants/gems for the equipped items."""
+        if self._gear_summary is None:
+            self._gear_summary = GearSummary.from_items(self.items, self.char_class, self.professions)
+        return self._gear_summary
+
+    def age(self) -> float:
+        """Seconds since the data was fetched from the Armory."""
+        return time.time() - self.fetched_at
+
+    def talents_age(self) -> float:
+        """Seconds since the talents page was fetched (infinite without talents)."""
+        if self.talents_fetched_at is None:
+            return float("inf")
+        return time.time() - self.talents_fetched_at
+
+    def to_dict(self) -> dict:
+        """Plain-dict (JSON-safe) form for the snapshot store."""
+        return {
+            "name": self.name,
+            "realm": self.realm,
+            "level": self.level,
+            "race": self.race,
+            "char_class": self.char_class,
+            "guild": self.guild,
+            "professions": self.professions,
+            "specializations": self.specializations,
+            "items": {str(item_id): [item.to_dict() for item in items] for item_id, items in self.items.items()},
+            "glyphs": self.glyphs,
+            "active_spec_id": self.active_spec_id,
+            "gear_score": self.gear_score,
+            "avg_item_level": self.avg_item_level,
+            "talent_strings": self.talent_strings,
+            "fetched_at": self.fetched_at,
+            "has_talents": self.has_talents,
+            "talents_fetched_at": self.talents_fetched_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Character":
+        data = dict(data)
+        data["items"] = {
+            int(item_id): [Item.from_dict(item) for item in items] for item_id, items in data.get("items", {}).items()
+        }
+        return cls(**data)
+
     def __repr__(self):
         return f"<Character name='{self.name}' realm='{self.realm}' class='{self.char_class}'>"
 
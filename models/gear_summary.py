@@ -0,0 +1,110 @@
+# models/gear_summary.py
+from typing import Dict, List, Optional
+from models.item import Item
+from models.item_type import ItemTypes
+from utils.helpers import missing_enchant_message, missing_gems_message
+
+# Slots that don't count towards GearScore or average item level
+_COSMETIC_SLOTS = {ItemTypes.SHIRT, ItemTypes.TABARD}
+_OFF_HAND_SLOTS = {ItemTypes.SHIELD, ItemTypes.OFF_HAND}
+
+class GearSummary:
+    """
+    GearScore, average item level and missing enchants/gems, computed in one walk over a
+    character's items. Gives the same results as the separate WarmaneParser calculations:
+    each slot type is taken from the first item_id group that has it, using the highest
+    GearScore item for GS and the highest item level item for everything else.
+    """
+
+    __slots__ = ("slots", "gear_score", "avg_item_level", "missing_enchants", "missing_gems")
+
+    def __init__(
+        self,
+        slots: Dict[ItemTypes, Item], # Slot type -> best item (by item level)
+        gear_score: float,
+        avg_item_level: float,
+        missing_enchants: List[ItemTypes],
+        missing_gems: List[ItemTypes],
+    ):
+        self.slots = slots
+        self.gear_score = gear_score
+        self.avg_item_level = avg_item_level
+        self.missing_enchants = missing_enchants
+        self.missing_gems = missing_gems
+
+    @classmethod
+    def from_items(cls, items: Dict[int, List[Item]], char_class: Optional[str], professions: List[str]) -> "GearSummary":
+        char_class = char_class or ""
+        slots: Dict[ItemTypes, Item] = {}
+        gearscore = 0.0
+        two_handed_scores = []
+        main_hand_score = 0.0
+        off_hand_score = 0.0
+        ilvl_total = 0
+        ilvl_count = 0
+        missing_enchants: List[ItemTypes] = []
+        missing_gems: List[ItemTypes] = []
+
+        for item_list in items.values():
+            # Best item per type within this item_id group (first one wins ties, like max())
+            best_gs: Dict[ItemTypes, Item] = {}
+            best_ilvl: Dict[ItemTypes, Item] = {}
+            for item in item_list:
+                item_type = item.item_type
+                if not item_type or item_type in slots:
+                    continue # Unknown type, or slot already taken by an earlier group
+                current = best_gs.get(item_type)
+                if current is None or item.gear_score > current.gear_score:
+                    best_gs[item_type] = item
+                current = best_ilvl.get(item_type)
+                if current is None or item.item_level > current.item_level:
+                    best_ilvl[item_type] = item
+
+            for item_type, best_item in best_ilvl.items():
+                slots[item_type] = best_item
+
+                if best_item.has_enchant_slot(char_class, professions) and best_item.enchant_id is None:
+                    missing_enchants.append(item_type)
+                if best_item.gems_missing():
+                    missing_gems.append(item_type)
+
+                if item_type in _COSMETIC_SLOTS:
+                    continue
+                ilvl_total += best_item.item_level
+                ilvl_count += 1
+
+                score = best_gs[item_type].gear_score
+                if item_type == ItemTypes.WEAPON_2H:
+                    two_handed_scores.append(score)
+                elif item_type == ItemTypes.WEAPON_1H:
+                    main_hand_score = max(main_hand_score, score)
+                elif item_type in _OFF_HAND_SLOTS:
+                    off_hand_score = max(off_hand_score, score)
+                else:
+                    gearscore += score
+
+        # A 2H counts as main hand + off hand (averaged if several are listed)
+        if two_handed_scores:
+            gearscore += sum(two_handed_scores) / len(two_handed_scores)
+        else:
+            gearscore += main_hand_score + off_hand_score
+
+        return cls(
+            slots=slots,
+            gear_score=round(gearscore, 2),
+            avg_item_level=round(ilvl_total / ilvl_count, 2) if ilvl_count else 0.0,
+            missing_enchants=missing_enchants,
+            missing_gems=missing_gems,
+        )
+
+    def enchant_status(self) -> str:
+        return missing_enchant_message(self.missing_enchants)
+
+    def gem_status(self) -> str:
+        return missing_gems_message(self.missing_gems)
+
+    def __repr__(self):
+        return (
+            f"<GearSummary gs={self.gear_score} ilvl={self.avg_item_level} "
+            f"missing_enchants={len(self.missing_enchants)} missing_gems={len(self.missing_gems)}>"
+        )
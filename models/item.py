@@ -1,10 +1,16 @@
 # models/item.py
-from typing import List, Optional
+import sys
+from typing import List, Optional, Sequence
 from models.item_type import ItemTypes
 
 class Item:
     """Represents an item fetched from the database."""
 
+    __slots__ = (
+        "item_id", "name", "item_level", "quality", "item_type", "requires", "char_class",
+        "subclass", "gem_slots", "gear_score", "enchant_id", "equipped_gems",
+    )
+
     def __init__(
         self,
         item_id: int,
@@ -35,6 +41,36 @@ class Item:
         # Ensure equipped_gems is always a list if provided
         self.equipped_gems: List[str] = equipped_gems if equipped_gems is not None else []
 
+    @classmethod
+    def from_row(cls, row: Sequence, enchant_id: Optional[str] = None, equipped_gems: Optional[List[str]] = None) -> "Item":
+        """Builds an Item from a DB/catalog row tuple (ITEM_COLUMNS order), reading fields by position."""
+        item_id, name, item_level, quality, item_type_val, requires, char_class, subclass, gem_slots, gear_score = row
+        return cls(
+            item_id, sys.intern(name) if name else name, item_level, quality, item_type_val,
+            requires, char_class, subclass, gem_slots, gear_score, enchant_id, equipped_gems,
+        )
+
+    def to_dict(self) -> dict:
+        """Plain-dict form for the snapshot store (see from_dict)."""
+        return {
+            "item_id": self.item_id,
+            "name": self.name,
+            "item_level": self.item_level,
+            "quality": self.quality,
+            "item_type_val": int(self.item_type) if self.item_type else 0,
+            "requires": self.requires,
+            "char_class": self.char_class,
+            "subclass": self.subclass,
+            "gem_slots": self.gem_slots,
+            "gear_score": self.gear_score,
+            "enchant_id": self.enchant_id,
+            "equipped_gems": self.equipped_gems,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Item":
+        return cls(**data)
+
     def __repr__(self):
         return (
             f"<Item id={self.item_id} name='{self.name}' "
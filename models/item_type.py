@@ -28,7 +28,7 @@ class ItemTypes(IntEnum):
     # Helper to get type by value, returns None if not found
     @classmethod
     def get_type(cls, value: int):
-        try:
-            return cls(value)
-        except ValueError:
-            return None
+        return _TYPES_BY_VALUE.get(value)
+
+# Plain dict lookup, much cheaper than the Enum constructor + ValueError for unknown types
+_TYPES_BY_VALUE = {item_type.value: item_type for item_type in ItemTypes}
@@ -1,21 +1,69 @@
 # services/database_service.py
-import aiomysql
+import asyncio
 import logging
-from typing import Dict, List, Optional, Set
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Set, Tuple
 from models.item import Item
 import config # Import your config
 
 logger = logging.getLogger(__name__)
 
-class DatabaseService:
+# Column order of the items table, as selected by every query below
+ITEM_COLUMNS = (
+    "itemID", "name", "ItemLevel", "quality", "type", "requires",
+    "class", "subclass", "gems", "GearScore",
+)
+
+class DatabaseService(ABC):
+    """
+    Read access to the items table. Implementations: MySQLDatabaseService (aiomysql pool) and
+    SQLiteDatabaseService (embedded file built from items.sql). Pick one with create_database_service().
+    """
+
+    @abstractmethod
+    async def connect(self):
+        ...
+
+    @abstractmethod
+    async def close(self):
+        ...
+
+    @abstractmethod
+    async def get_items_by_ids(self, item_ids: Set[int]) -> Dict[int, List[Tuple]]:
+        """Returns {itemID: [row tuples in ITEM_COLUMNS order]} for the IDs that exist."""
+
+    @abstractmethod
+    async def get_all_items(self) -> List[Tuple]:
+        """The whole items table as tuples in ITEM_COLUMNS order (for the in-memory ItemCatalog)."""
+
+    def stats(self) -> dict:
+        return {}
+
+
+class MySQLDatabaseService(DatabaseService):
+    """The items table on the MySQL server from config.py."""
+
     def __init__(self, loop):
         self._pool = None
         self._loop = loop
+        # Item lookups arriving within batch_window seconds of each other share one query
+        self.batch_window = getattr(config, "ITEM_BATCH_WINDOW", 0.005)
+        self.batch_max_ids = getattr(config, "ITEM_BATCH_MAX_IDS", 1000)
+        self._batch: List[Tuple[Set[int], asyncio.Future]] = [] # (requested ids, caller's future)
+        self._batch_ids: Set[int] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks = set()
+        # Stats
+        self.lookups = 0
+        self.queries = 0
+        self.ids_requested = 0
+        self.ids_queried = 0
 
     async def connect(self):
         """Establishes the database connection pool."""
         if self._pool:
             return # Already connected
+        import aiomysql # Deferred, only needed for this backend
         try:
             self._pool = await aiomysql.create_pool(
                 host=config.DATABASE_HOST,
@@ -36,16 +84,29 @@ class DatabaseService:
 
     async def close(self):
         """Closes the database connection pool."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for _, future in self._batch: # Lookups still waiting for their batch get nothing
+            if not future.done():
+                future.set_result({})
+        self._batch, self._batch_ids = [], set()
+        tasks = list(self._batch_tasks) # Batches mid-query: cancel them before their pool goes away
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         if self._pool:
             self._pool.close()
             await self._pool.wait_closed()
             logger.info("Database connection pool closed.")
             self._pool = None
 
-    async def get_items_by_ids(self, item_ids: Set[int]) -> Dict[int, List[Dict]]:
+    async def get_items_by_ids(self, item_ids: Set[int]) -> Dict[int, List[Tuple]]:
         """
         Fetches item details from the database for a set of item IDs.
-        Returns a dictionary mapping itemID to a list of raw item data dicts.
+        Returns a dictionary mapping itemID to a list of row tuples in ITEM_COLUMNS order.
+        Concurrent calls are micro-batched: their IDs are merged into one query and the rows
+        are handed back to each caller.
         """
         if not self._pool:
             logger.error("Database pool not initialized.")
@@ -53,25 +114,75 @@ class DatabaseService:
         if not item_ids:
             return {}
 
-        results: Dict[int, List[Dict]] = {}
-        query = """
-            SELECT itemID, name, ItemLevel, quality, type, requires, class,
-                   subclass, gems, GearScore
-            FROM items
-            WHERE itemID IN (%s)
-        """
+        item_ids = set(item_ids)
+        self.lookups += 1
+        self.ids_requested += len(item_ids)
+        if self.batch_window <= 0:
+            return await self._query_items(item_ids)
+
+        future = self._loop.create_future()
+        self._batch.append((item_ids, future))
+        self._batch_ids.update(item_ids)
+        if len(self._batch_ids) >= self.batch_max_ids:
+            self._flush_batch() # Big enough already, don't wait for the window
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.batch_window, self._flush_batch)
+        return await future
+
+    def _flush_batch(self):
+        """Starts the query for everything collected so far."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, ids = self._batch, self._batch_ids
+        self._batch, self._batch_ids = [], set()
+        if not batch:
+            return
+        task = self._loop.create_task(self._run_batch(batch, ids))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[Set[int], asyncio.Future]], ids: Set[int]):
+        try:
+            rows = await self._query_items(ids)
+        except asyncio.CancelledError:
+            # Cancelled by close(): like the lookups still waiting for a batch, these get nothing
+            for _, future in batch:
+                if not future.done():
+                    future.set_result({})
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            # The callers got the error through their futures; raising here would only leave
+            # an unretrieved exception on this fire-and-forget task.
+            logger.error(f"Batched item lookup of {len(ids)} IDs failed: {e}")
+            return
+        for wanted, future in batch:
+            if not future.done(): # The caller may have been cancelled meanwhile
+                future.set_result({item_id: rows[item_id] for item_id in wanted if item_id in rows})
+
+    async def _query_items(self, item_ids: Set[int]) -> Dict[int, List[Tuple]]:
+        """One SELECT ... IN (...) for the given IDs. Returns {} on errors."""
+        if not self._pool:
+            return {} # Closed while the batch was waiting
+        results: Dict[int, List[Tuple]] = {}
+        query = f"SELECT {', '.join(ITEM_COLUMNS)} FROM items WHERE itemID IN (%s)"
         # Create placeholders for the IN clause
         placeholders = ', '.join(['%s'] * len(item_ids))
         formatted_query = query % placeholders
+        self.queries += 1
+        self.ids_queried += len(item_ids)
 
         try:
             async with self._pool.acquire() as conn:
-                async with conn.cursor(aiomysql.DictCursor) as cur:
+                async with conn.cursor() as cur: # Plain tuples, read by position (see Item.from_row)
                     await cur.execute(formatted_query, tuple(item_ids))
                     fetched_items = await cur.fetchall()
 
                     for item_data in fetched_items:
-                        item_id = item_data['itemID']
+                        item_id = item_data[0]
                         if item_id not in results:
                             results[item_id] = []
                         results[item_id].append(item_data)
@@ -83,4 +194,49 @@ class DatabaseService:
 
         return results
 
+    def stats(self) -> dict:
+        """Item lookup counters: callers vs. queries actually sent."""
+        return {
+            "backend": "mysql",
+            "lookups": self.lookups,
+            "queries": self.queries,
+            "ids_requested": self.ids_requested,
+            "ids_queried": self.ids_queried, # Lower than requested when batched lookups overlapped
+        }
+
+    async def get_all_items(self) -> List[Tuple]:
+        """
+        Fetches the whole items table as plain tuples in ITEM_COLUMNS order.
+        Used to preload the in-memory ItemCatalog.
+        """
+        if not self._pool:
+            logger.error("Database pool not initialized.")
+            return []
+
+        query = f"SELECT {', '.join(ITEM_COLUMNS)} FROM items"
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query)
+                    return list(await cur.fetchall())
+        except Exception as e:
+            logger.exception(f"Error fetching all items from DB: {e}")
+            return []
+
     # Add other database methods here if needed
+
+
+DATABASE_BACKENDS = ("mysql", "sqlite")
+
+def create_database_service(loop, backend: Optional[str] = None) -> DatabaseService:
+    """Returns the items backend named by config.DATABASE_BACKEND ("mysql" or "sqlite"), not yet connected."""
+    backend = (backend or getattr(config, "DATABASE_BACKEND", "mysql")).lower()
+    if backend == "sqlite":
+        from services.sqlite_item_db import SQLiteDatabaseService # Deferred, avoids a circular import
+        return SQLiteDatabaseService(
+            getattr(config, "ITEM_DB_PATH", "data/items.sqlite3"),
+            sql_path=getattr(config, "ITEM_DB_SQL_FILE", "items.sql") or None,
+        )
+    if backend != "mysql":
+        raise ValueError(f"Unknown DATABASE_BACKEND {backend!r} (expected one of {', '.join(DATABASE_BACKENDS)})")
+    return MySQLDatabaseService(loop)
@@ -0,0 +1,107 @@
+# services/http_session.py
+import aiohttp
+import logging
+import time
+from typing import Tuple
+import config # Import your config
+
+logger = logging.getLogger(__name__)
+
+class ConnectionStats:
+    """Connection pool counters, filled in by aiohttp trace hooks."""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.queued = 0 # Requests that had to wait for a free connection (per-host limit)
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+        self.errors = 0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_connection_create_end.append(self._on_connection_create_end)
+        trace.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace.on_connection_queued_start.append(self._on_connection_queued_start)
+        trace.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        trace.on_request_exception.append(self._on_request_exception)
+        return trace
+
+    async def _on_request_start(self, session, ctx, params):
+        self.requests += 1
+
+    async def _on_connection_create_end(self, session, ctx, params):
+        self.new_connections += 1
+        _mark_connected(ctx)
+
+    async def _on_connection_reuseconn(self, session, ctx, params):
+        self.reused_connections += 1
+        _mark_connected(ctx)
+
+    async def _on_connection_queued_start(self, session, ctx, params):
+        self.queued += 1
+
+    async def _on_dns_cache_hit(self, session, ctx, params):
+        self.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, session, ctx, params):
+        self.dns_cache_misses += 1
+
+    async def _on_request_exception(self, session, ctx, params):
+        self.errors += 1
+
+    def stats(self) -> dict:
+        connections = self.new_connections + self.reused_connections
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_rate": round(self.reused_connections / connections, 3) if connections else 0.0,
+            "queued_for_connection": self.queued,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+            "errors": self.errors,
+        }
+
+
+def _mark_connected(ctx):
+    """
+    Notes when a request got its connection, for callers that pass a dict as trace_request_ctx.
+    Time from there excludes the wait for a free connection under limit_per_host.
+    """
+    if isinstance(ctx.trace_request_ctx, dict):
+        ctx.trace_request_ctx["connected_at"] = time.monotonic()
+
+
+def create_http_session() -> Tuple[aiohttp.ClientSession, ConnectionStats]:
+    """
+    Builds the shared aiohttp session with the connector limits, keep-alive, DNS cache
+    and timeouts from config.py. Must be called from inside the running event loop.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=getattr(config, "HTTP_CONNECTION_LIMIT", 100),
+        limit_per_host=getattr(config, "HTTP_LIMIT_PER_HOST", 8),
+        keepalive_timeout=getattr(config, "HTTP_KEEPALIVE_TIMEOUT", 30),
+        ttl_dns_cache=getattr(config, "HTTP_DNS_CACHE_TTL", 300),
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=getattr(config, "HTTP_TIMEOUT_TOTAL", 20),
+        # sock_connect, not connect: connect also covers the wait for a free connection under
+        # limit_per_host, so a busy but healthy Armory would time out queued requests (and trip the breaker)
+        sock_connect=getattr(config, "HTTP_TIMEOUT_CONNECT", 5),
+        sock_read=getattr(config, "HTTP_TIMEOUT_READ", 10),
+    )
+    stats = ConnectionStats()
+    session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        trace_configs=[stats.trace_config()],
+    )
+    logger.info(
+        f"HTTP session created (per-host limit {connector.limit_per_host}, "
+        f"keep-alive {getattr(config, 'HTTP_KEEPALIVE_TIMEOUT', 30)}s, total timeout {timeout.total}s)."
+    )
+    return session, stats
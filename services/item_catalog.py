@@ -0,0 +1,102 @@
+# services/item_catalog.py
+import logging
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from services.database_service import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+class _CatalogData:
+    """One immutable, fully loaded copy of the items table, stored column-wise."""
+    __slots__ = (
+        'index', 'item_ids', 'names', 'item_level', 'quality', 'item_type', 'requires',
+        'item_class', 'subclass', 'gems', 'gear_score',
+    )
+
+    def __init__(self, rows: Iterable[Sequence]):
+        self.index: Dict[int, int] = {} # itemID -> row position
+        self.item_ids = array('I')
+        self.names: List[str] = []
+        self.item_level = array('H')
+        self.quality = array('B')
+        self.item_type = array('B')
+        self.requires = array('B')
+        self.item_class = array('B')
+        self.subclass = array('B')
+        self.gems = array('H')
+        self.gear_score = array('h') # GearScore is a signed SMALLINT
+
+        for item_id, name, ilvl, quality, item_type, requires, item_class, subclass, gems, gear_score in rows:
+            self.index[item_id] = len(self.names)
+            self.item_ids.append(item_id)
+            self.names.append(name)
+            # NULL columns are stored as 0, which is what Item falls back to anyway
+            self.item_level.append(int(ilvl or 0))
+            self.quality.append(quality or 0)
+            self.item_type.append(item_type or 0)
+            self.requires.append(requires or 0)
+            self.item_class.append(item_class or 0)
+            self.subclass.append(subclass or 0)
+            self.gems.append(gems or 0)
+            self.gear_score.append(gear_score or 0)
+
+    def __len__(self):
+        return len(self.names)
+
+    def row(self, pos: int) -> Tuple:
+        """Rebuilds a row tuple in ITEM_COLUMNS order (same as DatabaseService.get_items_by_ids)."""
+        return (
+            self.item_ids[pos], self.names[pos], self.item_level[pos], self.quality[pos],
+            self.item_type[pos], self.requires[pos], self.item_class[pos], self.subclass[pos],
+            self.gems[pos], self.gear_score[pos],
+        )
+
+
+class ItemCatalog:
+    """
+    The whole (static) items table held in memory, loaded once at startup.
+    Answers get_items_by_ids() from RAM with no I/O; falls back to the database until loaded.
+    """
+
+    def __init__(self, db_service: DatabaseService):
+        self._db_service = db_service
+        self._data: Optional[_CatalogData] = None
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    def __len__(self):
+        return len(self._data) if self._data else 0
+
+    async def load(self) -> int:
+        """
+        Loads (or reloads) the full table. The new copy is built on the side and swapped in
+        with one assignment, so lookups never see a half-loaded catalog.
+        Returns the number of items loaded.
+        """
+        start = time.perf_counter()
+        rows = await self._db_service.get_all_items()
+        if not rows:
+            raise RuntimeError("items table returned no rows, keeping the current catalog.")
+        data = _CatalogData(rows)
+        self._data = data # Atomic swap
+        self.loaded_at = time.time()
+        logger.info(f"Item catalog loaded {len(data)} items in {(time.perf_counter() - start) * 1000:.0f} ms.")
+        return len(data)
+
+    async def get_items_by_ids(self, item_ids: Set[int]) -> Dict[int, List[Tuple]]:
+        """Same contract as DatabaseService.get_items_by_ids, served from memory once loaded."""
+        data = self._data # Take one snapshot so a concurrent reload can't mix two copies
+        if data is None:
+            return await self._db_service.get_items_by_ids(item_ids)
+
+        results: Dict[int, List[Tuple]] = {}
+        index = data.index
+        for item_id in item_ids:
+            pos = index.get(item_id)
+            if pos is not None:
+                results[item_id] = [data.row(pos)]
+        return results
@@ -0,0 +1,160 @@
+# services/item_catalog_file.py
+import bisect
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from services.database_service import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+# --- File format (all little-endian) ---
+# header   : magic, record count, names blob size            (HEADER, padded to 16 bytes)
+# id index : count x uint32 itemID, sorted ascending          (binary searched in place)
+# records  : count x RECORD, same order as the id index
+# names    : UTF-8 item names, addressed by (offset, length) from each record
+MAGIC = b"ITEMCAT1"
+HEADER = struct.Struct("<8sII")
+HEADER_SIZE = 16
+# name offset, name length, ItemLevel, quality, type, requires, class, subclass, gems, GearScore
+RECORD = struct.Struct("<IHHBBBBBHh")
+
+def write_catalog_file(rows: Iterable[Sequence], path: str) -> int:
+    """
+    Compiles item rows (tuples in ITEM_COLUMNS order) into a catalog file.
+    Writes to a temp file and renames it over `path`, so running bots never map a half-written file.
+    Returns the number of records written.
+    """
+    rows = sorted(rows, key=lambda r: r[0])
+    ids = array('I')
+    records = bytearray()
+    names = bytearray()
+    for item_id, name, ilvl, quality, item_type, requires, item_class, subclass, gems, gear_score in rows:
+        if ids and ids[-1] == item_id:
+            continue # itemID is the primary key, keep the first row
+        encoded = (name or "").encode("utf-8")
+        ids.append(item_id)
+        records += RECORD.pack(
+            len(names), len(encoded), ilvl or 0, quality or 0, item_type or 0, requires or 0,
+            item_class or 0, subclass or 0, gems or 0, gear_score or 0,
+        )
+        names += encoded
+
+    if sys.byteorder != "little":
+        ids.byteswap()
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(ids), len(names)).ljust(HEADER_SIZE, b"\0"))
+        f.write(ids.tobytes())
+        f.write(records)
+        f.write(names)
+    os.replace(tmp_path, path)
+    return len(ids)
+
+
+class _MappedFile:
+    """One open, memory-mapped catalog file."""
+    __slots__ = ('file', 'map', 'count', 'ids', 'records_offset', 'names_offset')
+
+    def __init__(self, path: str):
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+        magic, self.count, names_size = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an item catalog file.")
+        ids_size = 4 * self.count
+        self.records_offset = HEADER_SIZE + ids_size
+        self.names_offset = self.records_offset + RECORD.size * self.count
+        if len(self.map) != self.names_offset + names_size:
+            self.close()
+            raise ValueError(f"{path} is truncated or corrupt.")
+
+        id_bytes = memoryview(self.map)[HEADER_SIZE:HEADER_SIZE + ids_size]
+        if sys.byteorder == "little":
+            self.ids = id_bytes.cast('I') # Searched in place, no copy
+        else:
+            self.ids = array('I', id_bytes.tobytes())
+            self.ids.byteswap()
+        id_bytes.release()
+
+    def row(self, item_id: int) -> Optional[Tuple]:
+        pos = bisect.bisect_left(self.ids, item_id)
+        if pos == self.count or self.ids[pos] != item_id:
+            return None
+        name_offset, name_len, *fields = RECORD.unpack_from(self.map, self.records_offset + pos * RECORD.size)
+        start = self.names_offset + name_offset
+        return (item_id, self.map[start:start + name_len].decode("utf-8"), *fields)
+
+    def close(self):
+        ids = getattr(self, 'ids', None) # Not set yet if the header check failed
+        if isinstance(ids, memoryview):
+            ids.release()
+        self.map.close()
+        self.file.close()
+
+
+class MappedItemCatalog:
+    """
+    Read-only item catalog backed by a compiled, memory-mapped file (see tools/compile_item_catalog.py).
+    Processes mapping the same file share one page-cached copy, and startup is just an mmap().
+    Same interface as ItemCatalog, so the cog can use either: until the file is mapped, lookups go to
+    the database (if one was given).
+    """
+
+    def __init__(self, path: str, db_service: Optional[DatabaseService] = None):
+        self.path = path
+        self._db_service = db_service
+        self._file: Optional[_MappedFile] = None
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._file is not None
+
+    def __len__(self):
+        return self._file.count if self._file else 0
+
+    async def load(self) -> int:
+        """(Re)maps the catalog file. The old mapping stays valid until the new one is swapped in."""
+        start = time.perf_counter()
+        new_file = _MappedFile(self.path)
+        old_file, self._file = self._file, new_file # Atomic swap
+        self.loaded_at = time.time()
+        if old_file:
+            old_file.close() # Lookups never await mid-read, so nothing still uses the old mapping
+        logger.info(f"Mapped item catalog {self.path} ({new_file.count} items) in {(time.perf_counter() - start) * 1000:.1f} ms.")
+        return new_file.count
+
+    def get_row(self, item_id: int) -> Optional[Tuple]:
+        """Returns the item's fields as a tuple in ITEM_COLUMNS order, or None."""
+        return self._file.row(item_id) if self._file else None
+
+    async def get_items_by_ids(self, item_ids: Set[int]) -> Dict[int, List[Tuple]]:
+        """Same contract as DatabaseService.get_items_by_ids."""
+        mapped = self._file
+        if mapped is None:
+            if self._db_service:
+                return await self._db_service.get_items_by_ids(item_ids)
+            logger.error("Item catalog file not loaded.")
+            return {}
+        results: Dict[int, List[Tuple]] = {}
+        for item_id in item_ids:
+            row = mapped.row(item_id)
+            if row:
+                results[item_id] = [row]
+        return results
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
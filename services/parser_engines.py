@@ -0,0 +1,180 @@
+# services/parser_engines.py
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+import config # Import your config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENGINE = "html.parser"
+
+class Node:
+    """
+    Minimal element interface the Armory extractors are written against.
+    Every engine wraps its own tree type in a Node so ParsedProfile/ParsedTalents
+    don't care which library built the DOM.
+    """
+    __slots__ = ()
+
+    def select(self, css: str) -> List["Node"]:
+        """Returns all descendants matching a CSS selector."""
+        raise NotImplementedError
+
+    def select_one(self, css: str) -> Optional["Node"]:
+        """Returns the first descendant matching a CSS selector, or None."""
+        raise NotImplementedError
+
+    def text(self, strip: bool = False) -> str:
+        """Returns the text content. strip=True strips and joins every text fragment (like bs4 get_text(strip=True))."""
+        raise NotImplementedError
+
+    def first_text(self) -> str:
+        """Returns the text of the first child node (like bs4 tag.contents[0])."""
+        raise NotImplementedError
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Returns an attribute value as a plain string."""
+        raise NotImplementedError
+
+    def classes(self) -> List[str]:
+        """Returns the element's CSS classes."""
+        value = self.attr('class')
+        return value.split() if value else []
+
+
+class SoupNode(Node):
+    """Node backed by a BeautifulSoup tag."""
+    __slots__ = ('_tag',)
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    def select(self, css: str) -> List[Node]:
+        return [SoupNode(tag) for tag in self._tag.select(css)]
+
+    def select_one(self, css: str) -> Optional[Node]:
+        tag = self._tag.select_one(css)
+        return SoupNode(tag) if tag is not None else None
+
+    def text(self, strip: bool = False) -> str:
+        return self._tag.get_text(strip=strip)
+
+    def first_text(self) -> str:
+        if not self._tag.contents:
+            return ""
+        first = self._tag.contents[0]
+        # NavigableString is a str subclass, tags need get_text
+        return str(first) if isinstance(first, str) else first.get_text()
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = self._tag.get(name)
+        if value is None:
+            return default
+        # bs4 splits multi-valued attributes (class, rel) into lists
+        return " ".join(value) if isinstance(value, list) else value
+
+
+class SelectolaxNode(Node):
+    """Node backed by a selectolax (lexbor) node."""
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    def select(self, css: str) -> List[Node]:
+        # lexbor matches the node itself as well, bs4 only looks at descendants
+        return [SelectolaxNode(n) for n in self._node.css(css) if n != self._node]
+
+    def select_one(self, css: str) -> Optional[Node]:
+        for n in self._node.css(css):
+            if n != self._node:
+                return SelectolaxNode(n)
+        return None
+
+    def text(self, strip: bool = False) -> str:
+        return self._node.text(deep=True, separator='', strip=strip)
+
+    def first_text(self) -> str:
+        child = self._node.child
+        if child is None:
+            return ""
+        return child.text(deep=True)
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = self._node.attributes.get(name, default)
+        # Valueless attributes come back as None
+        return "" if value is None and name in self._node.attributes else value
+
+
+class ParserEngine(ABC):
+    """Turns raw HTML into a root Node."""
+    name = ""
+
+    @abstractmethod
+    def parse(self, html: str) -> Node:
+        ...
+
+
+class SoupEngine(ParserEngine):
+    """BeautifulSoup with a pluggable tree builder ('html.parser' or 'lxml')."""
+
+    def __init__(self, features: str = "html.parser"):
+        from bs4 import BeautifulSoup # Deferred, only loaded when this engine is used
+        if features == "lxml":
+            import lxml # noqa: F401 - fail early (ImportError) if lxml is missing
+        self._soup_cls = BeautifulSoup
+        self.features = features
+        self.name = features
+
+    def parse(self, html: str) -> Node:
+        return SoupNode(self._soup_cls(html, self.features))
+
+
+class SelectolaxEngine(ParserEngine):
+    """selectolax lexbor engine: C parser with native CSS selectors, no bs4 tree at all."""
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser # Deferred, optional dependency
+        self._parser_cls = LexborHTMLParser
+
+    def parse(self, html: str) -> Node:
+        return SelectolaxNode(self._parser_cls(html).root)
+
+
+ENGINE_FACTORIES = {
+    "html.parser": lambda: SoupEngine("html.parser"),
+    "lxml": lambda: SoupEngine("lxml"),
+    "selectolax": SelectolaxEngine,
+}
+
+_engines: Dict[str, ParserEngine] = {}
+
+def get_engine(name: Optional[str] = None) -> ParserEngine:
+    """
+    Returns the (cached) parser engine by name, defaulting to config.HTML_PARSER_ENGINE.
+    Falls back to the pure-Python html.parser engine if the requested backend isn't installed.
+    """
+    if name is None:
+        name = getattr(config, "HTML_PARSER_ENGINE", DEFAULT_ENGINE)
+    engine = _engines.get(name)
+    if engine:
+        return engine
+
+    factory = ENGINE_FACTORIES.get(name)
+    if factory is None:
+        logger.warning(f"Unknown HTML parser engine '{name}', using '{DEFAULT_ENGINE}'.")
+        name, factory = DEFAULT_ENGINE, ENGINE_FACTORIES[DEFAULT_ENGINE]
+    try:
+        engine = factory()
+    except ImportError as e:
+        if name == DEFAULT_ENGINE:
+            raise
+        logger.warning(f"HTML parser engine '{name}' is not available ({e}), using '{DEFAULT_ENGINE}'.")
+        engine = get_engine(DEFAULT_ENGINE)
+        _engines[name] = engine # Don't retry the import on every page
+        return engine
+
+    _engines[name] = engine
+    logger.info(f"Using HTML parser engine '{engine.name}'.")
+    return engine
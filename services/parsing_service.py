@@ -0,0 +1,152 @@
+# services/parsing_service.py
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, NamedTuple, Optional, Set
+from services.parser_engines import get_engine
+from services.warmane_parser import ParsedProfile, ParsedTalents
+from utils.cache import TTLCache
+import config # Import your config
+
+logger = logging.getLogger(__name__)
+
+class ProfileData(NamedTuple):
+    """Everything the bot needs from a summary page. Plain builtins only, so it pickles cheaply."""
+    exists: bool
+    guild: Optional[str] = None
+    level: Optional[int] = None
+    race: Optional[str] = None
+    char_class: Optional[str] = None
+    professions: List[str] = []
+    specializations: List[str] = []
+    active_spec_id: Optional[str] = None
+    equipped_items: Dict[int, List[Dict]] = {} # {item_id: [{'enchant': id, 'gems': [ids]}, ...]}
+    item_ids: Set[int] = set()
+
+class TalentData(NamedTuple):
+    """Glyphs and talent strings from a talents page."""
+    glyphs: Dict[str, Dict[str, List[str]]]
+    talent_strings: Dict[str, str]
+
+
+# --- Worker functions (module level so they can be pickled) ---
+def parse_profile_html(html: str, engine_name: Optional[str] = None) -> ProfileData:
+    """Parses a summary page into ProfileData. Runs inside a worker process."""
+    profile = ParsedProfile(html, get_engine(engine_name))
+    if not profile.exists():
+        # Fresh containers: the class defaults are single shared objects
+        return ProfileData(exists=False, professions=[], specializations=[], equipped_items={}, item_ids=set())
+
+    level, race, char_class = profile.level_race_class()
+    specializations, active_spec_id = profile.specializations()
+    equipped_items, item_ids = profile.equipped_items_data()
+    return ProfileData(
+        exists=True,
+        guild=profile.guild(),
+        level=level,
+        race=race,
+        char_class=char_class,
+        professions=profile.professions(),
+        specializations=specializations,
+        active_spec_id=active_spec_id,
+        equipped_items=equipped_items,
+        item_ids=item_ids,
+    )
+
+def parse_talents_html(html: str, class_name: Optional[str], engine_name: Optional[str] = None) -> TalentData:
+    """Parses a talents page into TalentData. Runs inside a worker process."""
+    talents = ParsedTalents(html, get_engine(engine_name))
+    return TalentData(glyphs=talents.glyphs(), talent_strings=talents.talent_points_string(class_name))
+
+def _init_worker(engine_name: Optional[str]):
+    """Loads the parser engine once per worker instead of on the first page."""
+    get_engine(engine_name)
+
+def _noop() -> None:
+    return None
+
+
+class ParsingService:
+    """
+    Runs Armory HTML parsing in a process pool so big pages don't block the event loop.
+    With PARSER_WORKERS = 0 pages are parsed inline on the loop (old behaviour).
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, engine_name: Optional[str] = None):
+        if max_workers is None:
+            max_workers = getattr(config, "PARSER_WORKERS", None)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self.engine_name = engine_name or getattr(config, "HTML_PARSER_ENGINE", None)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Recent parse results keyed by a digest of the page. A cached or 304'd page is the very same body,
+        # so it skips parsing entirely. Only the digest is kept, not the body (pages are ~100 KB each).
+        self._results = TTLCache(
+            maxsize=getattr(config, "ARMORY_CACHE_SIZE", 512),
+            ttl=getattr(config, "ARMORY_VALIDATOR_TTL", 86400),
+        )
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # Never fork the bot itself: it has the event loop plus executor/resolver threads, and a forked
+        # child can inherit a lock held by one of them. forkserver/spawn start clean interpreters
+        # (bot.py only sets up its log file when run as __main__, so re-importing it is harmless).
+        methods = multiprocessing.get_all_start_methods()
+        mp_context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self.engine_name,),
+        )
+
+    async def start(self):
+        """Creates the pool and starts the workers up front (before the gateway connects)."""
+        if self.max_workers <= 0 or self._executor:
+            return
+        self._executor = self._create_executor()
+        await asyncio.get_running_loop().run_in_executor(self._executor, _noop)
+        logger.info(f"Parsing pool started with {self.max_workers} worker(s), engine '{self.engine_name}'.")
+
+    def close(self):
+        """Shuts the pool down without waiting for queued pages."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Parsing pool shut down.")
+
+    async def _run(self, func, *args):
+        if not self._executor:
+            return func(*args) # Pool disabled or not started, parse inline
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        except BrokenProcessPool:
+            # A worker died (OOM, killed...). Replace the pool and parse this page inline.
+            logger.error("Parsing pool is broken, restarting it.")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+            return func(*args)
+
+    async def _parse_cached(self, key: tuple, html: str, func, *args):
+        key += (hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest(),)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+        result = await self._run(func, html, *args)
+        self._results.set(key, result)
+        return result
+
+    async def parse_profile(self, html: str) -> ProfileData:
+        """Parses a summary page (or returns the result for an identical page parsed earlier)."""
+        return await self._parse_cached(("summary",), html, parse_profile_html, self.engine_name)
+
+    async def parse_talents(self, html: str, class_name: Optional[str]) -> TalentData:
+        """Parses a talents page. class_name is needed to validate the talent strings."""
+        return await self._parse_cached(("talents", class_name), html, parse_talents_html, class_name, self.engine_name)
+
+    def stats(self) -> dict:
+        return {"workers": self.max_workers, "engine": self.engine_name, "reused_results": self._results.stats()}
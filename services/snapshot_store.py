@@ -0,0 +1,117 @@
+# services/snapshot_store.py
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from models.character import Character
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    name        TEXT NOT NULL,
+    realm       TEXT NOT NULL,
+    fetched_at  REAL NOT NULL,
+    has_talents INTEGER NOT NULL,
+    talents_fetched_at REAL,
+    data        TEXT NOT NULL,
+    PRIMARY KEY (name, realm)
+)
+"""
+
+class SnapshotStore:
+    """
+    Last built Character per (name, realm), persisted in a local SQLite file so it survives restarts.
+    sqlite3 is blocking, so all queries run on one dedicated thread (which also owns the connection).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshots")
+        # Stats
+        self.reads = 0
+        self.found = 0
+        self.writes = 0
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL") # A lost last write only costs a refetch
+        conn.execute(_SCHEMA)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(snapshots)")}
+        if "talents_fetched_at" not in columns: # File from before talents had their own timestamp
+            conn.execute("ALTER TABLE snapshots ADD COLUMN talents_fetched_at REAL")
+        conn.commit()
+        self._conn = conn
+        return conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    async def open(self):
+        """Opens (or creates) the snapshot file."""
+        count = await self._run(self._open)
+        logger.info(f"Snapshot store opened at {self.path} ({count} snapshots).")
+
+    def _get(self, name: str, realm: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT data FROM snapshots WHERE name = ? AND realm = ?", (name, realm)
+        ).fetchone()
+        return row[0] if row else None
+
+    async def get(self, name: str, realm: str) -> Optional[Character]:
+        """Returns the stored Character (whatever its age), or None."""
+        if not self._conn:
+            return None
+        self.reads += 1
+        try:
+            data = await self._run(self._get, name.lower(), realm.lower())
+            if data is None:
+                return None
+            character = Character.from_dict(json.loads(data))
+        except Exception as e:
+            logger.exception(f"Failed to read snapshot for {name}-{realm}: {e}")
+            return None
+        self.found += 1
+        return character
+
+    def _put(
+        self, name: str, realm: str, fetched_at: float, has_talents: bool, talents_fetched_at: Optional[float], data: str
+    ):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO snapshots (name, realm, fetched_at, has_talents, talents_fetched_at, data)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (name, realm, fetched_at, int(has_talents), talents_fetched_at, data),
+        )
+        self._conn.commit()
+
+    async def put(self, character: Character):
+        """Stores (replaces) the snapshot for a character."""
+        if not self._conn:
+            return
+        try:
+            data = json.dumps(character.to_dict(), separators=(",", ":"))
+            await self._run(
+                self._put, character.name.lower(), character.realm.lower(),
+                character.fetched_at, character.has_talents, character.talents_fetched_at, data,
+            )
+            self.writes += 1
+        except Exception as e:
+            logger.exception(f"Failed to store snapshot for {character.name}-{character.realm}: {e}")
+
+    def close(self):
+        if self._conn:
+            self._executor.submit(self._conn.close).result()
+            self._conn = None
+            logger.info("Snapshot store closed.")
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> dict:
+        return {"reads": self.reads, "found": self.found, "writes": self.writes}
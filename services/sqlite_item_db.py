@@ -0,0 +1,158 @@
+# services/sqlite_item_db.py
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from services.database_service import DatabaseService, ITEM_COLUMNS
+from utils.items_sql import iter_items_sql
+
+logger = logging.getLogger(__name__)
+
+# Same columns and key as the MySQL table (items.sql declares PRIMARY KEY (itemID)).
+# INTEGER PRIMARY KEY makes itemID the rowid, so lookups need no separate index.
+_SCHEMA = """
+CREATE TABLE items (
+    itemID    INTEGER PRIMARY KEY,
+    name      TEXT,
+    ItemLevel INTEGER,
+    quality   INTEGER,
+    type      INTEGER,
+    requires  INTEGER,
+    class     INTEGER,
+    subclass  INTEGER,
+    gems      INTEGER,
+    GearScore INTEGER
+);
+"""
+
+# SQLite's default cap on ? parameters is 999 (older builds); larger lookups are split
+_MAX_PARAMS = 900
+
+def build_item_db(rows: Iterable[Sequence], path: str) -> int:
+    """
+    Writes the items table into a new SQLite file at `path` (in WAL mode). The file is built next to
+    the target and moved into place, so a bot reading the old file never sees a half-built one.
+    Returns the number of rows written.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        placeholders = ", ".join("?" * len(ITEM_COLUMNS))
+        conn.executemany(f"INSERT INTO items ({', '.join(ITEM_COLUMNS)}) VALUES ({placeholders})", rows)
+        count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        conn.commit()
+        conn.execute("PRAGMA journal_mode=WAL") # Stored in the file, read-only openers get it too
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    return count
+
+class SQLiteDatabaseService(DatabaseService):
+    """
+    The items table in a local SQLite file: no server, no network hop. Built from items.sql on first
+    start (or whenever items.sql is newer than the file), then opened read-only.
+    sqlite3 is blocking, so queries run on one dedicated thread that owns the connection.
+    """
+
+    def __init__(self, path: str, sql_path: Optional[str] = None):
+        self.path = path
+        self.sql_path = sql_path # Source for (re)building the file, None to only use an existing file
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None # Created by connect(), shut down by close()
+        # Stats
+        self.lookups = 0
+        self.queries = 0
+        self.ids_requested = 0
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _needs_build(self) -> bool:
+        if not self.sql_path or not os.path.exists(self.sql_path):
+            return False
+        return not os.path.exists(self.path) or os.path.getmtime(self.sql_path) > os.path.getmtime(self.path)
+
+    def _open(self) -> int:
+        if self._needs_build():
+            start = time.perf_counter()
+            count = build_item_db(iter_items_sql(self.sql_path, ITEM_COLUMNS), self.path)
+            logger.info(f"Built {self.path} from {self.sql_path}: {count} items in {time.perf_counter() - start:.2f}s.")
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Item database {self.path} not found and no items.sql to build it from.")
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        conn.execute("PRAGMA query_only=ON")
+        self._conn = conn
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    async def connect(self):
+        """Opens the item database read-only, building it from items.sql first if needed."""
+        if self._conn:
+            return # Already connected
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="items-db")
+        try:
+            count = await self._run(self._open)
+            logger.info(f"SQLite item database opened at {self.path} ({count} items).")
+        except Exception as e:
+            logger.exception(f"Failed to open SQLite item database {self.path}: {e}")
+            raise
+
+    async def close(self):
+        if self._conn:
+            await self._run(self._conn.close)
+            self._conn = None
+            logger.info("SQLite item database closed.")
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _get_items(self, item_ids: List[int]) -> Dict[int, List[Tuple]]:
+        results: Dict[int, List[Tuple]] = {}
+        for start in range(0, len(item_ids), _MAX_PARAMS):
+            chunk = item_ids[start:start + _MAX_PARAMS]
+            query = f"SELECT {', '.join(ITEM_COLUMNS)} FROM items WHERE itemID IN ({', '.join('?' * len(chunk))})"
+            for row in self._conn.execute(query, chunk):
+                results.setdefault(row[0], []).append(row)
+        return results
+
+    async def get_items_by_ids(self, item_ids: Set[int]) -> Dict[int, List[Tuple]]:
+        """Same contract as MySQLDatabaseService.get_items_by_ids."""
+        if not self._conn:
+            logger.error("SQLite item database not opened.")
+            return {}
+        if not item_ids:
+            return {}
+        self.lookups += 1
+        self.queries += 1
+        self.ids_requested += len(item_ids)
+        try:
+            return await self._run(self._get_items, list(item_ids))
+        except Exception as e:
+            logger.exception(f"Error fetching items from SQLite: {e}")
+            return {}
+
+    def _get_all(self) -> List[Tuple]:
+        return self._conn.execute(f"SELECT {', '.join(ITEM_COLUMNS)} FROM items").fetchall()
+
+    async def get_all_items(self) -> List[Tuple]:
+        if not self._conn:
+            logger.error("SQLite item database not opened.")
+            return []
+        try:
+            return await self._run(self._get_all)
+        except Exception as e:
+            logger.exception(f"Error fetching all items from SQLite: {e}")
+            return []
+
+    def stats(self) -> dict:
+        return {"backend": "sqlite", "lookups": self.lookups, "queries": self.queries, "ids_requested": self.ids_requested}
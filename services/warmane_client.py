@@ -1,42 +1,237 @@
 # services/warmane_client.py
 import aiohttp
+import asyncio
 import logging
-from typing import Optional
+import random
+import time
+from typing import Optional, Tuple
+from urllib.parse import quote_plus
 import config # Import your config
-from utils.constants import WARMANE_ARMORY_URL
+from utils.cache import TTLCache
+from utils.singleflight import SingleFlight
+from utils.rate_limiter import AdaptiveRateLimiter
+from utils.circuit_breaker import CircuitBreaker
+from utils.constants import WARMANE_ARMORY_URL, WARMANE_GUILD_URL
+from services.http_session import ConnectionStats
 
 logger = logging.getLogger(__name__)
 
+# aiohttp only decodes brotli when the Brotli package is installed, so only ask for it then
+try:
+    import brotli # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Worth retrying: rate limited or the Armory/its proxy is struggling. Other 4xx are final.
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+class ArmoryUnavailableError(Exception):
+    """The Armory is failing (retries exhausted, or the circuit breaker is open)."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after # Seconds until the next probe is allowed (0 if unknown)
+
+class _TransientError(Exception):
+    """A single failed attempt that may succeed if retried."""
+
 class WarmaneClient:
-    def __init__(self, session: aiohttp.ClientSession):
+    def __init__(self, session: aiohttp.ClientSession, connection_stats: Optional[ConnectionStats] = None):
         self.session = session
-        self.headers = {"User-Agent": config.HTTP_USER_AGENT}
+        self.connection_stats = connection_stats
+        self.headers = {"User-Agent": config.HTTP_USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING}
+        # Recently fetched pages, keyed by (page type, character, realm)
+        self.cache = TTLCache(
+            maxsize=getattr(config, "ARMORY_CACHE_SIZE", 512),
+            ttl=getattr(config, "ARMORY_CACHE_TTL", 300),
+        )
+        # Concurrent requests for the same URL share one fetch
+        self._inflight = SingleFlight()
+        # url -> (ETag, Last-Modified, body), kept well past the page TTL for conditional refetches
+        self._validators = TTLCache(
+            maxsize=getattr(config, "ARMORY_CACHE_SIZE", 512),
+            ttl=getattr(config, "ARMORY_VALIDATOR_TTL", 86400),
+        )
+        # bytes_on_wire is exact unless estimated_responses > 0 (see _wire_bytes)
+        self.transfer = {
+            "requests": 0, "not_modified": 0, "bytes_on_wire": 0, "bytes_decoded": 0, "estimated_responses": 0,
+        }
+        # Global pace for armory.warmane.com, adapts to 429/503s and slow responses (0 disables)
+        rate = getattr(config, "ARMORY_RATE_LIMIT", 5)
+        self.limiter = AdaptiveRateLimiter(
+            rate=rate,
+            burst=getattr(config, "ARMORY_RATE_BURST", 10),
+            min_rate=getattr(config, "ARMORY_RATE_MIN", 0.5),
+            increase=getattr(config, "ARMORY_RATE_INCREASE", 0.1),
+            decrease=getattr(config, "ARMORY_RATE_DECREASE", 0.5),
+            slow_after=getattr(config, "ARMORY_SLOW_RESPONSE", 3.0),
+        ) if rate and rate > 0 else None
+        # Retries for transient failures, and a breaker that fails fast while the Armory is down
+        self.max_attempts = max(1, getattr(config, "ARMORY_RETRY_ATTEMPTS", 3))
+        self.retry_base_delay = getattr(config, "ARMORY_RETRY_BASE_DELAY", 0.5)
+        self.retry_max_delay = getattr(config, "ARMORY_RETRY_MAX_DELAY", 4.0)
+        self.retries = 0
+        self.breaker = CircuitBreaker(
+            "armory",
+            failure_threshold=getattr(config, "ARMORY_BREAKER_THRESHOLD", 5),
+            reset_timeout=getattr(config, "ARMORY_BREAKER_RESET", 30),
+        )
 
-    async def _fetch_html(self, url: str) -> Optional[str]:
-        """Internal helper to fetch HTML content."""
+    def _conditional_headers(self, url: str) -> tuple:
+        """Returns (request headers, stored validator entry or None) for a URL."""
+        validator = self._validators.get(url)
+        if not validator:
+            return self.headers, None
+        etag, last_modified, _ = validator
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers, validator
+
+    @staticmethod
+    def _wire_bytes(response: aiohttp.ClientResponse, decoded: int) -> Tuple[int, bool]:
+        """
+        Body size as received, before decompression: (bytes, exact). Read from the raw stream counter
+        on aiohttp versions that have it, else from Content-Length (the encoded size). A chunked response
+        on an older aiohttp only tells us the decoded size, which is returned as an estimate.
+        """
+        raw = getattr(response.content, "total_raw_bytes", None) # Newer aiohttp only
+        if isinstance(raw, int):
+            return raw, True
+        if response.content_length is not None:
+            return response.content_length, True
+        return decoded, False
+
+    def _record_transfer(self, url: str, response: aiohttp.ClientResponse, body: str):
+        """Counts bytes actually received (compressed size) vs. the decoded page size."""
+        decoded = len(body.encode("utf-8")) if body else 0
+        wire, exact = self._wire_bytes(response, decoded)
+        self.transfer["requests"] += 1
+        self.transfer["bytes_on_wire"] += wire
+        self.transfer["bytes_decoded"] += decoded
+        if not exact:
+            self.transfer["estimated_responses"] += 1
+        encoding = response.headers.get("Content-Encoding", "identity")
+        size = f"{wire} bytes on the wire" if exact else f"~{wire} bytes on the wire (estimated)"
+        logger.info(f"Fetched {url} (Status: {response.status}, {size}, {encoding})")
+
+    async def _fetch_once(self, url: str) -> Optional[str]:
+        """
+        One request. Returns the page, or None for a definite miss (404 and other 4xx).
+        Raises _TransientError for failures worth retrying (5xx, 429, timeouts, connection errors).
+        """
+        headers, validator = self._conditional_headers(url)
+        if self.limiter:
+            await self.limiter.acquire()
+        started = time.monotonic()
+        trace = {} # "connected_at" is filled in by the session's trace hooks (services/http_session.py)
         try:
-            async with self.session.get(url, headers=self.headers) as response:
+            async with self.session.get(url, headers=headers, trace_request_ctx=trace) as response:
+                if self.limiter:
+                    # Timed from getting a connection: waiting for one of our own HTTP_LIMIT_PER_HOST
+                    # connections says nothing about the Armory's speed
+                    latency = time.monotonic() - trace.get("connected_at", started)
+                    self.limiter.on_response(response.status, latency, response.headers.get("Retry-After"))
+                if response.status == 304 and validator:
+                    # Unchanged since last time: reuse the stored body (and, downstream, its parse result)
+                    self._record_transfer(url, response, "")
+                    self.transfer["not_modified"] += 1
+                    return validator[2]
+                if response.status in RETRYABLE_STATUSES:
+                    raise _TransientError(f"HTTP {response.status}")
                 response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-                logger.info(f"Successfully fetched {url} (Status: {response.status})")
-                return await response.text()
+                body = await response.text()
+                self._record_transfer(url, response, body)
+                etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._validators.set(url, (etag, last_modified, body))
+                return body
         except aiohttp.ClientResponseError as e:
             logger.error(f"HTTP Error fetching {url}: {e.status} {e.message}")
             return None # Indicate failure clearly
-        except aiohttp.ClientError as e:
-            logger.error(f"Client Error fetching {url}: {e}")
-            return None
-        except Exception as e:
-            logger.exception(f"Unexpected error fetching {url}: {e}")
-            return None
-
-    async def get_profile_html(self, character: str, realm: str) -> Optional[str]:
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            raise _TransientError(f"{type(e).__name__}: {e}") from e
+        except asyncio.TimeoutError as e:
+            if self.limiter:
+                self.limiter.on_timeout()
+            raise _TransientError("timed out") from e
+
+    async def _fetch_html(self, url: str) -> Optional[str]:
+        """
+        Internal helper to fetch HTML content. Transient failures are retried with jittered
+        exponential backoff; raises ArmoryUnavailableError if they persist or the circuit is open.
+        """
+        if not self.breaker.allow():
+            raise ArmoryUnavailableError(f"Armory circuit open, not fetching {url}", self.breaker.retry_after())
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                html = await self._fetch_once(url)
+            except _TransientError as e:
+                self.breaker.record_failure()
+                logger.warning(f"Transient error fetching {url} (attempt {attempt}/{self.max_attempts}): {e}")
+                if attempt == self.max_attempts or not self.breaker.allow():
+                    break
+                self.retries += 1
+                # Full jitter: spreads retries out so simultaneous failures don't come back in lockstep
+                await asyncio.sleep(random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))))
+                continue
+            except aiohttp.ClientError as e:
+                logger.error(f"Client Error fetching {url}: {e}")
+                return None
+            except Exception as e:
+                logger.exception(f"Unexpected error fetching {url}: {e}")
+                return None
+            self.breaker.record_success() # Got an answer, even if it's a 404
+            return html
+
+        raise ArmoryUnavailableError(f"Armory unavailable, giving up on {url}", self.breaker.retry_after())
+
+    async def _get_cached(self, key: tuple, url: str, fresh: bool) -> Optional[str]:
+        """Returns a page from the cache, or fetches (and caches) it. fresh=True skips the cache read."""
+        if not fresh:
+            html = self.cache.get(key)
+            if html is not None:
+                return html
+
+        html = await self._inflight.do(url, lambda: self._fetch_html(url))
+        if html is not None:
+            self.cache.set(key, html) # Failures aren't cached
+        return html
+
+    async def _get_page(self, page: str, character: str, realm: str, fresh: bool) -> Optional[str]:
+        """Returns a character page, keyed by (page type, character, realm)."""
+        url = f"{WARMANE_ARMORY_URL}/{character.capitalize()}/{realm.capitalize()}/{page}"
+        return await self._get_cached((page, character.lower(), realm.lower()), url, fresh)
+
+    async def get_profile_html(self, character: str, realm: str, fresh: bool = False) -> Optional[str]:
         """Fetches the summary/profile page HTML."""
-        url = f"{WARMANE_ARMORY_URL}/{character.capitalize()}/{realm.capitalize()}/summary"
-        return await self._fetch_html(url)
+        return await self._get_page("summary", character, realm, fresh)
 
-    async def get_talents_html(self, character: str, realm: str) -> Optional[str]:
+    async def get_talents_html(self, character: str, realm: str, fresh: bool = False) -> Optional[str]:
         """Fetches the talents page HTML."""
-        url = f"{WARMANE_ARMORY_URL}/{character.capitalize()}/{realm.capitalize()}/talents"
-        return await self._fetch_html(url)
+        return await self._get_page("talents", character, realm, fresh)
+
+    async def get_guild_html(self, guild: str, realm: str, fresh: bool = False) -> Optional[str]:
+        """Fetches a guild's summary page (with the member roster)."""
+        url = f"{WARMANE_GUILD_URL}/{quote_plus(guild)}/{realm.capitalize()}/summary"
+        return await self._get_cached(("guild", guild.lower(), realm.lower()), url, fresh)
+
+    def stats(self) -> dict:
+        """Client counters for the owner stats command."""
+        stats = {
+            "cache": self.cache.stats(),
+            "coalescing": self._inflight.stats(),
+            "transfer": dict(self.transfer, validators=len(self._validators)),
+            "circuit_breaker": dict(self.breaker.stats(), retries=self.retries),
+        }
+        if self.limiter:
+            stats["rate_limit"] = self.limiter.stats()
+        if self.connection_stats:
+            stats["connections"] = self.connection_stats.stats()
+        return stats
 
     # Add methods for other pages if needed (e.g., reputation, pvp)
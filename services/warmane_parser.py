@@ -1,11 +1,12 @@
 # services/warmane_parser.py
 import re
 import logging
-from bs4 import BeautifulSoup
+from html import unescape as html_unescape
+from urllib.parse import unquote
 from typing import Dict, List, Optional, Tuple, Set
 from models.item import Item
-from models.item_type import ItemTypes
-from utils.helpers import missing_enchant_message, missing_gems_message
+from models.gear_summary import GearSummary
+from services.parser_engines import Node, ParserEngine, get_engine
 
 logger = logging.getLogger(__name__)
 
@@ -13,38 +14,173 @@ class WarmaneParserError(Exception):
     """Custom exception for parsing errors."""
     pass
 
-class WarmaneParser:
-
-    @staticmethod
-    def check_character_exists(html: str) -> bool:
+# --- Raw HTML scanners ---
+# Item links and talent points are plain attribute/text patterns, so they can be pulled
+# straight out of the page string without building a DOM. The DOM extractors below stay
+# as the fallback whenever a scanner comes back empty.
+_REL_ATTR_RE = re.compile(r"""\srel\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+))""", re.IGNORECASE)
+_TALENT_CONTAINER_RE = re.compile(r"""<div\b[^>]*\bclass\s*=\s*["'][^"']*talents-container[^"']*["'][^>]*>""", re.IGNORECASE)
+_DATA_ID_RE = re.compile(r"""\bdata-id\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+_TALENT_POINTS_TAG_RE = re.compile(r"""<div\b[^>]*\bclass\s*=\s*["'][^"']*\btalent-points\b[^"']*["'][^>]*>""", re.IGNORECASE)
+_TALENT_POINTS_RE = re.compile(
+    r"""<div\b[^>]*\bclass\s*=\s*["'][^"']*\btalent-points\b[^"']*["'][^>]*>\s*(\d+)\s*/\s*\d+\s*</div>""",
+    re.IGNORECASE,
+)
+_DIV_TAG_RE = re.compile(r"""<(/?)div\b[^>]*>""", re.IGNORECASE)
+# Roster rows on the guild page link to each member's /character/<name>/<realm>/summary page
+_MEMBER_LINK_RE = re.compile(r"""href\s*=\s*["'][^"']*/character/([^/"'?#]+)/([^/"'?#]+)/summary["']""", re.IGNORECASE)
+
+def _add_item_rel(rel_part: str, equipped_items: Dict[int, List[Dict]], all_item_ids: Set[int]) -> None:
+    """Parses one rel value (e.g., "item=123&ench=456&gems=1:2:0") into equipped_items/all_item_ids."""
+    if not rel_part.startswith("item="):
+        return # Skip non-item rel parts
+
+    components = rel_part.split('&')
+    item_id_str: Optional[str] = None
+    enchant_id: Optional[str] = None
+    gem_ids: List[str] = []
+
+    try:
+        for component in components:
+            if component.startswith("item="):
+                item_id_str = component.split("=")[1]
+            elif component.startswith("ench="):
+                enchant_id = component.split("=")[1]
+            elif component.startswith("gems="):
+                raw_gems = component.split("=")[1]
+                # Filter out '0' which represents empty slots
+                gem_ids = [gem for gem in raw_gems.split(":") if gem != "0"]
+
+        if item_id_str:
+            item_id = int(item_id_str)
+            all_item_ids.add(item_id)
+            item_data = {"enchant": enchant_id, "gems": gem_ids}
+
+            if item_id not in equipped_items:
+                equipped_items[item_id] = []
+            equipped_items[item_id].append(item_data)
+
+    except (ValueError, IndexError, TypeError) as e:
+        logger.warning(f"Failed to parse item rel component '{rel_part}': {e}")
+
+def scan_equipped_items_data(html: str) -> Optional[Tuple[Dict[int, List[Dict]], Set[int]]]:
+    """
+    Pulls equipped item data from every rel="item=..." attribute in the raw HTML.
+    Same result shape as ParsedProfile.equipped_items_data, or None if no item links were found.
+    """
+    equipped_items: Dict[int, List[Dict]] = {}
+    all_item_ids: Set[int] = set()
+    for match in _REL_ATTR_RE.finditer(html):
+        value = match.group(1) or match.group(2) or match.group(3) or ""
+        # Attribute values are still HTML-escaped here (&amp;), the DOM would have decoded them
+        for rel_part in html_unescape(value).split():
+            _add_item_rel(rel_part, equipped_items, all_item_ids)
+    if not all_item_ids:
+        return None
+    return equipped_items, all_item_ids
+
+def _div_end(html: str, pos: int) -> Optional[int]:
+    """Index of the </div> closing the div whose opening tag ends at `pos`, or None if it's never closed."""
+    depth = 1
+    for match in _DIV_TAG_RE.finditer(html, pos):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return match.start()
+    return None
+
+def scan_talent_strings(html: str) -> Optional[Dict[str, str]]:
+    """
+    Pulls the allocated points of every div.talent-points ("N/M") per talents container from the raw HTML.
+    Returns {spec_id: talent_string}, or None if the markup isn't the expected shape.
+    """
+    starts = list(_TALENT_CONTAINER_RE.finditer(html))
+    if not starts:
+        return None
+
+    talent_strings: Dict[str, str] = {}
+    for i, start in enumerate(starts):
+        # Only the container's own contents, like the DOM path: talent-points markup after the last
+        # container (tooltip templates, footers) must not end up in its string
+        end = _div_end(html, start.end())
+        if end is None:
+            return None
+        segment = html[start.end():end]
+        points = _TALENT_POINTS_RE.findall(segment)
+        # Every talent-points tag must have matched, otherwise positions would shift
+        if not points or len(points) != len(_TALENT_POINTS_TAG_RE.findall(segment)):
+            return None
+        id_match = _DATA_ID_RE.search(start.group(0))
+        spec_id = id_match.group(1) if id_match else str(i)
+        talent_strings[spec_id] = "".join(points)
+    return talent_strings
+
+def scan_guild_members(html: str) -> List[Tuple[str, str]]:
+    """
+    Pulls (name, realm) for every member linked from a guild roster page, in page order and
+    without duplicates. An empty list means the guild wasn't found (or has no members).
+    """
+    members: List[Tuple[str, str]] = []
+    seen: Set[Tuple[str, str]] = set()
+    for match in _MEMBER_LINK_RE.finditer(html):
+        name, realm = unquote(match.group(1)), unquote(match.group(2))
+        key = (name.lower(), realm.lower())
+        if key not in seen:
+            seen.add(key)
+            members.append((name, realm))
+    return members
+
+class ParsedProfile:
+    """
+    A character summary page parsed once.
+    Build it from the raw profile HTML and call the extractors on it,
+    instead of handing the same HTML to every WarmaneParser.extract_* call.
+    The DOM is only built when an extractor needs it (item data is scanned from the raw HTML).
+    """
+
+    def __init__(self, html: str, engine: Optional[ParserEngine] = None):
+        self.html = html
+        self._engine = engine
+        self._doc: Optional[Node] = None
+
+    @property
+    def doc(self) -> Optional[Node]:
+        """The parsed DOM, built on first access."""
+        if self._doc is None and self.html:
+            self._doc = (self._engine or get_engine()).parse(self.html)
+        return self._doc
+
+    def exists(self) -> bool:
         """Checks if the HTML indicates a 'character not found' error."""
-        if not html:
+        if not self.html:
             return False # No HTML means we can't check
-        # More robust check - look for the specific error div
-        parser = BeautifulSoup(html, 'html.parser')
-        error_div = parser.find('div', class_='error-page')
-        if error_div and "does not exist" in error_div.get_text():
-            logger.warning("Character not found message detected in HTML.")
-            return False
+        # More robust check - look for the specific error div (no need for a DOM if it can't be there)
+        if "error-page" in self.html:
+            error_div = self.doc.select_one('div.error-page')
+            if error_div and "does not exist" in error_div.text():
+                logger.warning("Character not found message detected in HTML.")
+                return False
         # Fallback check if structure changes
-        if "The character you are looking for does not exist" in html:
+        if "The character you are looking for does not exist" in self.html:
              logger.warning("Fallback 'character not found' text detected.")
              return False
         return True
 
-    @staticmethod
-    def extract_equipped_items_data(html: str) -> Tuple[Dict[int, List[Dict]], Set[int]]:
+    def equipped_items_data(self) -> Tuple[Dict[int, List[Dict]], Set[int]]:
         """
-        Parses the profile HTML to extract equipped item IDs, enchants, and gems.
+        Extracts equipped item IDs, enchants, and gems.
         Returns a dict {item_id: [{'enchant': id, 'gems': [ids]}, ...]} and a set of all item_ids.
         Handles multiple items with the same ID (rings, trinkets).
         """
-        if not html:
+        if not self.html:
             raise WarmaneParserError("Cannot parse empty HTML for items.")
 
-        parser = BeautifulSoup(html, 'html.parser')
+        scanned = scan_equipped_items_data(self.html)
+        if scanned:
+            return scanned
+
+        # Scanner found nothing, fall back to the DOM
         # Find all tags with 'rel' attribute, common for item tooltips
-        rel_tags = parser.find_all(attrs={'rel': True})
+        rel_tags = self.doc.select('[rel]')
         if not rel_tags:
             logger.warning("No 'rel' tags found in HTML for item extraction.")
             return {}, set()
@@ -54,127 +190,89 @@ class WarmaneParser:
         all_item_ids: Set[int] = set()
 
         for tag in rel_tags:
-            rel_value = tag['rel']
-            # Ensure rel_value is a list, handle single string case
-            if isinstance(rel_value, str):
-                rel_value = [rel_value]
+            # rel is a space-separated list of values
+            rel_value = tag.attr('rel').split()
 
             # Process each part of the rel attribute (e.g., "item=123&ench=456")
             for rel_part in rel_value:
-                if not rel_part.startswith("item="):
-                    continue # Skip non-item rel parts
-
-                components = rel_part.split('&')
-                item_id_str: Optional[str] = None
-                enchant_id: Optional[str] = None
-                gem_ids: List[str] = []
-
-                try:
-                    for component in components:
-                        if component.startswith("item="):
-                            item_id_str = component.split("=")[1]
-                        elif component.startswith("ench="):
-                            enchant_id = component.split("=")[1]
-                        elif component.startswith("gems="):
-                            raw_gems = component.split("=")[1]
-                            # Filter out '0' which represents empty slots
-                            gem_ids = [gem for gem in raw_gems.split(":") if gem != "0"]
-
-                    if item_id_str:
-                        item_id = int(item_id_str)
-                        all_item_ids.add(item_id)
-                        item_data = {"enchant": enchant_id, "gems": gem_ids}
-
-                        if item_id not in equipped_items:
-                            equipped_items[item_id] = []
-                        equipped_items[item_id].append(item_data)
-
-                except (ValueError, IndexError, TypeError) as e:
-                    logger.warning(f"Failed to parse item rel component '{rel_part}': {e}")
-                    continue # Skip this component on error
+                _add_item_rel(rel_part, equipped_items, all_item_ids)
 
         return equipped_items, all_item_ids
 
-
-    @staticmethod
-    def extract_guild(html: str) -> Optional[str]:
+    def guild(self) -> Optional[str]:
         """Extracts the guild name."""
-        if not html: return None
+        if not self.html: return None
         try:
-            parser = BeautifulSoup(html, 'html.parser')
-            guild_span = parser.find('span', class_='guild-name')
-            if guild_span and guild_span.a:
-                return guild_span.a.text.strip()
+            guild_span = self.doc.select_one('span.guild-name')
+            guild_link = guild_span.select_one('a') if guild_span else None
+            if guild_link:
+                return guild_link.text().strip()
             return None # No guild found
         except Exception as e:
             logger.warning(f"Error parsing guild: {e}")
             return None
 
-    @staticmethod
-    def extract_professions(html: str) -> List[str]:
+    def professions(self) -> List[str]:
         """Extracts professions and their levels."""
-        if not html: return []
+        if not self.html: return []
         results = []
         try:
-            parser = BeautifulSoup(html, 'html.parser')
-            prof_div = parser.find('div', class_='profskills')
+            prof_div = self.doc.select_one('div.profskills')
             if not prof_div: return []
 
-            text_divs = prof_div.find_all('div', class_='text')
+            text_divs = prof_div.select('div.text')
             for div in text_divs:
-                prof_name = div.contents[0].strip()
-                value_span = div.find('span', class_='value')
-                prof_value = value_span.text.strip() if value_span else "N/A"
+                prof_name = div.first_text().strip()
+                value_span = div.select_one('span.value')
+                prof_value = value_span.text().strip() if value_span else "N/A"
                 results.append(f"{prof_name} ({prof_value})")
         except Exception as e:
             logger.warning(f"Error parsing professions: {e}")
             # Return potentially partial results or empty list
         return results
 
-    @staticmethod
-    def extract_specializations(html: str) -> Tuple[List[str], Optional[str]]:
+    def specializations(self) -> Tuple[List[str], Optional[str]]:
         """Extracts specializations, points, and determines active spec."""
-        if not html: return [], None
+        if not self.html: return [], None
         results = []
         active_spec_id = None
         try:
-            parser = BeautifulSoup(html, 'html.parser')
             # Find spec containers which usually have data-id="0" or data-id="1"
-            spec_containers = parser.find_all('div', class_='talents-block') # Adjust class if needed
+            spec_containers = self.doc.select('div.talents-block') # Adjust class if needed
 
             for i, container in enumerate(spec_containers):
                  # Attempt to find the name and points within the container
-                 name_tag = container.find('div', class_='name')
-                 points_tag = container.find('span', class_='points') # Or 'div' with points
+                 name_tag = container.select_one('div.name')
+                 points_tag = container.select_one('span.points') # Or 'div' with points
 
                  if name_tag:
-                     spec_name = name_tag.get_text(strip=True)
-                     spec_value = points_tag.get_text(strip=True) if points_tag else "0/0/0"
+                     spec_name = name_tag.text(strip=True)
+                     spec_value = points_tag.text(strip=True) if points_tag else "0/0/0"
                      results.append(f"{spec_name} ({spec_value})")
 
                      # Check if this spec is marked as active
                      # The 'active' class might be on the container or a child
-                     if 'active' in container.get('class', []):
+                     if 'active' in container.classes():
                           active_spec_id = str(i) # Assuming 0 or 1 based on order
 
                  # Fallback if structure is simpler (like original code)
                  elif i == 0: # Assume first is primary if blocks aren't distinct
-                     spec_div = parser.find('div', class_='specialization')
+                     spec_div = self.doc.select_one('div.specialization')
                      if spec_div:
-                         text_divs = spec_div.find_all('div', class_='text')
+                         text_divs = spec_div.select('div.text')
                          for div in text_divs:
-                             spec_name = div.contents[0].strip()
-                             value_span = div.find('span', class_='value')
-                             spec_value = value_span.text.strip() if value_span else "0/0/0"
+                             spec_name = div.first_text().strip()
+                             value_span = div.select_one('span.value')
+                             spec_value = value_span.text().strip() if value_span else "0/0/0"
                              results.append(f"{spec_name} ({spec_value})")
                          # Cannot reliably determine active spec in this fallback
                          break # Stop after processing the old structure
 
             # If active spec wasn't found via class, try data-id on talent tree itself
             if active_spec_id is None:
-                 talent_tree = parser.find('div', attrs={'data-id': True, 'class': 'talent-tree'}) # Example selector
+                 talent_tree = self.doc.select_one('div.talent-tree[data-id]') # Example selector
                  if talent_tree:
-                      active_spec_id = talent_tree.get('data-id')
+                      active_spec_id = talent_tree.attr('data-id')
 
 
         except Exception as e:
@@ -187,17 +285,14 @@ class WarmaneParser:
 
         return results, active_spec_id
 
-
-    @staticmethod
-    def extract_level_race_class(html: str) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+    def level_race_class(self) -> Tuple[Optional[int], Optional[str], Optional[str]]:
         """Extracts Level, Race, and Class."""
-        if not html: return None, None, None
+        if not self.html: return None, None, None
         try:
-            parser = BeautifulSoup(html, 'html.parser')
-            data_div = parser.find("div", class_="level-race-class")
+            data_div = self.doc.select_one("div.level-race-class")
             if not data_div: return None, None, None
 
-            text = data_div.get_text(strip=True) # e.g., "80 Blood Elf Paladin"
+            text = data_div.text(strip=True) # e.g., "80 Blood Elf Paladin"
             parts = text.split() # Split by space
 
             level = None
@@ -227,54 +322,68 @@ class WarmaneParser:
             logger.warning(f"Error parsing level/race/class: {e}")
             return None, None, None
 
-    @staticmethod
-    def extract_glyphs(html: str) -> Dict[str, Dict[str, List[str]]]:
+
+class ParsedTalents:
+    """A character talents page parsed once. Exposes glyph and talent point extraction."""
+
+    def __init__(self, html: str, engine: Optional[ParserEngine] = None):
+        self.html = html
+        self._engine = engine
+        self._doc: Optional[Node] = None
+
+    @property
+    def doc(self) -> Optional[Node]:
+        """The parsed DOM, built on first access."""
+        if self._doc is None and self.html:
+            self._doc = (self._engine or get_engine()).parse(self.html)
+        return self._doc
+
+    def glyphs(self) -> Dict[str, Dict[str, List[str]]]:
         """Extracts Major and Minor glyphs for each spec (0 and 1)."""
-        if not html: return {}
+        if not self.html: return {}
         glyph_data: Dict[str, Dict[str, List[str]]] = {}
         try:
-            parser = BeautifulSoup(html, 'html.parser')
             # Find containers for each spec, usually identified by data-glyphs attribute
-            glyph_sections = parser.find_all('div', attrs={'data-glyphs': True})
+            glyph_sections = self.doc.select('div[data-glyphs]')
 
             if not glyph_sections:
                  # Fallback: Maybe glyphs are just listed without spec separation?
                  # This requires inspecting the HTML structure if the above fails.
                  logger.warning("Could not find glyph sections with 'data-glyphs'. Glyph parsing might fail.")
                  # Try finding all glyph divs directly (less reliable)
-                 all_major = parser.find_all('div', class_='glyph major')
-                 all_minor = parser.find_all('div', class_='glyph minor')
+                 all_major = self.doc.select('div.glyph.major')
+                 all_minor = self.doc.select('div.glyph.minor')
                  if all_major or all_minor:
                       glyph_data['0'] = {"Major Glyphs": [], "Minor Glyphs": []} # Assume spec 0
                       for glyph in all_major:
-                           link = glyph.find('a')
-                           if link: glyph_data['0']["Major Glyphs"].append(link.text.strip())
+                           link = glyph.select_one('a')
+                           if link: glyph_data['0']["Major Glyphs"].append(link.text().strip())
                       for glyph in all_minor:
-                           link = glyph.find('a')
-                           if link: glyph_data['0']["Minor Glyphs"].append(link.text.strip())
+                           link = glyph.select_one('a')
+                           if link: glyph_data['0']["Minor Glyphs"].append(link.text().strip())
                  return glyph_data # Return whatever was found in fallback
 
 
             for section in glyph_sections:
-                spec_id = section.get('data-glyphs') # Should be '0' or '1'
+                spec_id = section.attr('data-glyphs') # Should be '0' or '1'
                 if spec_id not in ['0', '1']:
                     logger.warning(f"Unexpected data-glyphs ID found: {spec_id}")
                     continue
 
                 glyph_data[spec_id] = {"Major Glyphs": [], "Minor Glyphs": []}
 
-                major_glyphs = section.find_all('div', class_='glyph major')
+                major_glyphs = section.select('div.glyph.major')
                 for glyph in major_glyphs:
-                    link = glyph.find('a')
+                    link = glyph.select_one('a')
                     if link:
-                        glyph_name = link.text.strip()
+                        glyph_name = link.text().strip()
                         glyph_data[spec_id]["Major Glyphs"].append(glyph_name)
 
-                minor_glyphs = section.find_all('div', class_='glyph minor')
+                minor_glyphs = section.select('div.glyph.minor')
                 for glyph in minor_glyphs:
-                    link = glyph.find('a')
+                    link = glyph.select_one('a')
                     if link:
-                        glyph_name = link.text.strip()
+                        glyph_name = link.text().strip()
                         glyph_data[spec_id]["Minor Glyphs"].append(glyph_name)
 
         except Exception as e:
@@ -282,201 +391,30 @@ class WarmaneParser:
             # Return potentially partial data
         return glyph_data
 
-    @staticmethod
-    def calculate_gear_score(items: Dict[int, List[Item]]) -> float:
-        """Calculates GearScore from a dictionary of Item objects."""
-        gearscore = 0.0
-        two_handed_scores = []
-        main_hand_score = 0.0
-        off_hand_score = 0.0
-
-        processed_slots = set()
-
-        for item_list in items.values():
-            # Handle multiple items (rings/trinkets) - use the highest GS for that slot type
-            # Group by item type first
-            items_by_type: Dict[Optional[ItemTypes], List[Item]] = {}
-            for item in item_list:
-                if item.item_type not in items_by_type:
-                    items_by_type[item.item_type] = []
-                items_by_type[item.item_type].append(item)
-
-            for item_type, items_in_slot in items_by_type.items():
-                if not item_type or item_type in processed_slots:
-                    continue # Skip unknown types or already processed slots
-
-                # Find the best item for this slot type
-                best_item = max(items_in_slot, key=lambda i: i.gear_score, default=None)
-                if not best_item:
-                    continue
-
-                # Skip non-contributing slots
-                if item_type in {ItemTypes.SHIRT, ItemTypes.TABARD}:
-                    continue
-
-                # Handle weapon logic carefully
-                if item_type == ItemTypes.WEAPON_2H:
-                    # Average GS for 2H (treat as MH+OH)
-                    two_handed_scores.append(best_item.gear_score)
-                elif item_type == ItemTypes.WEAPON_1H:
-                    # Take the highest 1H as main hand for now
-                    main_hand_score = max(main_hand_score, best_item.gear_score)
-                elif item_type in {ItemTypes.SHIELD, ItemTypes.OFF_HAND}:
-                    off_hand_score = max(off_hand_score, best_item.gear_score)
-                else:
-                    # Add GS for other slots
-                    gearscore += best_item.gear_score
-
-                # Mark slot type as processed (handles rings/trinkets correctly)
-                processed_slots.add(item_type)
-
-
-        # Final weapon GS calculation
-        if two_handed_scores:
-            # If any 2H equipped, average its GS for MH/OH contribution
-            avg_2h_gs = sum(two_handed_scores) / len(two_handed_scores)
-            gearscore += avg_2h_gs # Add average 2H score (counts as MH+OH)
-        else:
-            # If only 1H/OH, add their scores
-            gearscore += main_hand_score + off_hand_score
-
-        return round(gearscore, 2)
-
-
-    @staticmethod
-    def calculate_avg_ilvl(items: Dict[int, List[Item]]) -> float:
-        """Calculates Average Item Level."""
-        ilvl_total = 0
-        count = 0
-        processed_slots = set()
-
-        for item_list in items.values():
-            items_by_type: Dict[Optional[ItemTypes], List[Item]] = {}
-            for item in item_list:
-                if item.item_type not in items_by_type:
-                    items_by_type[item.item_type] = []
-                items_by_type[item.item_type].append(item)
-
-            for item_type, items_in_slot in items_by_type.items():
-                if not item_type or item_type in processed_slots:
-                    continue
-
-                best_item = max(items_in_slot, key=lambda i: i.item_level, default=None)
-                if not best_item:
-                    continue
-
-                if item_type in {ItemTypes.SHIRT, ItemTypes.TABARD}:
-                    continue
-
-                # Special handling for 2H vs 1H/OH might be needed depending on exact avg ilvl definition
-                # Standard definition usually counts 2H as one slot, 1H+OH as two.
-                # Let's count equipped slots.
-                ilvl_total += best_item.item_level
-                count += 1
-                processed_slots.add(item_type)
-
-                # If it's a 1H, and there's also an OH/Shield equipped, count increases by 1 implicitly later.
-                # If it's a 2H, count increases by 1.
-
-        return round(ilvl_total / count, 2) if count else 0.0
-
-    @staticmethod
-    def check_enchants(
-        items: Dict[int, List[Item]], char_class: Optional[str], professions: List[str]
-    ) -> str:
-        """Checks for missing enchants on relevant gear pieces."""
-        not_enchanted: List[ItemTypes] = []
-        if not char_class: char_class = "" # Default if class not found
-
-        processed_slots = set()
-
-        for item_list in items.values():
-            items_by_type: Dict[Optional[ItemTypes], List[Item]] = {}
-            for item in item_list:
-                if item.item_type not in items_by_type:
-                    items_by_type[item.item_type] = []
-                items_by_type[item.item_type].append(item)
-
-            for item_type, items_in_slot in items_by_type.items():
-                 if not item_type or item_type in processed_slots:
-                     continue
-
-                 # Check the highest ilvl item for the slot
-                 best_item = max(items_in_slot, key=lambda i: i.item_level, default=None)
-                 if not best_item:
-                     continue
-
-                 # Check if this slot *should* be enchanted
-                 if best_item.has_enchant_slot(char_class, professions):
-                     # Check if it *is* enchanted
-                     if best_item.enchant_id is None:
-                         not_enchanted.append(item_type)
-
-                 processed_slots.add(item_type)
-
-
-        return missing_enchant_message(not_enchanted)
-
-    @staticmethod
-    def check_gems(items: Dict[int, List[Item]]) -> str:
-        """Checks for missing gems in socketed gear pieces."""
-        missing_gems_slots: List[ItemTypes] = []
-
-        processed_slots = set()
-
-        for item_list in items.values():
-            items_by_type: Dict[Optional[ItemTypes], List[Item]] = {}
-            for item in item_list:
-                if item.item_type not in items_by_type:
-                    items_by_type[item.item_type] = []
-                items_by_type[item.item_type].append(item)
-
-            for item_type, items_in_slot in items_by_type.items():
-                 if not item_type or item_type in processed_slots:
-                     continue
-
-                 best_item = max(items_in_slot, key=lambda i: i.item_level, default=None)
-                 if not best_item:
-                     continue
-
-                 # Check if the item has gem slots and if they are filled
-                 if best_item.gems_missing():
-                     missing_gems_slots.append(item_type)
-
-                 processed_slots.add(item_type)
-
-        return missing_gems_message(missing_gems_slots)
-
-    @staticmethod
-    def extract_talent_points_string(html: str, class_name: Optional[str]) -> Dict[str, str]:
-        """
-        Extracts the talent points string (e.g., "0500...") for each spec.
-        Returns a dictionary mapping spec_id ('0', '1') to the talent string.
-        """
-        if not html or not class_name: return {}
+    def _dom_talent_strings(self) -> Dict[str, str]:
+        """Collects the talent point strings per spec from the DOM (used when the raw scanner finds nothing)."""
         talent_strings = {}
         try:
-            soup = BeautifulSoup(html, "html.parser")
             # Find talent containers, often marked by class and maybe data-id
             # Adjust selector based on actual Warmane HTML structure
-            containers = soup.find_all("div", class_=lambda x: x and 'talents-container' in x) # Flexible class match
+            containers = self.doc.select('div[class*="talents-container"]') # Flexible class match
 
             if not containers:
                  logger.warning("Could not find talent containers.")
                  return {}
 
             for i, container in enumerate(containers):
-                spec_id = container.get('data-id', str(i)) # Get spec ID or use index
+                spec_id = container.attr('data-id', str(i)) # Get spec ID or use index
 
                 # Find individual talent point divs within this container
-                talent_divs = container.find_all("div", class_="talent-points") # Adjust if needed
+                talent_divs = container.select('div.talent-points') # Adjust if needed
                 if not talent_divs:
                      # Try another common pattern
-                     talent_divs = container.find_all("span", class_="points") # e.g., <span class="points">5/5</span>
+                     talent_divs = container.select('span.points') # e.g., <span class="points">5/5</span>
 
                 talent_numbers = []
                 for div in talent_divs:
-                    text = div.get_text(strip=True)  # e.g., "0/5" or "5/5"
+                    text = div.text(strip=True)  # e.g., "0/5" or "5/5"
                     try:
                         allocated = text.split("/")[0]
                         talent_numbers.append(allocated)
@@ -493,6 +431,19 @@ class WarmaneParser:
         except Exception as e:
             logger.exception(f"Error parsing talent points string: {e}")
 
+        return talent_strings
+
+    def talent_points_string(self, class_name: Optional[str]) -> Dict[str, str]:
+        """
+        Extracts the talent points string (e.g., "0500...") for each spec.
+        Returns a dictionary mapping spec_id ('0', '1') to the talent string.
+        """
+        if not self.html or not class_name: return {}
+        talent_strings = scan_talent_strings(self.html)
+        if talent_strings is None:
+            # Scanner didn't recognise the markup, fall back to the DOM
+            talent_strings = self._dom_talent_strings()
+
         # Basic validation: Check length based on class (approximate)
         # This is highly approximate and needs adjustment per class
         expected_lengths = {
@@ -510,3 +461,71 @@ class WarmaneParser:
 
         return final_talent_strings
 
+
+class WarmaneParser:
+    # The extract_* helpers below parse the HTML on every call.
+    # When several values are needed from one page, build a ParsedProfile/ParsedTalents instead.
+
+    @staticmethod
+    def check_character_exists(html: str) -> bool:
+        """Checks if the HTML indicates a 'character not found' error."""
+        return ParsedProfile(html).exists()
+
+    @staticmethod
+    def extract_equipped_items_data(html: str) -> Tuple[Dict[int, List[Dict]], Set[int]]:
+        """Extracts equipped item IDs, enchants, and gems. See ParsedProfile.equipped_items_data."""
+        return ParsedProfile(html).equipped_items_data()
+
+    @staticmethod
+    def extract_guild(html: str) -> Optional[str]:
+        """Extracts the guild name."""
+        return ParsedProfile(html).guild()
+
+    @staticmethod
+    def extract_professions(html: str) -> List[str]:
+        """Extracts professions and their levels."""
+        return ParsedProfile(html).professions()
+
+    @staticmethod
+    def extract_specializations(html: str) -> Tuple[List[str], Optional[str]]:
+        """Extracts specializations, points, and determines active spec."""
+        return ParsedProfile(html).specializations()
+
+    @staticmethod
+    def extract_level_race_class(html: str) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+        """Extracts Level, Race, and Class."""
+        return ParsedProfile(html).level_race_class()
+
+    @staticmethod
+    def extract_glyphs(html: str) -> Dict[str, Dict[str, List[str]]]:
+        """Extracts Major and Minor glyphs for each spec (0 and 1)."""
+        return ParsedTalents(html).glyphs()
+
+    # The gear calculations all come from one GearSummary pass (normally computed once and kept
+    # on the Character); these wrappers remain for callers that only have the items.
+    @staticmethod
+    def calculate_gear_score(items: Dict[int, List[Item]]) -> float:
+        """Calculates GearScore from a dictionary of Item objects."""
+        return GearSummary.from_items(items, None, []).gear_score
+
+    @staticmethod
+    def calculate_avg_ilvl(items: Dict[int, List[Item]]) -> float:
+        """Calculates Average Item Level."""
+        return GearSummary.from_items(items, None, []).avg_item_level
+
+    @staticmethod
+    def check_enchants(
+        items: Dict[int, List[Item]], char_class: Optional[str], professions: List[str]
+    ) -> str:
+        """Checks for missing enchants on relevant gear pieces."""
+        return GearSummary.from_items(items, char_class, professions).enchant_status()
+
+    @staticmethod
+    def check_gems(items: Dict[int, List[Item]]) -> str:
+        """Checks for missing gems in socketed gear pieces."""
+        return GearSummary.from_items(items, None, []).gem_status()
+
+    @staticmethod
+    def extract_talent_points_string(html: str, class_name: Optional[str]) -> Dict[str, str]:
+        """Extracts the talent points string for each spec. See ParsedTalents.talent_points_string."""
+        return ParsedTalents(html).talent_points_string(class_name)
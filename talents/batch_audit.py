@@ -0,0 +1,76 @@
+# talents/batch_audit.py
+import logging
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from talents.talent_utils import CompiledTemplate, TalentFailure, UNREADABLE, talent_points
+
+logger = logging.getLogger(__name__)
+
+_numpy = None # numpy module once imported, False if it isn't installed
+
+def _get_numpy():
+    """Imports numpy on the first batch audit instead of at startup (it's a slow import)."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError: # Optional, audits fall back to checking players one by one
+            _numpy = False
+    return _numpy or None
+
+class AuditResult(NamedTuple):
+    """Talent audit outcome for one player."""
+    name: str
+    spec: str
+    supported: bool # False if there's no template for the detected spec
+    failures: List[TalentFailure]
+
+    @property
+    def passed(self) -> bool:
+        return self.supported and not self.failures
+
+def _failed_rows_numpy(template: CompiledTemplate, points_list: List[bytes]) -> List[List[int]]:
+    """Failed template rows per player, with every rule evaluated as one matrix comparison."""
+    np = _get_numpy()
+    width = template.length
+    # One row of points per player, cut/padded to the template's width (missing talents fail)
+    buffer = b"".join(points[:width].ljust(width, bytes([UNREADABLE])) for points in points_list)
+    matrix = np.frombuffer(buffer, dtype=np.uint8).reshape(len(points_list), width)
+    values = matrix[:, np.frombuffer(template.indices, dtype=np.uint16)] # players x rules
+    met = (values >= np.frombuffer(template.lows, dtype=np.int8)) & (values <= np.frombuffer(template.highs, dtype=np.int8))
+    failed = met != np.frombuffer(bytes(template.required), dtype=np.bool_)
+    return [np.flatnonzero(row).tolist() for row in failed]
+
+def audit_talents(
+    players: Sequence[Tuple[str, str]], # (player name, talent string), all of the same class
+    templates: Dict[str, CompiledTemplate],
+    detect_spec: Callable[[str], str],
+) -> List[AuditResult]:
+    """
+    Checks a whole roster of one class at once. Players are grouped by detected spec and each
+    group is checked against its template in one vectorized pass (NumPy), or one by one without it.
+    Results come back in the order of `players`.
+    """
+    results: List[Optional[AuditResult]] = [None] * len(players)
+    groups: Dict[str, List[int]] = {}
+    for pos, (name, talent_string) in enumerate(players):
+        spec = detect_spec(talent_string)
+        if spec in templates:
+            groups.setdefault(spec, []).append(pos)
+        else:
+            results[pos] = AuditResult(name, spec, False, [])
+
+    for spec, positions in groups.items():
+        template = templates[spec]
+        points_list = [talent_points(players[pos][1]) for pos in positions]
+        if len(positions) > 1 and len(template) and _get_numpy() is not None:
+            rows = _failed_rows_numpy(template, points_list)
+            width = template.length
+            for pos, points, failed in zip(positions, points_list, rows):
+                points = points[:width].ljust(width, bytes([UNREADABLE]))
+                failures = [template.failure(row, points[template.indices[row]]) for row in failed]
+                results[pos] = AuditResult(players[pos][0], spec, True, failures)
+        else:
+            for pos, points in zip(positions, points_list):
+                results[pos] = AuditResult(players[pos][0], spec, True, template.check(points))
+    return results
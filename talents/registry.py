@@ -0,0 +1,201 @@
+# talents/registry.py
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+import discord
+import config # Import your config
+from utils.constants import OK, ERROR, WARNING
+from talents.talent_utils import (
+    CompiledTemplate, TALENT_MODES, MAX_POINTS, mode_range, talent_points, talent_check_embed,
+)
+
+logger = logging.getLogger(__name__)
+
+# Talent templates, tree layouts and spec detection rules for every supported class (Death Knight and
+# Paladin so far) live in this file. Adding a class or tuning a template is a data change: edit the
+# JSON and run `.bot reloadtalents` (or restart).
+# Still missing: Druid, Hunter, Mage, Priest, Rogue, Shaman, Warlock and Warrior. Each needs a tree layout
+# checked against the 3.3.5 talent data plus its templates; until then they show as unsupported.
+DEFAULT_DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "talents.json")
+
+_LEVEL_MARKERS = {"error": ERROR, "warning": WARNING, "ok": OK}
+
+class TalentDataError(ValueError):
+    """The talent data file is malformed. Lists every problem found."""
+
+class ClassTalents:
+    """One class's compiled talent data: tree layout, spec detection and check templates."""
+
+    def __init__(
+        self,
+        name: str,
+        trees: List[Tuple[str, int]],
+        templates: Dict[str, CompiledTemplate],
+        spec_rules: List[Tuple[str, int, int, int]], # (spec, talent index, low, high), checked in order
+        min_length: int,
+        tree_fallback: bool,
+    ):
+        self.name = name
+        self.trees = trees
+        self.templates = templates
+        self.spec_rules = spec_rules
+        self.min_length = min_length
+        self.tree_fallback = tree_fallback
+        self.talent_count = sum(size for _, size in trees)
+
+    def detect_spec(self, talent_string: str) -> str:
+        """Detects the likely spec from key talents, or (if enabled) the tree with the most points."""
+        if not talent_string or len(talent_string) < self.min_length:
+            return "Unknown" # Not enough points allocated or invalid string
+        points = talent_points(talent_string)
+        for spec, index, low, high in self.spec_rules:
+            if index < len(points) and low <= points[index] <= high:
+                return spec
+
+        if self.tree_fallback:
+            best_tree, best_points, start = None, 0, 0
+            for tree_name, size in self.trees:
+                spent = sum(p for p in points[start:start + size] if p <= MAX_POINTS)
+                if spent > best_points:
+                    best_tree, best_points = tree_name, spent
+                start += size
+            if best_tree:
+                return best_tree
+        return "Unknown" # Cannot determine spec
+
+    def check_talents(self, talent_string: str, character_name: str, realm_name: str) -> discord.Embed:
+        """Checks talents against the template for the detected spec."""
+        detected_spec = self.detect_spec(talent_string)
+        template = self.templates.get(detected_spec)
+        failures = template.check(talent_points(talent_string)) if template else None
+        return talent_check_embed(character_name, realm_name, detected_spec, failures)
+
+    def __repr__(self):
+        return f"<ClassTalents {self.name} trees={self.trees} templates={list(self.templates)}>"
+
+
+def _compile_class(name: str, data: dict, errors: List[str]) -> Optional[ClassTalents]:
+    """Validates and compiles one class entry. Problems are appended to `errors`."""
+    where = f"classes.{name}"
+    try:
+        trees = [(tree["name"], int(tree["size"])) for tree in data["trees"]]
+    except (KeyError, TypeError, ValueError) as e:
+        errors.append(f"{where}.trees: {e!r}")
+        return None
+    talent_count = sum(size for _, size in trees)
+    talents: Dict[str, int] = data.get("talents", {})
+    for talent, index in talents.items():
+        if not isinstance(index, int) or not 0 <= index < talent_count:
+            errors.append(f"{where}.talents.{talent}: index {index!r} outside the {talent_count} talents of the trees")
+
+    def resolve(row: dict, row_where: str) -> Optional[Tuple[int, int, int]]:
+        """(index, low, high) for a row's talent/points/mode, or None if invalid."""
+        talent, points, mode = row.get("talent"), row.get("points"), row.get("mode", "exact")
+        ok = True
+        if talent not in talents:
+            errors.append(f"{row_where}: unknown talent {talent!r}")
+            ok = False
+        if not isinstance(points, int) or not 0 <= points <= MAX_POINTS:
+            errors.append(f"{row_where}: points must be 0-{MAX_POINTS}, got {points!r}")
+            ok = False
+        if mode not in TALENT_MODES:
+            errors.append(f"{row_where}: unknown mode {mode!r} (expected one of {', '.join(TALENT_MODES)})")
+            ok = False
+        if not ok:
+            return None
+        low, high = mode_range(mode, points)
+        return talents[talent], low, high
+
+    detection = data.get("spec_detection", {})
+    spec_rules = []
+    for i, rule in enumerate(detection.get("rules", [])):
+        resolved = resolve(rule, f"{where}.spec_detection.rules[{i}]")
+        if resolved:
+            spec_rules.append((rule.get("spec", "Unknown"), *resolved))
+
+    templates = {}
+    for spec, rows in data.get("templates", {}).items():
+        checks = []
+        for i, row in enumerate(rows):
+            row_where = f"{where}.templates.{spec}[{i}]"
+            level = row.get("level", "error")
+            if level not in _LEVEL_MARKERS:
+                errors.append(f"{row_where}: unknown level {level!r}")
+                continue
+            if resolve(row, row_where) is None:
+                continue
+            message = f"{_LEVEL_MARKERS[level]} {row.get('label', row['talent'])}"
+            checks.append([
+                row.get("required", True), talents[row["talent"]], message,
+                row["points"], row.get("mode", "exact"), row.get("why", ""),
+            ])
+        templates[spec] = CompiledTemplate(spec, checks)
+
+    return ClassTalents(
+        name=name,
+        trees=trees,
+        templates=templates,
+        spec_rules=spec_rules,
+        min_length=int(detection.get("min_length", 0)),
+        tree_fallback=bool(detection.get("tree_fallback", False)),
+    )
+
+
+class TalentRegistry:
+    """
+    Class name -> ClassTalents, loaded from the data file on first use (not at import/startup).
+    Lookups are a single dict get; class names and aliases are matched case-insensitively.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or getattr(config, "TALENT_DATA_FILE", "") or DEFAULT_DATA_FILE
+        self._classes: Optional[Dict[str, ClassTalents]] = None
+        self._lookup: Dict[str, ClassTalents] = {}
+
+    def load(self) -> int:
+        """(Re)loads, validates and compiles the data file. Raises TalentDataError on any problem."""
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        errors: List[str] = []
+        classes: Dict[str, ClassTalents] = {}
+        lookup: Dict[str, ClassTalents] = {}
+        for name, class_data in data.get("classes", {}).items():
+            compiled = _compile_class(name, class_data, errors)
+            if compiled is None:
+                continue
+            classes[name] = compiled
+            for key in (name, *class_data.get("aliases", [])):
+                if key.lower() in lookup:
+                    errors.append(f"classes.{name}: name/alias {key!r} is already used by {lookup[key.lower()].name}")
+                lookup[key.lower()] = compiled
+        if errors:
+            raise TalentDataError(f"{self.path} has {len(errors)} problem(s):\n" + "\n".join(errors))
+
+        self._classes, self._lookup = classes, lookup # Swap in only once everything compiled
+        templates = sum(len(c.templates) for c in classes.values())
+        logger.info(f"Loaded talent data for {len(classes)} classes ({templates} templates) from {self.path}.")
+        return len(classes)
+
+    def _ensure_loaded(self):
+        if self._classes is None:
+            self.load()
+
+    def get(self, class_name: Optional[str]) -> Optional[ClassTalents]:
+        """Returns the talent data for a class (name or alias), or None if unknown."""
+        if not class_name:
+            return None
+        self._ensure_loaded()
+        return self._lookup.get(class_name.strip().lower())
+
+    def classes(self) -> Dict[str, ClassTalents]:
+        self._ensure_loaded()
+        return dict(self._classes)
+
+
+# Shared registry used by the cogs
+registry = TalentRegistry()
+
+def get_class_talents(class_name: Optional[str]) -> Optional[ClassTalents]:
+    return registry.get(class_name)
@@ -1,7 +1,10 @@
 # talents/talent_utils.py
 import logging
-from typing import Union
+from array import array
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
 from enum import Enum
+import discord
+from utils.constants import OK, ERROR, WARNING, EMBED_COLOR_INFO
 
 logger = logging.getLogger(__name__)
 
@@ -52,3 +55,118 @@ def has_talent(
         logger.warning(f"Unknown mode '{mode}' in has_talent check.")
         return False
 
+
+
+# --- Compiled templates ---
+# A template row is [required_bool, TalentEnum, check string, expected points, mode, justification].
+# Each row's mode + expected points is turned into an inclusive [low, high] range once at import,
+# and a talent string is turned into bytes of points once per check, so checking a whole
+# template is one loop of integer comparisons (no per-check validation, int() or mode dispatch).
+TALENT_MODES = ("at_least", "at_most", "exact", "less_than")
+MAX_POINTS = 9 # Talent points are single digits in the string
+UNREADABLE = 255 # Point value for anything that isn't a digit (fails every range)
+
+# '0'..'9' -> 0..9, every other byte -> UNREADABLE
+_POINTS_TABLE = bytes(ord(c) - 48 if "0" <= c <= "9" else UNREADABLE for c in map(chr, range(256)))
+
+def talent_points(talent_string: str) -> bytes:
+    """Converts a talent string ("5030...") into one byte of points per talent."""
+    return talent_string.encode("latin-1", "replace").translate(_POINTS_TABLE)
+
+def mode_range(mode: str, expected_amount: int) -> Tuple[int, int]:
+    if mode == "exact":
+        return expected_amount, expected_amount
+    if mode == "at_most":
+        return 0, expected_amount
+    if mode == "less_than":
+        return 0, expected_amount - 1
+    if mode == "at_least":
+        return expected_amount, MAX_POINTS
+    raise ValueError(f"Unknown talent check mode '{mode}'.")
+
+class TalentFailure(NamedTuple):
+    """One template row the talent string didn't satisfy."""
+    message: str # Pre-formatted check string (with OK/WARNING/ERROR marker)
+    justification: str
+    index: int
+    actual: Optional[int] # None if the string has no readable value at that index
+    expected: int
+    mode: str
+    required: bool
+
+class CompiledTemplate:
+    """A talent template compiled into parallel index/range arrays."""
+
+    __slots__ = ("name", "rows", "indices", "lows", "highs", "required", "length")
+
+    def __init__(self, name: str, checks: Sequence[Sequence]):
+        self.name = name
+        self.rows = [] # (message, justification, expected, mode), for building failures
+        self.indices = array('H')
+        self.lows = array('b')
+        self.highs = array('b')
+        self.required = bytearray()
+        for required, talent, message, expected, mode, justification in checks:
+            index = talent.value if hasattr(talent, 'value') else int(talent)
+            low, high = mode_range(mode, expected)
+            self.indices.append(index)
+            self.lows.append(low)
+            self.highs.append(high)
+            self.required.append(bool(required))
+            self.rows.append((message, justification, expected, mode))
+        self.length = max(self.indices) + 1 if self.indices else 0 # Points needed to index every check
+
+    def __len__(self):
+        return len(self.indices)
+
+    def check(self, points: bytes) -> List[TalentFailure]:
+        """Checks talent points (see talent_points) against every row, returns the failed rows."""
+        if len(points) < self.length:
+            points += bytes([UNREADABLE]) * (self.length - len(points)) # Missing talents fail their check
+        failures = []
+        for i, (index, low, high, required) in enumerate(zip(self.indices, self.lows, self.highs, self.required)):
+            value = points[index]
+            if (low <= value <= high) != required:
+                failures.append(self.failure(i, value))
+        return failures
+
+    def failure(self, row: int, value: int) -> TalentFailure:
+        """Builds the TalentFailure for template row `row` given the points found there."""
+        message, justification, expected, mode = self.rows[row]
+        return TalentFailure(
+            message, justification, self.indices[row],
+            value if value != UNREADABLE else None, expected, mode, bool(self.required[row]),
+        )
+
+def talent_check_embed(
+    character_name: str, realm_name: str, detected_spec: str, failures: Optional[List[TalentFailure]]
+) -> discord.Embed:
+    """Renders a talent check result. failures=None means no template for the detected spec."""
+    embed = discord.Embed(
+        title=f"Talent Check: {character_name.capitalize()} ({detected_spec})",
+        color=EMBED_COLOR_INFO,
+    )
+    embed.set_footer(text=f"Realm: {realm_name.capitalize()}")
+
+    if failures is None:
+        embed.description = f"Could not determine specialization or spec '{detected_spec}' is not supported for checks yet."
+        embed.color = discord.Color.orange()
+        return embed
+
+    if not failures:
+        embed.add_field(
+            name=f"Looks good! {OK}",
+            value="No major issues detected based on the template.",
+            inline=False,
+        )
+        return embed
+
+    for failure in failures:
+        # Add field with the pre-formatted error/warning string and justification
+        embed.add_field(name=failure.message, value=failure.justification, inline=False)
+    embed.description = f"Found {len(failures)} potential issue(s) with the '{detected_spec}' talents."
+    if any(ERROR in failure.message for failure in failures):
+        embed.color = discord.Color.red()
+    elif any(WARNING in failure.message for failure in failures):
+        embed.color = discord.Color.orange()
+    return embed
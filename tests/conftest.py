@@ -0,0 +1,15 @@
+# tests/conftest.py
+import os
+import sys
+
+# Run from anywhere: the bot's packages (services, models...) live in the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures", "armory")
+
+def read_fixture(name: str) -> str:
+    """A saved Armory page from tests/fixtures/armory."""
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,26 @@
+# tests/test_guild_roster.py
+"""guildscan: roster extraction from a saved guild page and argument splitting."""
+import pytest
+from conftest import read_fixture
+from services.warmane_parser import scan_guild_members
+from cogs.stalk_cog import _split_guild_args
+
+def test_roster_members():
+    members = scan_guild_members(read_fixture("guild_summary.html"))
+    assert len(members) == 12 # Guild master is linked twice, only summary links count
+    assert members[:3] == [("Arandil", "Icecrown"), ("Morvaine", "Icecrown"), ("Álfheim", "Icecrown")]
+    assert members[-1] == ("Jorunn", "Icecrown")
+
+def test_no_roster():
+    assert scan_guild_members(read_fixture("not_found.html")) == []
+
+@pytest.mark.parametrize("args, expected", [
+    (("Knights", "of", "Icecrown"), ("Knights of Icecrown", "Icecrown")),
+    (("Knights", "of", "Icecrown", "Lordaeron"), ("Knights of Icecrown Lordaeron", "Icecrown")),
+    (("Knights of Icecrown", "Lordaeron"), ("Knights of Icecrown", "Lordaeron")),
+    (("Knights", "of", "Icecrown-Lordaeron"), ("Knights of Icecrown", "Lordaeron")),
+    (("Vanguard", "Blackrock"), ("Vanguard", "Blackrock")),
+    (("Vanguard",), ("Vanguard", "Icecrown")),
+])
+def test_split_guild_args(args, expected):
+    assert _split_guild_args(args) == expected
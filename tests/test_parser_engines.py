@@ -0,0 +1,66 @@
+# tests/test_parser_engines.py
+"""Every installed HTML parser engine must extract the same data from the saved Armory pages."""
+import pytest
+from conftest import read_fixture
+from services.parser_engines import ENGINE_FACTORIES, get_engine
+from services.parsing_service import parse_profile_html, parse_talents_html
+from services import warmane_parser
+from services.warmane_parser import ParsedProfile, ParsedTalents
+
+INSTALLED = [name for name in ENGINE_FACTORIES if get_engine(name).name == name]
+
+SUMMARY_PAGES = ["paladin_summary.html", "deathknight_summary.html", "not_found.html"]
+TALENT_PAGES = [("paladin_talents.html", "Paladin"), ("deathknight_talents.html", "Knight")]
+
+def test_reference_engine_installed():
+    assert "html.parser" in INSTALLED
+
+@pytest.mark.parametrize("page", SUMMARY_PAGES)
+def test_profile_data_matches(page):
+    html = read_fixture(page)
+    reference = parse_profile_html(html, "html.parser")
+    for name in INSTALLED:
+        assert parse_profile_html(html, name) == reference, name
+
+@pytest.mark.parametrize("page", SUMMARY_PAGES[:2])
+def test_dom_item_fallback_matches(page, monkeypatch):
+    # Items normally come from the raw scanner whatever the engine; the DOM fallback must agree with it
+    html = read_fixture(page)
+    scanned = ParsedProfile(html).equipped_items_data()
+    monkeypatch.setattr(warmane_parser, "scan_equipped_items_data", lambda html: None)
+    for name in INSTALLED:
+        assert ParsedProfile(html, get_engine(name)).equipped_items_data() == scanned, name
+
+@pytest.mark.parametrize("page, class_name", TALENT_PAGES)
+def test_talent_data_matches(page, class_name):
+    html = read_fixture(page)
+    reference = parse_talents_html(html, class_name, "html.parser")
+    for name in INSTALLED:
+        assert parse_talents_html(html, class_name, name) == reference, name
+
+@pytest.mark.parametrize("page, class_name", TALENT_PAGES)
+def test_dom_talent_strings_match(page, class_name):
+    html = read_fixture(page)
+    reference = ParsedTalents(html, get_engine("html.parser"))._dom_talent_strings()
+    assert reference
+    for name in INSTALLED:
+        assert ParsedTalents(html, get_engine(name))._dom_talent_strings() == reference, name
+
+def test_profile_values():
+    paladin = parse_profile_html(read_fixture("paladin_summary.html"))
+    assert paladin.exists
+    assert (paladin.level, paladin.race, paladin.char_class) == (80, "Blood Elf", "Paladin")
+    assert paladin.guild == "Knights of Icecrown"
+    assert paladin.professions == ["Jewelcrafting (450)", "Enchanting (450)"]
+    assert paladin.specializations == ["Holy (51/20/0)", "Retribution (0/11/60)"]
+    assert paladin.active_spec_id == "0"
+    assert len(paladin.equipped_items[50400]) == 2 # Same ring twice
+    assert paladin.equipped_items[51277] == [{"enchant": "3820", "gems": ["41401", "40113"]}]
+
+    knight = parse_profile_html(read_fixture("deathknight_summary.html"))
+    assert knight.guild is None and knight.professions == []
+    assert knight.active_spec_id == "1"
+
+    missing = parse_profile_html(read_fixture("not_found.html"))
+    assert not missing.exists
+    assert missing.item_ids == set()
@@ -0,0 +1,27 @@
+# tests/test_talent_scanner.py
+"""The raw talent-point scanner must agree with the DOM path it replaces."""
+import pytest
+from conftest import read_fixture
+from services.parser_engines import get_engine
+from services.warmane_parser import ParsedTalents, scan_talent_strings
+
+TALENT_PAGES = [("paladin_talents.html", 78), ("deathknight_talents.html", 88)]
+
+@pytest.mark.parametrize("page, talent_count", TALENT_PAGES)
+def test_scanner_matches_dom(page, talent_count):
+    html = read_fixture(page)
+    scanned = scan_talent_strings(html)
+    assert scanned == ParsedTalents(html, get_engine("html.parser"))._dom_talent_strings()
+    assert set(scanned) == {"0", "1"}
+    assert all(len(points) == talent_count for points in scanned.values())
+
+def test_points_after_last_container_ignored():
+    # The saved pages end with a hidden tooltip template that also has a div.talent-points
+    html = read_fixture("paladin_talents.html")
+    assert html.rfind('class="talent-points"') > html.rfind('talents-container')
+    assert len(scan_talent_strings(html)["1"]) == 78
+
+def test_unclosed_container_falls_back():
+    html = read_fixture("paladin_talents.html")
+    truncated = html[:html.index('<div class="glyphs-wrapper">') - len("</div>\n</div>\n")]
+    assert scan_talent_strings(truncated) is None
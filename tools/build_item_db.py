@@ -0,0 +1,33 @@
+# tools/build_item_db.py
+"""
+Builds the SQLite item database (DATABASE_BACKEND = "sqlite") from items.sql.
+
+Usage:
+    python -m tools.build_item_db items.sql -o data/items.sqlite3
+
+The bot builds this file by itself on startup when it's missing or older than items.sql;
+this is for building it ahead of time (e.g. in a deploy step). The file is replaced atomically.
+"""
+import argparse
+import sys
+import time
+from services.database_service import ITEM_COLUMNS
+from services.sqlite_item_db import build_item_db
+from utils.items_sql import iter_items_sql
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("sql_file", help="items.sql or a mysqldump of the items table")
+    arg_parser.add_argument("-o", "--output", default="data/items.sqlite3", help="Output file (default: data/items.sqlite3)")
+    args = arg_parser.parse_args()
+
+    start = time.perf_counter()
+    count = build_item_db(iter_items_sql(args.sql_file, ITEM_COLUMNS), args.output)
+    if not count:
+        print(f"No item rows found in {args.sql_file}.", file=sys.stderr)
+        return 1
+    print(f"Wrote {count} items to {args.output} in {time.perf_counter() - start:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
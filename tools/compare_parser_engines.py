@@ -0,0 +1,69 @@
+# tools/compare_parser_engines.py
+"""
+Runs every HTML parser engine over recorded Armory pages and checks they agree.
+
+Usage:
+    python -m tools.compare_parser_engines --profile saved/summary.html --talents saved/talents.html [--class Paladin]
+
+Save pages with your browser ("Save page as... HTML only") or curl. Exits non-zero on any mismatch.
+The anonymised pages in tests/fixtures/armory are checked the same way by tests/test_parser_engines.py.
+"""
+import argparse
+import sys
+import time
+from services.parser_engines import ENGINE_FACTORIES, get_engine
+from services.warmane_parser import ParsedProfile, ParsedTalents
+
+def extract_all(engine_name: str, profile_html: str, talents_html: str, class_name: str) -> dict:
+    """Runs every extractor with one engine and returns the results keyed by extractor name."""
+    engine = get_engine(engine_name)
+    results = {}
+    if profile_html:
+        profile = ParsedProfile(profile_html, engine)
+        results["exists"] = profile.exists()
+        results["guild"] = profile.guild()
+        results["level_race_class"] = profile.level_race_class()
+        results["professions"] = profile.professions()
+        results["specializations"] = profile.specializations()
+        results["equipped_items_data"] = profile.equipped_items_data()
+    if talents_html:
+        talents = ParsedTalents(talents_html, engine)
+        results["glyphs"] = talents.glyphs()
+        results["talent_points_string"] = talents.talent_points_string(class_name)
+    return results
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--profile", nargs="*", default=[], help="Saved summary pages")
+    arg_parser.add_argument("--talents", nargs="*", default=[], help="Saved talents pages")
+    arg_parser.add_argument("--class", dest="class_name", default="Paladin", help="Class used for talent string validation")
+    args = arg_parser.parse_args()
+
+    pages = [(path, open(path, encoding="utf-8").read(), "") for path in args.profile]
+    pages += [(path, "", open(path, encoding="utf-8").read()) for path in args.talents]
+    if not pages:
+        arg_parser.error("Pass at least one --profile or --talents page.")
+
+    mismatches = 0
+    for path, profile_html, talents_html in pages:
+        reference = None
+        for engine_name in ENGINE_FACTORIES:
+            if get_engine(engine_name).name != engine_name:
+                print(f"{path}: engine '{engine_name}' not installed, skipped")
+                continue
+            start = time.perf_counter()
+            results = extract_all(engine_name, profile_html, talents_html, args.class_name)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if reference is None:
+                reference = results
+                print(f"{path}: {engine_name} {elapsed_ms:.1f} ms (reference)")
+                continue
+            diff = [key for key in reference if reference[key] != results.get(key)]
+            status = "OK" if not diff else f"MISMATCH in {', '.join(diff)}"
+            print(f"{path}: {engine_name} {elapsed_ms:.1f} ms {status}")
+            mismatches += len(diff)
+
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
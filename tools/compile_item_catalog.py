@@ -0,0 +1,52 @@
+# tools/compile_item_catalog.py
+"""
+Compiles the items table into a memory-mapped catalog file for MappedItemCatalog.
+
+Usage:
+    python -m tools.compile_item_catalog items.sql -o items.catalog     # from a .sql dump
+    python -m tools.compile_item_catalog --from-db -o items.catalog     # from the configured database (config.py)
+
+Point ITEM_CATALOG_FILE in config.py at the output. The file is replaced atomically,
+so it can be recompiled while bots are running; use '.bot reloaditems' to pick it up.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from services.database_service import ITEM_COLUMNS, create_database_service
+from services.item_catalog_file import write_catalog_file
+from utils.items_sql import iter_items_sql
+
+async def _fetch_db_rows():
+    db_service = create_database_service(asyncio.get_running_loop())
+    await db_service.connect()
+    try:
+        return await db_service.get_all_items()
+    finally:
+        await db_service.close()
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("sql_file", nargs="?", help="items.sql or a mysqldump of the items table")
+    arg_parser.add_argument("--from-db", action="store_true", help="Read the items table from the configured database instead")
+    arg_parser.add_argument("-o", "--output", default="items.catalog", help="Output file (default: items.catalog)")
+    args = arg_parser.parse_args()
+
+    if bool(args.sql_file) == args.from_db:
+        arg_parser.error("Pass either a .sql file or --from-db.")
+
+    start = time.perf_counter()
+    if args.from_db:
+        rows = asyncio.run(_fetch_db_rows())
+    else:
+        rows = list(iter_items_sql(args.sql_file, ITEM_COLUMNS))
+    if not rows:
+        print("No item rows found, nothing written.", file=sys.stderr)
+        return 1
+
+    count = write_catalog_file(rows, args.output)
+    print(f"Wrote {count} items to {args.output} in {time.perf_counter() - start:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# utils/circuit_breaker.py
+import logging
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker. After `failure_threshold` failures in a row the
+    circuit opens and calls are rejected for `reset_timeout` seconds; then it half-opens and
+    lets a single probe through. A success closes it again, a failure re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_started = 0.0
+        # Stats
+        self.times_opened = 0
+        self.rejected = 0
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit half-opens (0 if it isn't open)."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Returns True if a call may go ahead."""
+        now = time.monotonic()
+        if self.state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self._probe_started = 0.0
+            logger.info(f"Circuit '{self.name}' half-open, probing.")
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN:
+            # One probe at a time; a probe that never reported back frees the slot after reset_timeout
+            if not self._probe_started or now - self._probe_started >= self.reset_timeout:
+                self._probe_started = now
+                return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        if self.state != CLOSED:
+            logger.info(f"Circuit '{self.name}' closed again.")
+        self.state = CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+            self.state = OPEN
+            self._opened_at = time.monotonic()
+            self.times_opened += 1
+            logger.warning(f"Circuit '{self.name}' opened after {self.failures} failure(s), "
+                           f"rejecting calls for {self.reset_timeout}s.")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_in": round(self.retry_after(), 1),
+        }
@@ -13,4 +13,5 @@ EMBED_COLOR_SUCCESS = discord.Color.green()
 EMBED_COLOR_INFO = discord.Color.blue()
 EMBED_COLOR_WARNING = discord.Color.orange()
 
-WARMANE_ARMORY_URL = "http://armory.warmane.com/character"
\ No newline at end of file
+WARMANE_ARMORY_URL = "http://armory.warmane.com/character"
+WARMANE_GUILD_URL = "http://armory.warmane.com/guild"
\ No newline at end of file
@@ -20,6 +20,19 @@ def create_char_not_found_embed(character: str, realm: str):
     )
     return embed
 
+def create_armory_unavailable_embed(retry_after: float = 0.0):
+    """Creates an embed for when the Armory itself is failing (not the character)."""
+    embed = discord.Embed(
+        title="Armory Unavailable", color=EMBED_COLOR_ERROR
+    )
+    wait = f" in about {int(retry_after) + 1} seconds" if retry_after else " in a minute"
+    embed.add_field(
+        name="Warmane Armory is not responding",
+        value=f"This is not a problem with the character. Please try again{wait}.",
+        inline=False,
+    )
+    return embed
+
 def create_info_embed(title="Info", description=""):
     """Creates a standard info embed."""
     embed = discord.Embed(
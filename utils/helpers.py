@@ -85,3 +85,14 @@ def missing_enchant_message(not_enchanted: List[ItemTypes]) -> str:
 def missing_gems_message(missing_gems_slots: List[ItemTypes]) -> str:
     """Creates a message listing items with missing gems."""
     return _format_missing_list(missing_gems_slots, "gems")
+
+def format_age(seconds: float) -> str:
+    """Formats an age in seconds as a short string (e.g. '45s', '12m', '3h', '2d')."""
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    if seconds < 86400:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
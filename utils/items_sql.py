@@ -0,0 +1,81 @@
+# utils/items_sql.py
+import re
+from typing import Iterator, List, Optional, Tuple
+
+# Reads the items table straight out of items.sql (or a mysqldump of the items table)
+# without a MySQL server. Rows come back as tuples in ITEM_COLUMNS order.
+
+_STATEMENT_RE = re.compile(
+    r"(INSERT\s+INTO\s+`?items`?\s*\(([^)]*)\)\s*VALUES|UPDATE\s+`?items`?\s+SET)(.*?);\s*$",
+    re.IGNORECASE | re.DOTALL | re.MULTILINE,
+)
+_TUPLE_RE = re.compile(r"\(((?:'(?:[^'\\]|''|\\.)*'|[^()'])*)\)", re.DOTALL)
+_FIELD_RE = re.compile(r"'((?:[^'\\]|''|\\.)*)'|([^,\s]+)", re.DOTALL)
+_UPDATE_RE = re.compile(
+    r"^\s*`?(\w+)`?\s*=\s*(-?[\d.]+)\s+WHERE\s+`?(\w+)`?\s*=\s*(-?[\d.]+)\s*$", re.IGNORECASE | re.DOTALL
+)
+_ESCAPES = {"0": "\0", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+
+# Integer columns (everything except name). MySQL rounds decimals like 187.05 into SMALLINT.
+_TEXT_COLUMNS = {"name"}
+
+def _unquote(value: str) -> str:
+    """Undoes SQL string escaping ('' and backslash escapes)."""
+    value = value.replace("''", "'")
+    if "\\" in value:
+        value = re.sub(r"\\(.)", lambda m: _ESCAPES.get(m.group(1), m.group(1)), value)
+    return value
+
+def _to_int(value: str) -> Optional[int]:
+    if value.upper() == "NULL":
+        return None
+    number = float(value)
+    # Round half away from zero like MySQL does for exact values
+    return int(number + 0.5) if number >= 0 else -int(-number + 0.5)
+
+def _parse_fields(tuple_body: str) -> List[Tuple[Optional[str], bool]]:
+    """Splits one VALUES tuple into (value, was_quoted) pairs."""
+    fields = []
+    for match in _FIELD_RE.finditer(tuple_body):
+        if match.group(1) is not None:
+            fields.append((_unquote(match.group(1)), True))
+        else:
+            fields.append((match.group(2), False))
+    return fields
+
+def iter_items_sql(path: str, columns: Tuple[str, ...]) -> Iterator[Tuple]:
+    """
+    Yields every row of the items table from a .sql dump, as tuples ordered like `columns`.
+    Simple 'UPDATE items SET col = N WHERE col = M' statements (like the one at the end of items.sql)
+    are applied, so the rows match what MySQL would hold after importing the file.
+    """
+    with open(path, encoding="utf-8") as f:
+        sql = f.read()
+
+    rows: List[list] = []
+    for statement in _STATEMENT_RE.finditer(sql):
+        if statement.group(2) is not None: # INSERT
+            names = [c.strip().strip("`") for c in statement.group(2).split(",")]
+            positions = [names.index(c) for c in columns]
+            for values in _TUPLE_RE.finditer(statement.group(3)):
+                fields = _parse_fields(values.group(1))
+                row = []
+                for column, pos in zip(columns, positions):
+                    value, quoted = fields[pos]
+                    if column in _TEXT_COLUMNS:
+                        row.append(value if quoted or value.upper() != "NULL" else None)
+                    else:
+                        row.append(_to_int(value))
+                rows.append(row)
+        else: # UPDATE
+            update = _UPDATE_RE.match(statement.group(3))
+            if not update or update.group(1) not in columns or update.group(3) not in columns:
+                raise ValueError(f"Unsupported statement in {path}: UPDATE items SET{statement.group(3)[:80]}")
+            set_pos, new_value = columns.index(update.group(1)), _to_int(update.group(2))
+            where_pos, match_value = columns.index(update.group(3)), _to_int(update.group(4))
+            for row in rows:
+                if row[where_pos] == match_value:
+                    row[set_pos] = new_value
+
+    for row in rows:
+        yield tuple(row)
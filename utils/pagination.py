@@ -0,0 +1,142 @@
+# utils/pagination.py
+import asyncio
+import logging
+import time
+from typing import Callable, List, Optional
+import discord
+
+logger = logging.getLogger(__name__)
+
+class TablePages(discord.ui.View):
+    """
+    A long table split into pages behind ◀/▶ buttons, all in one message.
+    Only the page being shown is rendered, and `rows` may still be filled in while it's shown
+    (call schedule_refresh after each change, then finish once they're all in).
+    """
+
+    def __init__(
+        self,
+        rows: List[List[str]],
+        render: Callable[[List[List[str]]], str], # Rows of one page -> table text
+        page_size: int,
+        author_id: Optional[int] = None, # Only this user may turn pages (None: anyone)
+        max_len: int = 1990,
+        timeout: float = 600,
+    ):
+        super().__init__(timeout=timeout)
+        self.rows = rows
+        self.render = render
+        self.page_size = max(1, page_size)
+        self.author_id = author_id
+        self.max_len = max_len
+        self.page = 0
+        self.message: Optional[discord.Message] = None
+        self.live = True # False once Discord refused an edit, no more scheduled refreshes then
+        self._last_edit = 0.0 # time.monotonic() of the last send/edit
+        self._version = 0 # Bumped by schedule_refresh on every change of `rows`
+        self._shown_version = 0 # _version the message last showed
+        self._flusher: Optional[asyncio.Task] = None
+        self._update_buttons()
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.rows) // self.page_size))
+
+    def content(self) -> str:
+        """The current page as message content (a code block, plus the page number if there are several)."""
+        start = self.page * self.page_size
+        table = self.render(self.rows[start:start + self.page_size])
+        footer = f"\nPage {self.page + 1}/{self.page_count}" if self.page_count > 1 else ""
+        if len(table) + len(footer) + 8 > self.max_len:
+            # Drop whole lines rather than cutting one in half
+            lines = table.split("\n")
+            while lines and len("\n".join(lines)) + len(footer) + 30 > self.max_len:
+                lines.pop()
+            table = "\n".join(lines) + "\n(page truncated)"
+        return f"```\n{table}\n```{footer}"
+
+    def _update_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.page_count - 1
+
+    async def send(self, ctx) -> discord.Message:
+        """Sends the first page, with the buttons only if there's more than one page."""
+        view = self if self.page_count > 1 else None
+        self.message = await ctx.send(self.content(), view=view)
+        self._last_edit = time.monotonic()
+        if view is None:
+            self.stop()
+        return self.message
+
+    async def refresh(self) -> bool:
+        """Re-renders the shown page after `rows` changed. Returns False if Discord refused the edit."""
+        if not self.message:
+            return False
+        self._last_edit = time.monotonic()
+        version = self._version
+        try:
+            await self.message.edit(content=self.content())
+            self._shown_version = version
+            return True
+        except discord.HTTPException as e:
+            logger.warning(f"Could not update table message: {e}")
+            return False
+
+    def schedule_refresh(self, interval: float):
+        """
+        Notes that `rows` changed. The shown page is re-rendered at most once per `interval` seconds,
+        but always within `interval` of a change: a change that arrives too early is sent by a timer,
+        not held back until the next change comes in.
+        """
+        self._version += 1
+        if self.live and self._flusher is None:
+            self._flusher = asyncio.ensure_future(self._flush(interval))
+
+    async def _flush(self, interval: float):
+        try:
+            while self._shown_version != self._version and self.live:
+                await asyncio.sleep(max(0.0, self._last_edit + interval - time.monotonic()))
+                self.live = await self.refresh()
+        except Exception as e:
+            logger.exception(f"Error updating table message: {e}")
+            self.live = False
+        finally:
+            self._flusher = None
+
+    async def finish(self) -> bool:
+        """Drops any scheduled refresh and shows the final rows. Returns False if Discord refused the edit."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+        if self.live and self._shown_version == self._version:
+            return True # Already on screen
+        return await self.refresh()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if self.author_id is None or interaction.user.id == self.author_id:
+            return True
+        await interaction.response.send_message("Only the person who ran the command can turn pages.", ephemeral=True)
+        return False
+
+    async def _show(self, interaction: discord.Interaction, page: int):
+        self.page = min(max(page, 0), self.page_count - 1)
+        self._update_buttons()
+        await interaction.response.edit_message(content=self.content(), view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page - 1)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page + 1)
+
+    async def on_timeout(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+        # Leave the last page up, just without the buttons
+        if self.message:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException:
+                pass
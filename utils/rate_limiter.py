@@ -0,0 +1,106 @@
+# utils/rate_limiter.py
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket shared by every outbound request, with an AIMD rate: each healthy response
+    adds `increase` req/s (up to `max_rate`), a 429/503, a timeout or a response slower than
+    `slow_after` seconds multiplies the rate by `decrease` (down to `min_rate`).
+    Waiters are served in arrival order. Not thread-safe (meant for the event loop).
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float, increase: float = 0.1,
+                 decrease: float = 0.5, slow_after: Optional[float] = None, cooldown: float = 2.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.slow_after = slow_after
+        self.cooldown = cooldown # One slowdown per window, so a burst of 429s doesn't collapse the rate to the floor
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0 # Set from Retry-After
+        self._last_decrease = 0.0
+        self._lock = asyncio.Lock()
+        # Stats
+        self.waiting = 0
+        self.acquired = 0
+        self.delayed = 0 # Requests that had to wait for a token
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.slowdowns = 0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Waits until a request may be sent."""
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock: # FIFO: only the head of the queue is refilling/sleeping
+                while True:
+                    now = time.monotonic()
+                    if now < self._paused_until:
+                        await asyncio.sleep(self._paused_until - now)
+                        continue
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+        waited = time.monotonic() - started
+        self.acquired += 1
+        if waited > 0.001:
+            self.delayed += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def on_response(self, status: int, latency: float, retry_after: Optional[str] = None):
+        """Feeds a response back into the rate."""
+        if status in (429, 503):
+            self._slow_down(f"HTTP {status}")
+            if retry_after and retry_after.isdigit(): # HTTP-date form is ignored
+                self._paused_until = max(self._paused_until, time.monotonic() + min(int(retry_after), 60))
+        elif self.slow_after and latency > self.slow_after:
+            self._slow_down(f"slow response ({latency:.1f}s)")
+        else:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_timeout(self):
+        self._slow_down("timeout")
+
+    def _slow_down(self, reason: str):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        new_rate = max(self.min_rate, self.rate * self.decrease)
+        if new_rate < self.rate:
+            self.slowdowns += 1
+            logger.warning(f"Armory rate lowered from {self.rate:.2f} to {new_rate:.2f} req/s ({reason}).")
+        self.rate = new_rate
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill(time.monotonic())
+        return {
+            "rate": round(self.rate, 2),
+            "max_rate": self.max_rate,
+            "tokens": round(self._tokens, 2),
+            "queue_depth": self.waiting,
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "avg_wait_ms": round(self.total_wait / self.delayed * 1000, 1) if self.delayed else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+            "slowdowns": self.slowdowns,
+        }
@@ -0,0 +1,45 @@
+# utils/startup.py
+import logging
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+class StartupTimer:
+    """
+    Wall time per startup phase, logged as one breakdown at the end of setup_hook.
+    Phases can nest (e.g. "db connect" inside "load cogs.stalk_cog"); nested ones are indented.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, int, float]] = [] # (name, depth, seconds), in start order
+        self._depth = 0
+
+    def record(self, name: str, seconds: float):
+        self.phases.append((name, self._depth, seconds))
+
+    @contextmanager
+    def phase(self, name: str):
+        pos = len(self.phases)
+        self.phases.append((name, self._depth, 0.0)) # Placeholder keeps the start order for nesting
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases[pos] = (name, self._depth, time.perf_counter() - start)
+
+    def report(self) -> str:
+        width = max((len(name) + 2 * depth for name, depth, _ in self.phases), default=0)
+        lines = [f"{'  ' * depth}{name:<{width - 2 * depth}}  {seconds * 1000:8.1f} ms" for name, depth, seconds in self.phases]
+        lines.append(f"{'total':<{width}}  {(time.perf_counter() - self.started) * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+    def log_report(self):
+        logger.info("Startup timing:\n" + self.report())
+
+# Shared by bot.py and the cogs' setup functions
+startup_timer = StartupTimer()
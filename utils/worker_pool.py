@@ -0,0 +1,42 @@
+# utils/worker_pool.py
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Sequence, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+async def run_bounded(
+    items: Sequence[T],
+    func: Callable[[T], Awaitable[R]],
+    concurrency: int,
+) -> AsyncIterator[Tuple[int, Union[R, BaseException]]]:
+    """
+    Runs func(item) for every item with at most `concurrency` calls in flight, yielding
+    (index, result) as each one finishes. A call that raised yields its exception instead,
+    so one bad item doesn't stop the rest. Closing the iterator early cancels pending work.
+    """
+    pending: asyncio.Queue = asyncio.Queue()
+    for index in range(len(items)):
+        pending.put_nowait(index)
+    done: asyncio.Queue = asyncio.Queue()
+
+    async def worker():
+        while True:
+            try:
+                index = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                result = await func(items[index])
+            except Exception as e:
+                result = e
+            done.put_nowait((index, result))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(1, min(concurrency, len(items))))]
+    try:
+        for _ in range(len(items)):
+            yield await done.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)